@@ -1,13 +1,15 @@
 from typing import Optional
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.database import get_db
+from app.core.database import get_db, get_session_maker
 from app.core.config import settings
 from app.core.security import decode_token, get_password_hash
 from app.models.user import User
+from app.services.principal_cache import Principal, get_principal_cache
 from app.services.user_service import UserService
 
 security = HTTPBearer(auto_error=False)  # 개발 모드에서 인증 선택적으로 처리
@@ -27,7 +29,7 @@ async def get_or_create_dev_user(db: AsyncSession) -> User:
         user = User(
             email=DEV_USER_EMAIL,
             name=DEV_USER_NAME,
-            hashed_password=get_password_hash("devpassword123"),
+            hashed_password=await get_password_hash("devpassword123"),
             is_active=True,
         )
         db.add(user)
@@ -42,7 +44,28 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """현재 로그인한 사용자 조회"""
-    
+    return await _authenticate(credentials, db)
+
+
+async def get_streaming_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_session_maker),
+) -> User:
+    """현재 로그인한 사용자 조회 (SSE처럼 오래 열려 있는 응답용)
+
+    get_db 세션은 응답이 끝난 뒤에 정리되므로 스트림이 열려 있는 동안 연결이 트랜잭션
+    안에서 유휴 상태로 남는다. 대신 짧은 세션으로 조회하고 응답 전에 닫는다.
+    """
+    async with session_maker() as db:
+        user = await _authenticate(credentials, db)
+        await db.commit()
+    return user
+
+
+async def _authenticate(
+    credentials: Optional[HTTPAuthorizationCredentials], db: AsyncSession
+) -> User:
+    """토큰으로 사용자 확인 (개발 모드에서는 토큰이 없으면 개발용 사용자)"""
     # 개발 모드이고 토큰이 없으면 개발용 사용자 반환
     if settings.DEBUG and not credentials:
         return await get_or_create_dev_user(db)
@@ -55,39 +78,50 @@ async def get_current_user(
         )
     
     token = credentials.credentials
-
-    payload = decode_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 토큰입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="액세스 토큰이 아닙니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user_service = UserService(db)
-    user = await user_service.get_by_id(payload["sub"])
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="사용자를 찾을 수 없습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if not user.is_active:
+    cache = get_principal_cache()
+
+    # 검증해 둔 토큰이면 JWT 디코딩을 건너뛴다
+    user_id = cache.get_token(token)
+    if user_id is None:
+        payload = decode_token(token)
+        if not payload:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유효하지 않은 토큰입니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        if payload.get("type") != "access":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="액세스 토큰이 아닙니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        user_id = UUID(payload["sub"])
+        cache.set_token(token, user_id, payload["exp"])
+
+    principal = cache.get_user(user_id)
+    if principal is None:
+        generation = cache.generation
+        user = await UserService(db).get_by_id(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="사용자를 찾을 수 없습니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        principal = Principal.from_user(user)
+        cache.set_user(principal, generation)
+
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="비활성화된 계정입니다.",
         )
 
-    return user
+    # 캐시에서 읽었어도 같은 형태로 쓸 수 있도록 세션에 속하지 않은 User로 반환
+    return principal.to_user()
 
 
 async def get_current_superuser(
@@ -1,27 +1,170 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, List, Literal, Optional, Sequence, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Header,
+    Query,
+    Response,
+    UploadFile,
+    File,
+    Form,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.broker import get_broker
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_streaming_user
 from app.models.user import User
 from app.models.schedule import SchedulePriority
 from app.schemas.schedule import (
+    ImageUploadComplete,
+    ImageUploadRequest,
+    ImageUploadResponse,
+    ReminderResponse,
+    ScheduleBulkRequest,
     ScheduleCreate,
     ScheduleUpdate,
     ScheduleResponse,
+    ScheduleImportJobResponse,
+    ScheduleOccurrenceResponse,
+    ScheduleSummaryBucket,
     ScheduleListResponse,
 )
 from app.schemas.common import MessageResponse
-from app.services.schedule_service import ScheduleService
+from app.services.schedule_cache import ScheduleCache
+from app.services.schedule_change_service import ScheduleChangeService
+from app.services.schedule_import_service import (
+    ScheduleImportService,
+    run_import_job,
+    save_upload,
+)
+from app.services.schedule_service import SPARSE_FIELDS, DuplicateOperationError, ScheduleService
 from app.services.file_service import FileService
+from app.services.image_cleanup import delete_images_after_commit, get_image_cleanup_queue
+from app.utils.pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    decode_sync_token,
+    encode_cursor,
+    encode_search_cursor,
+    encode_sync_token,
+)
+from app.utils.ical import CALENDAR_FOOTER, CALENDAR_HEADER, format_event
+from app.utils.recurrence import to_naive_utc
+from app.utils.search import highlight, split_terms
 
 router = APIRouter()
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)
+
+    "*"는 표현이 존재할 때만 일치해야 하는데 조회 전에 비교하므로 지원하지 않는다
+    (없는 일정에 304를 반환하지 않도록).
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in tags or f"W/{etag}" in tags
+
+
+def _set_etag(response: Response, etag: str) -> None:
+    """ETag 및 재검증 캐시 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def _not_modified(etag: str) -> Response:
+    """304 Not Modified 응답"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    _set_etag(response, etag)
+    return response
+
+
+# 응답 필드 이름(camelCase 및 snake_case) -> 일정 컬럼 이름
+_SPARSE_FIELD_NAMES = {
+    **{name: name for name in SPARSE_FIELDS},
+    **{
+        ScheduleResponse.model_fields[name].serialization_alias: name
+        for name in SPARSE_FIELDS
+        if ScheduleResponse.model_fields[name].serialization_alias
+    },
+}
+
+
+def _parse_fieldset(
+    fields: Optional[str], include: Optional[str]
+) -> Tuple[Optional[List[str]], bool]:
+    """fields= / include= 파라미터 해석 (반환값: (컬럼 이름 목록, 알림 포함 여부))
+
+    둘 다 없으면 (None, True)로 전체 응답을 유지한다. include만 있으면 모든 컬럼을 선택한다.
+    """
+    if fields is None and include is None:
+        return None, True
+
+    includes = {name.strip() for name in (include or "").split(",") if name.strip()}
+    unknown = includes - {"reminders"}
+    names: List[str] = list(SPARSE_FIELDS)
+    if fields is not None:
+        names = []
+        for name in (name.strip() for name in fields.split(",")):
+            if not name or name == "id":
+                continue
+            if name == "reminders":
+                includes.add(name)
+            elif name in _SPARSE_FIELD_NAMES:
+                names.append(_SPARSE_FIELD_NAMES[name])
+            else:
+                unknown.add(name)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}",
+        )
+    return list(dict.fromkeys(names)), "reminders" in includes
+
+
+def _dump_sparse(row: Any, fields: Sequence[str], include_reminders: bool) -> dict:
+    """부분 조회 행을 요청한 필드만 가진 응답으로 변환 (키 이름은 전체 응답과 같다)"""
+    values = {name: getattr(row, name) for name in ("id", *fields)}
+    if include_reminders:
+        values["reminders"] = [ReminderResponse.model_validate(r) for r in row.reminders]
+    return ScheduleResponse.model_construct(**values).model_dump(
+        mode="json", by_alias=True, include=set(values)
+    )
+
+
+# 행 목록을 한 번에 검증하는 어댑터 (ORM 엔티티를 만들지 않고 Core 행에서 바로 응답 모델 생성)
+_schedule_list = TypeAdapter(List[ScheduleResponse])
+_occurrence_list = TypeAdapter(List[ScheduleOccurrenceResponse])
+
+
+def _schedule_items(rows: List[Any], fields: Optional[Sequence[str]], include_reminders: bool) -> list:
+    """조회 행을 응답 항목 목록으로 변환 (fields가 None이면 전체 응답 모델)"""
+    if fields is None:
+        return _schedule_list.validate_python(rows, from_attributes=True)
+    return [_dump_sparse(row, fields, include_reminders) for row in rows]
+
+
+def _json_bytes(content: Any) -> bytes:
+    """응답 본문을 pydantic-core로 한 번에 JSON 인코딩 (JSONResponse와 같은 바이트)"""
+    return to_json(content, by_alias=True)
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("")
 async def get_schedules(
     page: int = Query(1, ge=1),
@@ -30,12 +173,30 @@ async def get_schedules(
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     priority: Optional[List[SchedulePriority]] = Query(None),
     search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = Query(True, alias="includeTotal"),
+    estimate: bool = False,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict:
-    """일정 목록 조회"""
+) -> Response:
+    """일정 목록 조회 (cursor가 있으면 page 대신 키셋 페이지네이션)
+
+    estimate=true이면 결과가 큰 경우 플래너 추정 개수를 반환한다 (totalExact=false).
+    fields=title,startDate처럼 필드를 지정하면 해당 필드와 id만 반환하며,
+    알림은 include=reminders일 때만 포함한다.
+    """
+    selected, include_reminders = _parse_fieldset(fields, include)
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
     schedule_service = ScheduleService(db)
-    schedules, total = await schedule_service.get_list(
+    schedules, has_more = await schedule_service.get_list(
         user_id=current_user.id,
         page=page,
         page_size=page_size,
@@ -43,56 +204,357 @@ async def get_schedules(
         end_date=end_date,
         priority=priority,
         search=search,
+        after=after,
+        fields=SPARSE_FIELDS if selected is None else selected,
+        include_reminders=include_reminders,
     )
 
-    total_pages = (total + page_size - 1) // page_size
+    total, total_exact = None, False
+    if include_total:
+        total, total_exact = await schedule_service.count_list(
+            user_id=current_user.id,
+            start_date=start_date,
+            end_date=end_date,
+            priority=priority,
+            search=search,
+            estimate=estimate,
+        )
 
-    return {
-        "items": [ScheduleResponse.model_validate(s).model_dump(by_alias=True) for s in schedules],
-        "total": total,
-        "page": page,
-        "pageSize": page_size,
-        "totalPages": total_pages,
-    }
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
+    next_cursor = encode_cursor(schedules[-1].start_date, schedules[-1].id) if has_more else None
+
+    body = _json_bytes(
+        {
+            "items": _schedule_items(schedules, selected, include_reminders),
+            "total": total,
+            "totalExact": total_exact,
+            "page": page,
+            "pageSize": page_size,
+            "totalPages": total_pages,
+            "nextCursor": next_cursor,
+        }
+    )
+    return _json_response(body)
 
 
 @router.get("/range")
 async def get_schedules_by_range(
     start_date: datetime = Query(..., alias="startDate"),
     end_date: datetime = Query(..., alias="endDate"),
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """날짜 범위로 일정 조회 (반복 일정은 발생 단위로 함께 반환)
+
+    If-None-Match가 현재 ETag와 같으면 일정을 조회하지 않고 304를 반환한다.
+    fields / include는 일정 목록 조회와 같다.
+    """
+    selected, include_reminders = _parse_fieldset(fields, include)
+
+    async def load() -> bytes:
+        schedule_service = ScheduleService(db)
+        schedules, occurrences = await schedule_service.get_by_date_range(
+            user_id=current_user.id,
+            start_date=start_date,
+            end_date=end_date,
+            fields=SPARSE_FIELDS if selected is None else selected,
+            include_reminders=include_reminders,
+        )
+        return _json_bytes(
+            {
+                "data": _schedule_items(schedules, selected, include_reminders),
+                "occurrences": _occurrence_list.validate_python(occurrences, from_attributes=True),
+            }
+        )
+
+    window = f"{to_naive_utc(start_date).isoformat()}|{to_naive_utc(end_date).isoformat()}"
+    if selected is not None:
+        window += f"|{','.join(selected)}|{int(include_reminders)}"
+    cache = ScheduleCache()
+    version = await cache.change_version(db, current_user.id)
+    etag = cache.etag(current_user.id, version, "range", window)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    response = _json_response(
+        await cache.get_or_load_json(current_user.id, "range", window, load, version=version)
+    )
+    _set_etag(response, etag)
+    return response
+
+
+@router.get("/summary")
+async def get_schedule_summary(
+    response: Response,
+    start_date: datetime = Query(..., alias="startDate"),
+    end_date: datetime = Query(..., alias="endDate"),
+    granularity: Literal["day", "week"] = "day",
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    """날짜 범위로 일정 조회"""
-    schedule_service = ScheduleService(db)
-    schedules = await schedule_service.get_by_date_range(
-        user_id=current_user.id,
-        start_date=start_date,
-        end_date=end_date,
+    """날짜 범위의 일별/주별 일정 개수와 우선순위 마스크 조회 (월간/연간 보기용)
+
+    구간 경계는 startDate의 UTC 오프셋 기준 자정이다. 두 값의 타임존 유무가 달라도 되며,
+    타임존이 없는 값은 UTC로 본다.
+    """
+    window_start = to_naive_utc(start_date)
+    window_end = to_naive_utc(end_date)
+    if window_end < window_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료일은 시작일 이후여야 합니다.",
+        )
+    if window_end - window_start > timedelta(days=settings.SUMMARY_MAX_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"요약 조회 기간은 최대 {settings.SUMMARY_MAX_DAYS}일입니다.",
+        )
+
+    async def load() -> dict:
+        schedule_service = ScheduleService(db)
+        buckets = await schedule_service.get_summary(
+            user_id=current_user.id,
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+        )
+        return {
+            "granularity": granularity,
+            "buckets": [
+                ScheduleSummaryBucket(date=day, count=count, priority_mask=mask).model_dump(
+                    mode="json", by_alias=True
+                )
+                for day, count, mask in buckets
+            ],
+        }
+
+    offset = start_date.utcoffset() or timedelta(0)
+    params = (
+        f"{granularity}|{offset.total_seconds():.0f}|"
+        f"{window_start.isoformat()}|{window_end.isoformat()}"
     )
+    cache = ScheduleCache()
+    version = await cache.change_version(db, current_user.id)
+    etag = cache.etag(current_user.id, version, "summary", params)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    _set_etag(response, etag)
+    return await cache.get_or_load(current_user.id, "summary", params, load, version=version)
 
+
+@router.get("/sync")
+async def sync_schedules(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """델타 동기화 (since 토큰 이후 변경된 일정과 삭제된 일정 ID 반환)
+
+    since가 없으면 처음부터 조회한다. hasMore가 true이면 nextToken으로 이어서 조회한다.
+    """
+    since_seq = 0
+    if since:
+        try:
+            since_seq = decode_sync_token(since)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    changes, has_more = await ScheduleChangeService(db).get_since(
+        current_user.id, since_seq, limit
+    )
+
+    schedule_service = ScheduleService(db)
+    upserted_ids = [c.schedule_id for c in changes if not c.deleted]
+    schedules = await schedule_service.get_by_ids(upserted_ids, current_user.id)
+
+    next_seq = changes[-1].seq if changes else since_seq
     return {
-        "data": [ScheduleResponse.model_validate(s).model_dump(by_alias=True) for s in schedules],
+        "upserted": [ScheduleResponse.model_validate(s).model_dump(by_alias=True) for s in schedules],
+        "deleted": [c.schedule_id for c in changes if c.deleted],
+        "nextToken": encode_sync_token(next_seq),
+        "hasMore": has_more,
     }
 
 
+@router.get("/stream")
+async def stream_schedule_changes(
+    current_user: User = Depends(get_streaming_user),
+) -> StreamingResponse:
+    """일정 변경 실시간 알림 (Server-Sent Events)
+
+    이벤트는 {"type": "upsert"|"delete", "id", "token"} 형식이며, token으로 /sync를 호출하면
+    된다. 연결이 밀려 이벤트가 버려지면 {"type": "resync"}가 전달된다. 앱 알림은
+    {"type": "reminder", "id", "title", "startDate"} 형식으로 같은 스트림에 전달된다.
+    """
+    broker = get_broker()
+    subscription = await broker.subscribe(ScheduleChangeService.channel(current_user.id))
+
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            yield b"retry: 5000\n\n"
+            while True:
+                message = await subscription.get(timeout=settings.STREAM_HEARTBEAT_SECONDS)
+                if message is None:
+                    # 유휴 연결이 프록시에서 끊기지 않도록 주석 라인 전송
+                    yield b": ping\n\n"
+                else:
+                    yield b"data: " + message + b"\n\n"
+        finally:
+            await broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+_EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "schedules.ndjson"),
+    "ics": ("text/calendar; charset=utf-8", "schedules.ics"),
+}
+
+
+@router.get("/export")
+async def export_schedules(
+    export_format: Literal["ndjson", "ics"] = Query("ndjson", alias="format"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """모든 일정 내보내기 (NDJSON: 한 줄에 일정 하나, ICS: iCalendar)
+
+    서버 측 커서로 EXPORT_BATCH_SIZE개씩 읽어 바로 전송하므로 일정 수와 관계없이
+    메모리 사용량이 일정하다.
+    """
+    user_id = current_user.id
+
+    async def body() -> AsyncIterator[bytes]:
+        # get_db는 응답을 보내기 전에 세션을 닫으므로, 같은 세션으로 새 읽기 트랜잭션을
+        # 열고 전송이 끝나면 직접 닫는다
+        try:
+            if export_format == "ics":
+                yield CALENDAR_HEADER.encode()
+            async for rows in ScheduleService(db).stream_all(user_id, settings.EXPORT_BATCH_SIZE):
+                schedules = _schedule_list.validate_python(rows, from_attributes=True)
+                if export_format == "ics":
+                    yield "".join(format_event(s) for s in schedules).encode()
+                else:
+                    yield b"".join(to_json(s, by_alias=True) + b"\n" for s in schedules)
+            if export_format == "ics":
+                yield CALENDAR_FOOTER.encode()
+        finally:
+            await db.close()
+
+    media_type, filename = _EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.get("/search")
+async def search_schedules(
+    q: str = Query(..., min_length=1, max_length=100),
+    page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """일정 검색 (관련도 순, 일치 부분 하이라이트)"""
+    after = None
+    if cursor:
+        try:
+            after = decode_search_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    schedule_service = ScheduleService(db)
+    hits, has_more = await schedule_service.search(
+        user_id=current_user.id,
+        query=q,
+        limit=page_size,
+        after=after,
+    )
+
+    terms = split_terms(q)
+    items = []
+    for schedule, rank in hits:
+        item = ScheduleResponse.model_validate(schedule).model_dump(by_alias=True)
+        item["rank"] = rank
+        item["highlight"] = {
+            "title": highlight(schedule.title, terms),
+            "description": highlight(schedule.description, terms, snippet=True),
+        }
+        items.append(item)
+
+    next_cursor = None
+    if has_more:
+        last, last_rank = hits[-1]
+        next_cursor = encode_search_cursor(last_rank, last.start_date, last.id)
+
+    return {"items": items, "pageSize": page_size, "nextCursor": next_cursor}
+
+
+@router.get("/import/{job_id}")
+async def get_import_job(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """일정 가져오기 작업 진행 상황 조회"""
+    job = await ScheduleImportService(db).get_job(job_id, current_user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="가져오기 작업을 찾을 수 없습니다.",
+        )
+    return {"data": ScheduleImportJobResponse.model_validate(job).model_dump(by_alias=True)}
+
+
 @router.get("/{schedule_id}")
 async def get_schedule(
     schedule_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    """일정 상세 조회"""
-    schedule_service = ScheduleService(db)
-    schedule = await schedule_service.get_by_id(schedule_id, current_user.id)
+    """일정 상세 조회 (If-None-Match가 현재 ETag와 같으면 304)"""
 
-    if not schedule:
+    async def load() -> Optional[dict]:
+        schedule_service = ScheduleService(db)
+        schedule = await schedule_service.get_by_id(schedule_id, current_user.id)
+        if not schedule:
+            return None
+        return ScheduleResponse.model_validate(schedule).model_dump(mode="json", by_alias=True)
+
+    cache = ScheduleCache()
+    version = await cache.change_version(db, current_user.id)
+    etag = cache.etag(current_user.id, version, "detail", str(schedule_id))
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    data = await cache.get_or_load(
+        current_user.id, "detail", str(schedule_id), load, version=version
+    )
+    if data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="일정을 찾을 수 없습니다.",
         )
 
-    return {"data": ScheduleResponse.model_validate(schedule).model_dump(by_alias=True)}
+    _set_etag(response, etag)
+    return {"data": data}
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -107,6 +569,73 @@ async def create_schedule(
     return {"data": ScheduleResponse.model_validate(schedule).model_dump(by_alias=True)}
 
 
+@router.post("/bulk")
+async def bulk_schedules(
+    bulk_in: ScheduleBulkRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """일정 일괄 생성/수정/삭제 (한 트랜잭션)
+
+    항목별 결과를 요청 순서대로 반환한다. 생성은 201, 수정/삭제는 200이며
+    없거나 권한이 없는 일정은 404로 표시되고 나머지 작업은 그대로 반영된다.
+    """
+    schedule_service = ScheduleService(db)
+    try:
+        results, image_urls = await schedule_service.bulk(current_user.id, bulk_in.operations)
+    except DuplicateOperationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    delete_images_after_commit(db, image_urls)
+
+    written_ids = [r.id for r in results if r.op != "delete" and r.status < 400]
+    rows = await schedule_service.get_by_ids(written_ids, current_user.id, fields=SPARSE_FIELDS)
+    schedules = {s.id: s for s in _schedule_items(rows, None, True)}
+
+    items = []
+    for r in results:
+        item = {"index": r.index, "op": r.op, "status": r.status, "id": r.id}
+        if r.status >= 400:
+            item["error"] = "일정을 찾을 수 없습니다."
+        elif r.id in schedules:
+            item["data"] = schedules[r.id]
+        items.append(item)
+    return _json_response(_json_bytes({"results": items}))
+
+
+@router.post("/import", status_code=status.HTTP_201_CREATED)
+async def import_schedules(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """ICS(iCalendar) 파일에서 일정 가져오기
+
+    작은 파일은 바로 가져와 완료된 작업을 반환한다 (201). 큰 파일은 백그라운드 작업으로
+    가져오고 202와 함께 작업을 반환하며, 진행 상황은 GET /schedules/import/{job_id}로 조회한다.
+    """
+    size = file.size or 0
+    if size > settings.IMPORT_MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"파일 크기는 {settings.IMPORT_MAX_FILE_SIZE // (1024 * 1024)}MB 이하여야 합니다.",
+        )
+
+    import_service = ScheduleImportService(db)
+    job = await import_service.create_job(current_user.id, file.filename, size)
+    if size <= settings.IMPORT_SYNC_MAX_BYTES:
+        await import_service.run(job, file.file)
+    else:
+        # 작업 행은 응답 전에 커밋되고, 백그라운드 작업은 그 이후에 실행된다
+        path = await save_upload(file)
+        background_tasks.add_task(run_import_job, job.id, path)
+        response.status_code = status.HTTP_202_ACCEPTED
+
+    return {"data": ScheduleImportJobResponse.model_validate(job).model_dump(by_alias=True)}
+
+
 @router.post("/upload", status_code=status.HTTP_201_CREATED)
 async def create_schedule_with_image(
     title: str = Form(...),
@@ -137,7 +666,7 @@ async def create_schedule_with_image(
     
     # 이미지 업로드
     file_service = FileService()
-    image_url = await file_service.upload_image(image, current_user.id)
+    uploaded = await file_service.upload_image(image, current_user.id)
 
     # 일정 생성
     schedule_in = ScheduleCreate(
@@ -152,11 +681,75 @@ async def create_schedule_with_image(
     )
 
     schedule_service = ScheduleService(db)
-    schedule = await schedule_service.create(current_user.id, schedule_in, image_url=image_url)
+    try:
+        schedule = await schedule_service.create(
+            current_user.id,
+            schedule_in,
+            image_url=uploaded.url,
+            image_renditions=uploaded.renditions,
+            image_placeholder=uploaded.placeholder,
+        )
+    except Exception:
+        # 일정이 만들어지지 않았으므로 방금 업로드한 이미지도 정리
+        get_image_cleanup_queue().enqueue([uploaded.url])
+        raise
 
     return {"data": ScheduleResponse.model_validate(schedule).model_dump(by_alias=True)}
 
 
+@router.post("/uploads", status_code=status.HTTP_201_CREATED)
+async def create_image_upload(
+    upload_in: ImageUploadRequest,
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    """이미지 직접 업로드 URL 발급 (S3 presigned POST)
+
+    이미지 바이트가 API 서버를 거치지 않는다. 업로드 후 POST /schedules/{id}/image로
+    일정에 연결해야 하며, 연결하지 않은 파일은 고아 이미지 정리에서 삭제된다.
+    """
+    upload = FileService().create_direct_upload(
+        current_user.id, upload_in.content_type, upload_in.size
+    )
+    return {"data": ImageUploadResponse.model_validate(upload).model_dump(by_alias=True)}
+
+
+@router.post("/{schedule_id}/image")
+async def attach_uploaded_image(
+    schedule_id: UUID,
+    upload_in: ImageUploadComplete,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """직접 업로드한 이미지를 검증/처리해 일정에 연결 (기존 이미지는 커밋 후 삭제)
+
+    처리 전에 일정 행을 잠가 확인하므로, 일정이 없으면 업로드한 파일은 그대로 남는다.
+    """
+    schedule_service = ScheduleService(db)
+    found, previous_image_url = await schedule_service.lock_image(schedule_id, current_user.id)
+    if not found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="일정을 찾을 수 없습니다.",
+        )
+
+    uploaded = await FileService().finalize_direct_upload(current_user.id, upload_in.key)
+    try:
+        schedule = await schedule_service.set_image(
+            schedule_id,
+            current_user.id,
+            uploaded.url,
+            uploaded.renditions,
+            uploaded.placeholder,
+        )
+    except Exception:
+        get_image_cleanup_queue().enqueue([uploaded.url])
+        raise
+
+    if previous_image_url:
+        delete_images_after_commit(db, [previous_image_url])
+    return {"data": ScheduleResponse.model_validate(schedule).model_dump(by_alias=True)}
+
+
 @router.put("/{schedule_id}")
 async def update_schedule(
     schedule_id: UUID,
@@ -167,15 +760,13 @@ async def update_schedule(
     """일정 수정"""
     schedule_service = ScheduleService(db)
 
-    # 일정 존재 및 권한 확인
-    schedule = await schedule_service.get_by_id(schedule_id, current_user.id)
-    if not schedule:
+    # 존재 및 권한 확인은 수정 문장의 조건으로 함께 처리
+    updated_schedule = await schedule_service.update(schedule_id, current_user.id, schedule_in)
+    if not updated_schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="일정을 찾을 수 없습니다.",
         )
-
-    updated_schedule = await schedule_service.update(schedule_id, schedule_in)
     return {"data": ScheduleResponse.model_validate(updated_schedule).model_dump(by_alias=True)}
 
 
@@ -196,11 +787,9 @@ async def delete_schedule(
             detail="일정을 찾을 수 없습니다.",
         )
 
-    # 이미지 삭제
-    if schedule.image_url:
-        file_service = FileService()
-        await file_service.delete_image(schedule.image_url)
-
     await schedule_service.delete(schedule_id)
+    # 이미지는 커밋된 뒤 백그라운드에서 삭제
+    if schedule.image_url:
+        delete_images_after_commit(db, [schedule.image_url])
     return MessageResponse(message="일정이 삭제되었습니다.")
 
@@ -0,0 +1,69 @@
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# 파일 외 폼 필드와 multipart 경계 문자열에 허용하는 크기
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class BodyTooLarge(HTTPException):
+    """요청 본문이 한도를 넘음 (본문을 읽는 중에 발생하며 413 응답으로 처리된다)"""
+
+    def __init__(self, limit: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"요청 크기는 {limit // (1024 * 1024)}MB 이하여야 합니다.",
+        )
+
+
+def default_limits() -> Dict[str, int]:
+    """경로별 요청 본문 최대 크기 (파일 업로드 경로)"""
+    prefix = f"{settings.API_V1_PREFIX}/schedules"
+    return {
+        f"{prefix}/upload": settings.MAX_FILE_SIZE + FORM_OVERHEAD_BYTES,
+        f"{prefix}/import": settings.IMPORT_MAX_FILE_SIZE + FORM_OVERHEAD_BYTES,
+    }
+
+
+class BodySizeLimitMiddleware:
+    """업로드 요청 본문 크기 제한
+
+    multipart 본문은 엔드포인트가 실행되기 전에 전부 파싱되므로 엔드포인트에서 크기를
+    확인하면 이미 전체를 받은 뒤다. Content-Length가 한도를 넘으면 본문을 읽지 않고
+    바로, chunked 전송이면 받은 바이트가 한도를 넘는 순간 BodyTooLarge(413)로 중단한다.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.limits = limits if limits is not None else default_limits()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            error = BodyTooLarge(limit)
+            response = JSONResponse({"detail": error.detail}, status_code=error.status_code)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise BodyTooLarge(limit)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 구독자 큐가 넘쳤을 때 전달하는 메시지 (클라이언트는 델타 동기화로 따라잡는다)
+OVERFLOW = b'{"type":"resync"}'
+
+
+class Subscription:
+    """채널 구독 (크기가 제한된 큐)
+
+    느린 구독자의 큐가 가득 차면 쌓인 메시지를 버리고 OVERFLOW 하나만 남긴다.
+    발행자는 어떤 경우에도 기다리지 않는다.
+    """
+
+    def __init__(self, channel: str, maxsize: int):
+        self.channel = channel
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=maxsize)
+
+    def deliver(self, message: bytes) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+    async def get(self, timeout: float) -> Optional[bytes]:
+        """메시지 대기 (timeout 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class MemoryBroker:
+    """프로세스 내 메시지 브로커 (같은 워커의 구독자에게만 전달)"""
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    def _dispatch(self, channel: str, message: bytes) -> None:
+        for subscription in list(self._subscriptions.get(channel, ())):
+            subscription.deliver(message)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        self._dispatch(channel, message)
+
+    async def _on_first_subscriber(self, channel: str) -> None:
+        return None
+
+    async def _on_last_unsubscribe(self, channel: str) -> None:
+        return None
+
+    async def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(channel, settings.STREAM_QUEUE_SIZE)
+        if not self._subscriptions.get(channel):
+            await self._on_first_subscriber(channel)
+        self._subscriptions[channel].add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscriptions.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.channel]
+            await self._on_last_unsubscribe(subscription.channel)
+
+    async def close(self) -> None:
+        self._subscriptions.clear()
+
+
+class RedisBroker(MemoryBroker):
+    """Redis pub/sub 메시지 브로커 (모든 워커의 구독자에게 전달)
+
+    워커마다 pub/sub 연결 하나만 열고, 로컬 구독자가 있는 채널만 구독한 뒤
+    받은 메시지를 로컬 큐로 나눠준다. 연결 수는 구독자 수와 무관하다.
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.client = redis.Redis.from_url(url)
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._reader: Optional[asyncio.Task] = None
+
+    async def ping(self) -> None:
+        await self.client.ping()
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        try:
+            await self.client.publish(channel, message)
+        except RedisError:
+            logger.warning("Redis PUBLISH 실패: %s", channel, exc_info=True)
+
+    async def _on_first_subscriber(self, channel: str) -> None:
+        await self.pubsub.subscribe(channel)
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+
+    async def _on_last_unsubscribe(self, channel: str) -> None:
+        try:
+            await self.pubsub.unsubscribe(channel)
+        except RedisError:
+            logger.warning("Redis UNSUBSCRIBE 실패: %s", channel, exc_info=True)
+
+    async def _read(self) -> None:
+        while True:
+            try:
+                message = await self.pubsub.get_message(timeout=1.0)
+            except RedisError:
+                logger.warning("Redis pub/sub 수신 실패", exc_info=True)
+                await asyncio.sleep(1.0)
+                continue
+            if message and message["type"] == "message":
+                self._dispatch(message["channel"].decode(), message["data"])
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        await super().close()
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+_broker: Optional[MemoryBroker] = None
+
+
+def get_broker() -> MemoryBroker:
+    """현재 메시지 브로커 조회 (초기화 전에는 프로세스 내 브로커)"""
+    global _broker
+    if _broker is None:
+        _broker = MemoryBroker()
+    return _broker
+
+
+async def init_broker() -> MemoryBroker:
+    """설정에 따라 메시지 브로커 초기화 (앱 시작 시 호출)
+
+    Redis에 연결할 수 없으면 프로세스 내 브로커를 쓴다. 이때 다른 워커에서 발생한
+    변경은 푸시되지 않지만, 클라이언트는 델타 동기화로 따라잡을 수 있다.
+    """
+    global _broker
+    if settings.BROKER_BACKEND == "redis":
+        broker = RedisBroker(settings.REDIS_URL)
+        try:
+            await broker.ping()
+            _broker = broker
+            return _broker
+        except (RedisError, OSError):
+            await broker.close()
+            logger.warning("Redis에 연결할 수 없어 프로세스 내 브로커를 사용합니다.")
+    _broker = MemoryBroker()
+    return _broker
+
+
+async def close_broker() -> None:
+    """메시지 브로커 종료 (앱 종료 시 호출)"""
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+        _broker = None
@@ -0,0 +1,195 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """캐시 백엔드 인터페이스 (기본 구현은 아무것도 저장하지 않는다)"""
+
+    enabled = False
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        return None
+
+    async def add(self, key: str, value: bytes, ttl: int) -> bool:
+        """키가 없을 때만 저장 (저장했으면 True)"""
+        return False
+
+    async def incr(self, key: str, ttl: int) -> int:
+        """정수 값 증가 (키가 없으면 0에서 시작) 후 TTL 갱신"""
+        return 0
+
+    async def delete(self, key: str) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 내 캐시 백엔드 (LRU + TTL + 전체 크기 제한)
+
+    워커 간에 공유되지 않으므로 개발/테스트 또는 단일 프로세스 환경용이다.
+    """
+
+    enabled = True
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+
+    def _get_entry(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(key) + len(entry[0])
+
+    def _store(self, key: str, value: bytes, ttl: int) -> None:
+        self._remove(key)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self.size += len(key) + len(value)
+        while self.size > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._get_entry(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._store(key, value, ttl)
+
+    async def add(self, key: str, value: bytes, ttl: int) -> bool:
+        if self._get_entry(key) is not None:
+            return False
+        self._store(key, value, ttl)
+        return True
+
+    async def incr(self, key: str, ttl: int) -> int:
+        value = int(self._get_entry(key) or 0) + 1
+        self._store(key, str(value).encode(), ttl)
+        return value
+
+    async def delete(self, key: str) -> None:
+        self._remove(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 캐시 백엔드 (모든 워커가 공유)
+
+    Redis 오류는 캐시 미스로 처리해 요청이 DB 경로로 계속 진행되게 한다.
+    """
+
+    enabled = True
+
+    def __init__(self, url: str):
+        self.client = redis.Redis.from_url(url)
+
+    async def ping(self) -> None:
+        await self.client.ping()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(key)
+        except RedisError:
+            logger.warning("Redis GET 실패: %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except RedisError:
+            logger.warning("Redis SET 실패: %s", key, exc_info=True)
+
+    async def add(self, key: str, value: bytes, ttl: int) -> bool:
+        try:
+            return bool(await self.client.set(key, value, ex=ttl, nx=True))
+        except RedisError:
+            logger.warning("Redis SET NX 실패: %s", key, exc_info=True)
+            return False
+
+    async def incr(self, key: str, ttl: int) -> int:
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, ttl)
+                value, _ = await pipe.execute()
+            return int(value)
+        except RedisError:
+            logger.warning("Redis INCR 실패: %s", key, exc_info=True)
+            return 0
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(key)
+        except RedisError:
+            logger.warning("Redis DEL 실패: %s", key, exc_info=True)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+_cache: Optional[CacheBackend] = None
+
+
+def get_cache() -> CacheBackend:
+    """현재 캐시 백엔드 조회 (초기화 전에는 프로세스 내 캐시)"""
+    global _cache
+    if _cache is None:
+        _cache = MemoryCacheBackend(settings.CACHE_MEMORY_MAX_BYTES)
+    return _cache
+
+
+async def init_cache() -> CacheBackend:
+    """설정에 따라 캐시 백엔드 초기화 (앱 시작 시 호출)
+
+    Redis에 연결할 수 없으면 개발 환경에서는 프로세스 내 캐시를 쓰고,
+    운영 환경에서는 워커 간 무효화를 보장할 수 없으므로 캐시를 끈다.
+    """
+    global _cache
+    if settings.CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(settings.REDIS_URL)
+        try:
+            await backend.ping()
+            _cache = backend
+        except (RedisError, OSError):
+            await backend.close()
+            if settings.DEBUG:
+                logger.warning("Redis에 연결할 수 없어 프로세스 내 캐시를 사용합니다.")
+                _cache = MemoryCacheBackend(settings.CACHE_MEMORY_MAX_BYTES)
+            else:
+                logger.warning("Redis에 연결할 수 없어 캐시를 사용하지 않습니다.")
+                _cache = CacheBackend()
+    elif settings.CACHE_BACKEND == "memory":
+        _cache = MemoryCacheBackend(settings.CACHE_MEMORY_MAX_BYTES)
+    else:
+        _cache = CacheBackend()
+    return _cache
+
+
+async def close_cache() -> None:
+    """캐시 백엔드 종료 (앱 종료 시 호출)"""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 별도로 제한하지 않는 경로 (가벼운 상태 확인, 연결을 오래 유지하는 SSE)
+EXEMPT_PATHS = ("/health", f"{settings.API_V1_PREFIX}/system/")
+STREAM_PATHS = (f"{settings.API_V1_PREFIX}/schedules/stream",)
+
+# 처리 시간이 길어 일반 요청과 따로 제한하는 경로
+HEAVY_PATHS = {
+    f"{settings.API_V1_PREFIX}/schedules/{name}" for name in ("bulk", "export", "import", "upload")
+}
+# 일정별 경로 중 무거운 요청 (직접 업로드 이미지 처리: /schedules/{id}/image)
+HEAVY_SUFFIXES = ("/image",)
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """요청의 동시성 제한 그룹 (None이면 제한하지 않음)"""
+    if not path.startswith(settings.API_V1_PREFIX):
+        return None
+    if path.startswith(EXEMPT_PATHS) or path.startswith(STREAM_PATHS):
+        return None
+    path = path.rstrip("/")
+    if path in HEAVY_PATHS:
+        return "heavy"
+    if path.startswith(f"{settings.API_V1_PREFIX}/schedules/") and path.endswith(HEAVY_SUFFIXES):
+        return "heavy"
+    return "read" if method in READ_METHODS else "write"
+
+
+class AdaptiveLimiter:
+    """응답 시간에 따라 조정되는 동시 실행 한도 (gradient 방식)
+
+    응답 시간의 장기 평균(기준선)과 최근 값의 비율로 한도를 조정한다. 최근 응답이
+    기준선보다 tolerance배 이상 느려지면(DB 풀 대기 등 큐잉이 생기면) 한도를 줄이고,
+    그렇지 않으면 sqrt(limit)만큼 여유를 두고 늘린다. 5xx 응답은 즉시 한도를 줄인다.
+    한도를 넘은 요청은 최대 max_queue개까지 순서대로 대기하고, 나머지는 바로 거절한다.
+    """
+
+    SMOOTHING = 0.2  # 한도 변경 반영 비율
+    SHORT_ALPHA = 0.5  # 최근 응답 시간 지수 이동 평균 계수
+    LONG_ALPHA = 0.01  # 기준선 지수 이동 평균 계수
+    TOLERANCE = 1.5  # 기준선보다 이 배수까지 느려지는 것은 허용
+    BACKOFF = 0.9  # 5xx 응답 시 한도 감소 비율
+
+    def __init__(self, initial_limit: int, min_limit: int, max_limit: int, max_queue: int):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._short: Optional[float] = None
+        self._long: Optional[float] = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> bool:
+        """실행 슬롯 획득 (timeout초 안에 얻지 못하면 False)"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소되면 다음 요청에 넘긴다
+                self.release(None)
+            else:
+                waiter.cancel()
+                self._remove(waiter)
+            raise
+        if waiter.done():
+            return True
+        waiter.cancel()
+        self._remove(waiter)
+        return False
+
+    def _remove(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, latency: Optional[float], failed: bool = False) -> None:
+        """실행 슬롯 반환 (latency: 첫 응답까지 걸린 시간, 없으면 한도를 조정하지 않음)"""
+        self.in_flight -= 1
+        if latency is not None:
+            self._update(latency, failed)
+        self._wake()
+
+    def _update(self, latency: float, failed: bool) -> None:
+        if self._short is None or self._long is None:
+            self._short = self._long = latency
+        else:
+            self._short += self.SHORT_ALPHA * (latency - self._short)
+            self._long += self.LONG_ALPHA * (latency - self._long)
+            if self._long > 2 * self._short:
+                # 부하가 빠진 뒤에는 높아진 기준선을 빠르게 낮춘다
+                self._long *= 0.95
+
+        if failed:
+            new_limit = self.limit * self.BACKOFF
+        else:
+            gradient = max(0.5, min(1.0, self.TOLERANCE * self._long / max(self._short, 1e-6)))
+            new_limit = self.limit * gradient + math.sqrt(self.limit)
+            if self.in_flight + 1 < self.limit / 2:
+                # 한도의 절반도 쓰지 않는 동안에는 한도를 늘리지 않는다
+                new_limit = min(new_limit, self.limit)
+            new_limit = self.limit * (1 - self.SMOOTHING) + new_limit * self.SMOOTHING
+        self.limit = max(self.min_limit, min(self.max_limit, new_limit))
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+def default_limiters() -> Dict[str, AdaptiveLimiter]:
+    """설정값으로 요청 그룹별 제한기 생성"""
+    return {
+        name: AdaptiveLimiter(
+            settings.CONCURRENCY_INITIAL_LIMIT,
+            settings.CONCURRENCY_MIN_LIMIT,
+            max_limit,
+            settings.CONCURRENCY_QUEUE_SIZE,
+        )
+        for name, max_limit in (
+            ("read", settings.CONCURRENCY_MAX_LIMIT),
+            ("write", settings.CONCURRENCY_MAX_LIMIT),
+            ("heavy", settings.CONCURRENCY_HEAVY_MAX_LIMIT),
+        )
+    }
+
+
+class ConcurrencyLimitMiddleware:
+    """요청 그룹(read/write/heavy)별 동시 실행 제한 및 과부하 시 요청 거절
+
+    한도를 넘은 요청은 CONCURRENCY_QUEUE_TIMEOUT_SECONDS 동안 기다리고, 그래도 자리가
+    없거나 대기열이 가득 차면 503과 Retry-After로 바로 응답한다. 모든 요청이 DB 풀을
+    기다리다 함께 타임아웃되는 대신 처리 가능한 만큼만 받아 지연 시간을 유지한다.
+    /health, /system/*, SSE 스트림은 제한하지 않는다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiters: Optional[Dict[str, AdaptiveLimiter]] = None,
+        queue_timeout: Optional[float] = None,
+    ):
+        self.app = app
+        self.limiters = limiters if limiters is not None else default_limiters()
+        self.queue_timeout = (
+            settings.CONCURRENCY_QUEUE_TIMEOUT_SECONDS if queue_timeout is None else queue_timeout
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        name = route_class(scope["method"], scope["path"])
+        limiter = self.limiters.get(name) if name else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire(self.queue_timeout):
+            logger.warning(
+                "과부하로 요청 거절: %s (한도 %d, 대기 %d)", name, limiter.limit, limiter.queued
+            )
+            response = JSONResponse(
+                {"detail": "요청이 많습니다. 잠시 후 다시 시도해 주세요."},
+                status_code=503,
+                headers={"Retry-After": str(settings.CONCURRENCY_RETRY_AFTER_SECONDS)},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        latency: Optional[float] = None
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal latency, status_code
+            if message["type"] == "http.response.start":
+                # 스트리밍 응답도 비교할 수 있도록 첫 응답까지의 시간을 잰다
+                latency = time.monotonic() - started
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if latency is None:
+                latency = time.monotonic() - started
+            limiter.release(latency, failed=status_code >= 500)
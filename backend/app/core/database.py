@@ -1,10 +1,13 @@
-from collections.abc import AsyncGenerator
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # 비동기 엔진 생성
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -28,6 +31,25 @@ class Base(DeclarativeBase):
     pass
 
 
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """세션 커밋 이후 실행할 콜백 등록 (캐시 무효화, 알림 발행 등)"""
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """등록된 커밋 이후 콜백 실행 (실패는 기록만 하고 요청은 계속 진행)"""
+    for callback in session.info.pop("after_commit", []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("after_commit 콜백 실행 실패")
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리 의존성 (요청 전체가 아닌 짧은 구간에만 세션을 쓰는 경우)"""
+    return async_session_maker
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """데이터베이스 세션 의존성"""
     async with async_session_maker() as session:
@@ -39,4 +61,5 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+        await run_after_commit(session)
 
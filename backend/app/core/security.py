@@ -1,23 +1,98 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
 
+# 비밀번호 해싱 (라운드가 min_rounds보다 낮은 해시는 needs_update로 판단되어 로그인 시 다시 해싱)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
 
+class PasswordHasher:
+    """비밀번호 해싱 전용 스레드 풀
 
-def get_password_hash(password: str) -> str:
+    bcrypt는 한 번에 100ms 이상 걸리므로 이벤트 루프에서 실행하지 않는다. bcrypt는
+    해싱 중 GIL을 놓으므로 스레드 workers개가 병렬로 처리한다. 실행 중/대기 중인
+    요청이 max_pending개를 넘으면 기다리게 하지 않고 503으로 바로 거절해, 로그인이
+    몰려도 다른 요청의 지연이 늘지 않게 한다.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        return await self._run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """비밀번호 해싱 풀 조회 (처음 호출 시 생성)"""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING
+        )
+    return _password_hasher
+
+
+def close_password_hasher() -> None:
+    """비밀번호 해싱 풀 종료 (앱 종료 시 호출)"""
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.close()
+        _password_hasher = None
+
+
+async def verify_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증 (반환값: (일치 여부, 다시 해싱한 값 또는 None))
+
+    해시 설정(라운드 등)이 바뀌어 다시 해싱해야 하면 새 해시를 함께 반환한다.
+    """
+    return await get_password_hasher().verify_and_update(plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
-    return pwd_context.hash(password)
+    return await get_password_hasher().hash(password)
 
 
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -6,7 +6,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.api.v1.router import api_router
+from app.core.body_limit import BodySizeLimitMiddleware
+from app.core.broker import close_broker, init_broker
+from app.core.cache import close_cache, init_cache
+from app.core.concurrency import ConcurrencyLimitMiddleware
 from app.core.config import settings
+from app.core.security import close_password_hasher
+from app.services.email_service import close_email_queue
+from app.services.file_service import close_image_pool
+from app.services.image_cleanup import start_image_cleanup, stop_image_cleanup
+from app.services.principal_cache import start_principal_cache, stop_principal_cache
+from app.services.reminder_worker import start_reminder_worker, stop_reminder_worker
 
 
 @asynccontextmanager
@@ -20,9 +30,23 @@ async def lifespan(app: FastAPI):
         uploads_dir = Path("uploads")
         uploads_dir.mkdir(exist_ok=True)
         print("📁 Uploads directory ready!")
-    
+
+    await init_cache()
+    await init_broker()
+    await start_principal_cache()
+    await start_reminder_worker()
+    await start_image_cleanup()
+
     yield
     # Shutdown
+    await stop_image_cleanup()
+    await stop_reminder_worker()
+    await close_email_queue()
+    await stop_principal_cache()
+    await close_broker()
+    await close_cache()
+    close_password_hasher()
+    close_image_pool()
     print("👋 Shutting down EZ Calendar API...")
 
 
@@ -36,6 +60,13 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# 동시 실행 제한 (CORS 미들웨어 안쪽에 두어 503 응답에도 CORS 헤더가 붙게 한다)
+if settings.CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(ConcurrencyLimitMiddleware)
+
+# 업로드 요청 본문 크기 제한 (동시 실행 슬롯을 잡기 전에 거절)
+app.add_middleware(BodySizeLimitMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
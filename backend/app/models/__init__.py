@@ -1,5 +1,19 @@
 from app.models.user import User
-from app.models.schedule import Schedule, ScheduleReminder
-
-__all__ = ["User", "Schedule", "ScheduleReminder"]
+from app.models.schedule import (
+    Schedule,
+    ScheduleReminder,
+    ScheduleCounter,
+    ScheduleChange,
+    ScheduleImportJob,
+    ReminderDelivery,
+)
 
+__all__ = [
+    "User",
+    "Schedule",
+    "ScheduleReminder",
+    "ScheduleCounter",
+    "ScheduleChange",
+    "ScheduleImportJob",
+    "ReminderDelivery",
+]
@@ -1,10 +1,26 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import String, Boolean, DateTime, Text, ForeignKey, Integer, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Computed,
+    DateTime,
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+    DDL,
+    UniqueConstraint,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSRANGE, UUID, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -29,6 +45,15 @@ class ScheduleRepeatType(str, Enum):
     YEARLY = "yearly"
 
 
+class ImportJobStatus(str, Enum):
+    """일정 가져오기 작업 상태"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class ReminderType(str, Enum):
     """알림 타입"""
 
@@ -36,10 +61,57 @@ class ReminderType(str, Enum):
     EMAIL = "email"
 
 
+class ReminderDeliveryStatus(str, Enum):
+    """알림 발송 상태"""
+
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+PERIOD_EXPRESSION = (
+    "tsrange(start_date, CASE "
+    "WHEN repeat = 'none' THEN greatest(start_date, end_date) "
+    "WHEN repeat_end_date IS NULL THEN NULL "
+    "ELSE greatest(start_date, date(repeat_end_date) + 1 + (coalesce(end_date, start_date) - start_date)) "
+    "END, '[]')"
+)
+
+SEARCH_TEXT_EXPRESSION = "lower(title || ' ' || coalesce(description, ''))"
+
+# 공백을 제외한 모든 1글자/2글자 조각 (trigram을 만들 수 없는 짧은 검색어용, 로캘과 무관)
+# SQL_ASCII 인코딩 DB에서는 문자열이 바이트 단위로 다뤄지므로 UTF-8 바이트열로 글자를 나눈다
+SEARCH_GRAMS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION schedule_search_grams(value text) RETURNS text[]
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT coalesce(array_agg(DISTINCT gram), '{}')
+    FROM (
+        SELECT c, c || lead(c) OVER (ORDER BY i) AS pair
+        FROM (
+            SELECT m[1] AS c, i
+            FROM regexp_matches(
+                value,
+                CASE WHEN getdatabaseencoding() = 'SQL_ASCII'
+                    THEN '[^\x80-\xbf][\x80-\xbf]*' ELSE '.' END,
+                'g'
+            ) WITH ORDINALITY AS matches (m, i)
+        ) AS chars
+    ) AS pairs,
+    LATERAL (VALUES (c), (pair)) AS grams (gram)
+    WHERE gram !~ '\s'
+$$
+"""
+SEARCH_GRAMS_EXPRESSION = f"schedule_search_grams({SEARCH_TEXT_EXPRESSION})"
+
+
 class Schedule(Base):
     """일정 모델"""
 
     __tablename__ = "schedules"
+    __table_args__ = (
+        # 키셋 페이지네이션 (start_date, id) 순서 조회용
+        Index("ix_schedules_user_id_start_date_id", "user_id", "start_date", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -59,11 +131,34 @@ class Schedule(Base):
     color: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     location: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     image_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # 렌디션 이름(detail, thumbnail, detailWebp, thumbnailWebp) -> URL
+    image_renditions: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # 이미지를 받기 전에 보여줄 작은 미리보기 (data URI)
+    image_placeholder: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     repeat: Mapped[ScheduleRepeatType] = mapped_column(
         SQLEnum(ScheduleRepeatType, values_callable=lambda x: [e.value for e in x]),
         default=ScheduleRepeatType.NONE
     )
     repeat_end_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # 일정이 차지하는 기간 (반복 일정은 반복 종료까지, 종료일이 없으면 상한 없음)
+    # 마이그레이션 002에서 (user_id, period) GiST 인덱스가 생성된다
+    period: Mapped[Optional[Range[datetime]]] = mapped_column(
+        TSRANGE,
+        Computed(PERIOD_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+    # 검색용 소문자 텍스트 (마이그레이션 005에서 trigram GIN 인덱스가 생성된다)
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(SEARCH_TEXT_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+    # 검색용 1~2글자 조각 (마이그레이션 010에서 (user_id, search_grams) GIN 인덱스가 생성된다)
+    search_grams: Mapped[List[str]] = mapped_column(
+        ARRAY(Text),
+        Computed(SEARCH_GRAMS_EXPRESSION, persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
@@ -79,10 +174,22 @@ class Schedule(Base):
         return f"<Schedule {self.title}>"
 
 
+# search_grams 생성 컬럼이 사용하는 함수 (마이그레이션 010에서도 같은 함수를 만든다)
+event.listen(Schedule.__table__, "before_create", DDL(SEARCH_GRAMS_FUNCTION))
+
+
 class ScheduleReminder(Base):
     """일정 알림 모델"""
 
     __tablename__ = "schedule_reminders"
+    __table_args__ = (
+        # 발송 대기 알림 조회용 (더 이상 발송할 발생이 없는 알림은 인덱스에서 제외)
+        Index(
+            "ix_schedule_reminders_fire_at",
+            "fire_at",
+            postgresql_where=text("fire_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -95,6 +202,8 @@ class ScheduleReminder(Base):
         default=ReminderType.NOTIFICATION
     )
     minutes_before: Mapped[int] = mapped_column(Integer, default=30)
+    # 다음 발송 시각 (다음 발생 시작 - minutes_before, 발송할 발생이 없으면 None)
+    fire_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -103,3 +212,124 @@ class ScheduleReminder(Base):
     def __repr__(self) -> str:
         return f"<ScheduleReminder {self.minutes_before}min>"
 
+
+class ScheduleCounter(Base):
+    """사용자별 일정 개수 카운터 모델"""
+
+    __tablename__ = "schedule_counters"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 일정이 생성/수정/삭제될 때마다 증가 (캐시 무효화용 버전)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ScheduleCounter {self.user_id} total={self.total}>"
+
+
+# 변경 순번 (사용자별 쓰기는 카운터 행 잠금으로 직렬화되므로 커밋 순서와 같다)
+schedule_change_seq = Sequence("schedule_change_seq")
+
+
+class ScheduleChange(Base):
+    """일정 변경 로그 모델 (일정당 최신 변경 1건만 유지, 삭제는 tombstone으로 남김)"""
+
+    __tablename__ = "schedule_changes"
+    __table_args__ = (Index("ix_schedule_changes_user_id_seq", "user_id", "seq"),)
+
+    schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    seq: Mapped[int] = mapped_column(
+        BigInteger,
+        schedule_change_seq,
+        server_default=schedule_change_seq.next_value(),
+        nullable=False,
+    )
+    deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<ScheduleChange {self.schedule_id} seq={self.seq}>"
+
+
+class ScheduleImportJob(Base):
+    """일정 가져오기(ICS) 작업 모델 (진행 상황은 배치가 커밋될 때마다 갱신)"""
+
+    __tablename__ = "schedule_import_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    filename: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    status: Mapped[ImportJobStatus] = mapped_column(
+        SQLEnum(ImportJobStatus, values_callable=lambda x: [e.value for e in x]),
+        default=ImportJobStatus.PENDING,
+        nullable=False,
+    )
+    total_bytes: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    processed_bytes: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    imported: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    skipped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 반복 규칙을 표현할 수 없어 단일 일정으로 가져온 개수
+    simplified: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ScheduleImportJob {self.id} {self.status}>"
+
+
+class ReminderDelivery(Base):
+    """알림 발송 기록 모델 ((알림, 발생 시작)당 1건으로 중복 발송 방지)"""
+
+    __tablename__ = "reminder_deliveries"
+    __table_args__ = (
+        UniqueConstraint(
+            "reminder_id",
+            "occurrence_start",
+            name="uq_reminder_deliveries_reminder_id_occurrence_start",
+        ),
+        # 발송되지 않고 남은 기록 재시도용
+        Index(
+            "ix_reminder_deliveries_pending_claimed_at",
+            "claimed_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    # 알림이 수정/삭제되어도 기록은 남도록 외래 키를 두지 않는다
+    reminder_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    reminder_type: Mapped[ReminderType] = mapped_column(
+        SQLEnum(ReminderType, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
+    occurrence_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    status: Mapped[ReminderDeliveryStatus] = mapped_column(
+        SQLEnum(ReminderDeliveryStatus, values_callable=lambda x: [e.value for e in x]),
+        default=ReminderDeliveryStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # 마지막으로 발송을 시도한 시각 (pending으로 오래 남으면 다시 시도)
+    claimed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ReminderDelivery {self.reminder_id} {self.occurrence_start} {self.status}>"
@@ -2,7 +2,15 @@ from app.schemas.user import UserCreate, UserUpdate, UserResponse, UserLogin, To
 from app.schemas.schedule import (
     ScheduleCreate,
     ScheduleUpdate,
+    ScheduleBulkCreate,
+    ScheduleBulkUpdate,
+    ScheduleBulkDelete,
+    ScheduleBulkRequest,
     ScheduleResponse,
+    ScheduleOccurrenceResponse,
+    ScheduleSummaryBucket,
+    ScheduleSummaryResponse,
+    ScheduleImportJobResponse,
     ScheduleListResponse,
     ScheduleFilter,
     ReminderCreate,
@@ -19,7 +27,15 @@ __all__ = [
     "TokenPayload",
     "ScheduleCreate",
     "ScheduleUpdate",
+    "ScheduleBulkCreate",
+    "ScheduleBulkUpdate",
+    "ScheduleBulkDelete",
+    "ScheduleBulkRequest",
     "ScheduleResponse",
+    "ScheduleOccurrenceResponse",
+    "ScheduleSummaryBucket",
+    "ScheduleSummaryResponse",
+    "ScheduleImportJobResponse",
     "ScheduleListResponse",
     "ScheduleFilter",
     "ReminderCreate",
@@ -1,10 +1,16 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Annotated, Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
-from app.models.schedule import SchedulePriority, ScheduleRepeatType, ReminderType
+from app.core.config import settings
+from app.models.schedule import (
+    ImportJobStatus,
+    SchedulePriority,
+    ScheduleRepeatType,
+    ReminderType,
+)
 
 
 class ReminderBase(BaseModel):
@@ -70,6 +76,42 @@ class ScheduleUpdate(BaseModel):
     reminders: Optional[List[ReminderCreate]] = None
 
 
+class ScheduleBulkCreate(BaseModel):
+    """일괄 작업: 일정 생성"""
+
+    op: Literal["create"]
+    data: ScheduleCreate
+
+
+class ScheduleBulkUpdate(BaseModel):
+    """일괄 작업: 일정 수정"""
+
+    op: Literal["update"]
+    id: UUID
+    data: ScheduleUpdate
+
+
+class ScheduleBulkDelete(BaseModel):
+    """일괄 작업: 일정 삭제"""
+
+    op: Literal["delete"]
+    id: UUID
+
+
+ScheduleBulkOperation = Annotated[
+    Union[ScheduleBulkCreate, ScheduleBulkUpdate, ScheduleBulkDelete],
+    Field(discriminator="op"),
+]
+
+
+class ScheduleBulkRequest(BaseModel):
+    """일정 일괄 작업 요청 스키마"""
+
+    operations: List[ScheduleBulkOperation] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_OPERATIONS
+    )
+
+
 class ScheduleResponse(ScheduleBase):
     """일정 응답 스키마"""
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
@@ -77,19 +119,100 @@ class ScheduleResponse(ScheduleBase):
     id: UUID
     user_id: UUID = Field(..., alias="userId", serialization_alias="userId")
     image_url: Optional[str] = Field(None, alias="imageUrl", serialization_alias="imageUrl")
+    image_renditions: Optional[Dict[str, str]] = Field(
+        None, alias="imageRenditions", serialization_alias="imageRenditions"
+    )
+    image_placeholder: Optional[str] = Field(
+        None, alias="imagePlaceholder", serialization_alias="imagePlaceholder"
+    )
     reminders: List[ReminderResponse] = []
     created_at: datetime = Field(..., alias="createdAt", serialization_alias="createdAt")
     updated_at: datetime = Field(..., alias="updatedAt", serialization_alias="updatedAt")
 
 
+class ImageUploadRequest(BaseModel):
+    """이미지 직접 업로드 URL 발급 요청 스키마"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    content_type: str = Field(..., alias="contentType")
+    size: Optional[int] = Field(None, gt=0)
+
+
+class ImageUploadResponse(BaseModel):
+    """이미지 직접 업로드 URL 응답 스키마
+
+    url로 fields와 file 필드를 multipart/form-data로 POST한 뒤,
+    POST /schedules/{id}/image에 key를 보내 일정에 연결한다.
+    """
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    key: str
+    url: str
+    fields: Dict[str, str]
+    expires_at: datetime = Field(..., alias="expiresAt", serialization_alias="expiresAt")
+
+
+class ImageUploadComplete(BaseModel):
+    """이미지 직접 업로드 완료 요청 스키마"""
+
+    key: str
+
+
+class ScheduleOccurrenceResponse(BaseModel):
+    """반복 일정 발생 응답 스키마"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    schedule_id: UUID = Field(..., alias="scheduleId", serialization_alias="scheduleId")
+    start_date: datetime = Field(..., alias="startDate", serialization_alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate", serialization_alias="endDate")
+
+
+class ScheduleSummaryBucket(BaseModel):
+    """일정 요약 구간 스키마
+
+    priorityMask는 구간에 있는 일정 우선순위의 비트 합이다 (high=1, medium=2, low=4, default=8).
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    date: date
+    count: int
+    priority_mask: int = Field(..., alias="priorityMask", serialization_alias="priorityMask")
+
+
+class ScheduleSummaryResponse(BaseModel):
+    """일정 요약 응답 스키마 (빈 구간은 생략)"""
+
+    granularity: Literal["day", "week"]
+    buckets: List[ScheduleSummaryBucket]
+
+
+class ScheduleImportJobResponse(BaseModel):
+    """일정 가져오기 작업 응답 스키마"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    id: UUID
+    status: ImportJobStatus
+    filename: Optional[str] = None
+    total_bytes: int = Field(..., alias="totalBytes", serialization_alias="totalBytes")
+    processed_bytes: int = Field(..., alias="processedBytes", serialization_alias="processedBytes")
+    imported: int
+    skipped: int
+    simplified: int
+    error: Optional[str] = None
+    created_at: datetime = Field(..., alias="createdAt", serialization_alias="createdAt")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt", serialization_alias="finishedAt")
+
+
 class ScheduleListResponse(BaseModel):
     """일정 목록 응답 스키마"""
 
     items: List[ScheduleResponse]
-    total: int
+    total: Optional[int]
+    total_exact: bool = True
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class ScheduleFilter(BaseModel):
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import random
+import smtplib
+from email.message import EmailMessage
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.services.reminder_service import PermanentDeliveryError, ReminderMessage
+from app.utils.batching import next_batch
+
+logger = logging.getLogger(__name__)
+
+
+def _header_text(value: str) -> str:
+    """헤더에 넣을 수 없는 줄바꿈(CR/LF)을 공백으로 바꿈 (제목은 여러 줄일 수 있다)"""
+    return " ".join(value.splitlines())
+
+
+def build_email(messages: Sequence[ReminderMessage]) -> EmailMessage:
+    """같은 수신자의 알림을 메일 한 통으로 작성 (여러 개면 다이제스트)"""
+    first = messages[0]
+    email = EmailMessage()
+    email["From"] = settings.EMAIL_FROM
+    email["To"] = first.email
+    if len(messages) == 1:
+        email["Subject"] = _header_text(f"[EZ Calendar] {first.title}")
+        lines = [f"{first.name}님, 곧 시작하는 일정이 있습니다.", ""]
+    else:
+        email["Subject"] = f"[EZ Calendar] 곧 시작하는 일정 {len(messages)}개"
+        lines = [f"{first.name}님, 곧 시작하는 일정이 {len(messages)}개 있습니다.", ""]
+
+    for message in sorted(messages, key=lambda m: m.occurrence_start):
+        lines.append(f"일정: {message.title}")
+        lines.append(f"시작: {message.occurrence_start:%Y-%m-%d %H:%M} (UTC)")
+        if message.location:
+            lines.append(f"장소: {message.location}")
+        lines.append("")
+    email.set_content("\n".join(lines).rstrip() + "\n")
+    return email
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """다시 보내도 성공할 수 없는 SMTP 오류인지 (5xx 응답, 수신자 거부)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+class SMTPPool:
+    """SMTP 연결 풀
+
+    연결을 메시지마다 새로 열지 않고 재사용하며, 동시에 보내는 연결 수를 size개로
+    제한한다. smtplib은 블로킹이므로 전송은 스레드 풀에서 실행한다. 서버가 유휴 연결을
+    끊었으면 한 번 다시 연결해 보낸다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        size: int,
+        use_tls: bool = False,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: float = 10,
+    ):
+        self.host = host
+        self.port = port
+        self.use_tls = use_tls
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: List[smtplib.SMTP] = []
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                connection.starttls()
+            if self.username:
+                connection.login(self.username, self.password or "")
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def _send(self, connection: Optional[smtplib.SMTP], email: EmailMessage) -> smtplib.SMTP:
+        """메일 전송 (블로킹), 다시 풀에 넣을 연결을 반환"""
+        if connection is not None:
+            try:
+                connection.send_message(email)
+                return connection
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                connection.close()
+            except Exception:
+                connection.close()
+                raise
+
+        connection = self._connect()
+        try:
+            connection.send_message(email)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    async def send(self, email: EmailMessage) -> None:
+        async with self._semaphore:
+            connection = self._idle.pop() if self._idle else None
+            connection = await run_in_threadpool(self._send, connection, email)
+            self._idle.append(connection)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            try:
+                await run_in_threadpool(connection.quit)
+            except (smtplib.SMTPException, OSError):
+                connection.close()
+
+
+class EmailQueue:
+    """이메일 알림 발송 큐
+
+    send()로 들어온 알림을 첫 알림부터 window초 동안 모은 뒤 수신자별로 묶어
+    다이제스트 한 통으로 보낸다. 전송은 SMTPPool이 동시 연결 수를 제한하고,
+    일시적인 오류는 지수 백오프(지터 포함)로 max_attempts번까지 다시 시도한다.
+    send()는 해당 알림이 포함된 메일의 전송이 끝나거나 최종 실패할 때까지 기다린다.
+    영구 오류나 pool이 없는 경우(SMTP_HOST 미설정)는 PermanentDeliveryError로 실패한다.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[SMTPPool],
+        window: float,
+        batch_size: int,
+        digest_size: int,
+        max_attempts: int,
+        retry_base: float,
+    ):
+        self.pool = pool
+        self.window = window
+        self.batch_size = batch_size
+        self.digest_size = digest_size
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self._queue: "asyncio.Queue[Tuple[ReminderMessage, asyncio.Future]]" = asyncio.Queue()
+        self._collector: Optional[asyncio.Task] = None
+        self._sending: Set[asyncio.Task] = set()
+
+    async def send(self, message: ReminderMessage) -> None:
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, future))
+        await future
+
+    async def _collect(self) -> None:
+        while True:
+            batch = await next_batch(self._queue, self.batch_size, self.window)
+            groups: Dict[str, List[Tuple[ReminderMessage, asyncio.Future]]] = {}
+            for item in batch:
+                groups.setdefault(item[0].email, []).append(item)
+            for items in groups.values():
+                for start in range(0, len(items), self.digest_size):
+                    digest = items[start:start + self.digest_size]
+                    task = asyncio.create_task(self._deliver(digest))
+                    self._sending.add(task)
+                    task.add_done_callback(self._sending.discard)
+
+    async def _send_with_retry(self, email: EmailMessage) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self.pool.send(email)
+                return
+            except Exception as e:
+                if is_permanent_error(e):
+                    raise PermanentDeliveryError(str(e)) from e
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.retry_base * 2 ** (attempt - 1)
+                logger.info(
+                    "메일 전송 재시도 %d/%d (%.1f초 후): %s", attempt, self.max_attempts, delay, e
+                )
+                await asyncio.sleep(delay + random.uniform(0, self.retry_base))
+
+    async def _deliver(self, items: Sequence[Tuple[ReminderMessage, asyncio.Future]]) -> None:
+        try:
+            email = build_email([message for message, _ in items])
+            if self.pool is None:
+                raise PermanentDeliveryError("SMTP가 설정되지 않아 메일을 보낼 수 없습니다.")
+            await self._send_with_retry(email)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in items:
+                if not future.done():
+                    future.set_result(None)
+
+    async def close(self) -> None:
+        if self._collector is not None:
+            self._collector.cancel()
+            self._collector = None
+        for task in list(self._sending):
+            task.cancel()
+        if self.pool is not None:
+            await self.pool.close()
+
+
+_email_queue: Optional[EmailQueue] = None
+
+
+def get_email_queue() -> EmailQueue:
+    """이메일 발송 큐 조회 (처음 호출 시 설정에 따라 생성)"""
+    global _email_queue
+    if _email_queue is None:
+        pool = None
+        if settings.SMTP_HOST:
+            pool = SMTPPool(
+                settings.SMTP_HOST,
+                settings.SMTP_PORT,
+                settings.SMTP_POOL_SIZE,
+                use_tls=settings.SMTP_USE_TLS,
+                username=settings.SMTP_USERNAME,
+                password=settings.SMTP_PASSWORD,
+                timeout=settings.SMTP_TIMEOUT,
+            )
+        _email_queue = EmailQueue(
+            pool,
+            window=settings.EMAIL_BATCH_WINDOW_SECONDS,
+            batch_size=settings.EMAIL_BATCH_SIZE,
+            digest_size=settings.EMAIL_DIGEST_MAX_ITEMS,
+            max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+            retry_base=settings.EMAIL_RETRY_BASE_SECONDS,
+        )
+    return _email_queue
+
+
+async def close_email_queue() -> None:
+    """이메일 발송 큐 종료 (앱 종료 시 호출)"""
+    global _email_queue
+    if _email_queue is not None:
+        await _email_queue.close()
+        _email_queue = None
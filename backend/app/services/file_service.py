@@ -1,14 +1,102 @@
+import asyncio
+import logging
+import multiprocessing
 import os
+import shutil
+import tempfile
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
 
 import boto3
+import magic
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from fastapi import UploadFile, HTTPException, status
-from PIL import Image
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.utils.images import RENDITIONS, ProcessedImage, process_image
+
+logger = logging.getLogger(__name__)
+
+# 운영 환경 이미지 키 접두사 (schedules/{user_id}/{파일명})
+IMAGE_KEY_PREFIX = "schedules/"
+
+# DeleteObjects 한 번에 삭제할 수 있는 최대 키 수
+S3_DELETE_BATCH_SIZE = 1000
+
+# 업로드 파일을 임시 파일로 복사할 때 한 번에 읽는 크기
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# 실제 파일 형식 판별에 쓰는 파일 앞부분 크기
+SNIFF_BYTES = 2048
+
+# S3 업로드 설정 (8MB를 넘는 파일은 멀티파트로 나눠 병렬 업로드)
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+# 직접 업로드된 원본 객체 키 접미사 (finalize 후 삭제, 남아 있으면 고아 이미지 정리 대상)
+DIRECT_UPLOAD_SUFFIX = ".upload"
+
+# 실제 MIME 타입 -> 원본 저장 시 확장자
+IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+
+
+class UploadedImage(NamedTuple):
+    """업로드 결과"""
+
+    url: str  # 상세 렌디션 (이미지 처리에 실패했으면 원본)
+    renditions: Optional[Dict[str, str]]  # 렌디션 이름 -> URL
+    placeholder: Optional[str]  # 미리보기 data URI
+
+
+class DirectUpload(NamedTuple):
+    """S3 직접 업로드 정보 (url로 fields와 file을 multipart/form-data POST)"""
+
+    key: str
+    url: str
+    fields: Dict[str, str]
+    expires_at: datetime
+
+
+_image_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_image_pool() -> ProcessPoolExecutor:
+    """이미지 처리 프로세스 풀 조회 (처음 호출 시 생성)
+
+    디코딩/리사이즈/인코딩은 GIL을 오래 잡으므로 스레드가 아닌 프로세스에서 실행한다.
+    이벤트 루프 스레드가 있는 프로세스를 fork하지 않도록 spawn으로 시작한다.
+    """
+    global _image_pool
+    if _image_pool is None:
+        _image_pool = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _image_pool
+
+
+def close_image_pool() -> None:
+    """이미지 처리 프로세스 풀 종료 (앱 종료 시 호출)"""
+    global _image_pool
+    if _image_pool is not None:
+        _image_pool.shutdown(wait=False, cancel_futures=True)
+        _image_pool = None
 
 
 class FileService:
@@ -26,6 +114,16 @@ class FileService:
                 endpoint_url=settings.AWS_S3_ENDPOINT_URL,
             )
             self.bucket = settings.AWS_S3_BUCKET
+            # presigned URL은 클라이언트가 접속할 주소로 서명해야 한다 (서명에 호스트가 포함됨)
+            self.presign_client = self.s3_client
+            if settings.AWS_S3_PUBLIC_ENDPOINT_URL:
+                self.presign_client = boto3.client(
+                    "s3",
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_REGION,
+                    endpoint_url=settings.AWS_S3_PUBLIC_ENDPOINT_URL,
+                )
         else:
             # 개발 환경: 로컬 uploads 폴더 사용
             self.upload_dir = Path("uploads")
@@ -39,131 +137,335 @@ class FileService:
                 detail=f"허용되지 않는 파일 형식입니다. 허용: {', '.join(settings.ALLOWED_IMAGE_TYPES)}",
             )
 
-    def _generate_filename(self, user_id: uuid.UUID, filename: str) -> str:
-        """파일명 생성"""
-        ext = filename.rsplit(".", 1)[-1] if "." in filename else "jpg"
+    def _generate_stem(self, user_id: uuid.UUID) -> str:
+        """새 이미지의 저장소 키 (확장자 제외, 렌디션은 여기에 접미사/확장자를 붙인다)"""
         unique_id = uuid.uuid4().hex[:8]
-        return f"{user_id}_{unique_id}.{ext}"
+        if self.is_dev:
+            return f"{user_id}/{user_id}_{unique_id}"
+        return f"{IMAGE_KEY_PREFIX}{user_id}/{unique_id}"
 
-    def _generate_key(self, user_id: uuid.UUID, filename: str) -> str:
-        """S3 키 생성"""
-        ext = filename.rsplit(".", 1)[-1] if "." in filename else "jpg"
-        unique_id = uuid.uuid4().hex[:8]
-        return f"schedules/{user_id}/{unique_id}.{ext}"
+    def _url_for_key(self, key: str) -> str:
+        """저장소 키의 공개 URL"""
+        if self.is_dev:
+            # 개발 환경 URL (API 서버에서 정적 파일 서빙)
+            return f"/uploads/{key}"
+        if settings.AWS_S3_ENDPOINT_URL:
+            # Local development (MinIO)
+            return f"{settings.AWS_S3_ENDPOINT_URL}/{self.bucket}/{key}"
+        return f"https://{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
 
-    async def _optimize_image(self, contents: bytes, file: UploadFile) -> bytes:
-        """이미지 최적화"""
+    async def _process_image(self, path: str) -> Optional[ProcessedImage]:
+        """이미지 처리 풀에서 렌디션 생성 (이미지를 읽을 수 없으면 None)"""
+        loop = asyncio.get_running_loop()
         try:
-            img = Image.open(BytesIO(contents))
-            # EXIF 회전 보정
-            if hasattr(img, "_getexif") and img._getexif():
-                from PIL import ImageOps
-                img = ImageOps.exif_transpose(img)
-
-            # 리사이즈 (최대 1920px)
-            max_size = (1920, 1920)
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-
-            # 최적화된 이미지를 바이트로 변환
-            buffer = BytesIO()
-            img_format = "JPEG" if img.mode == "RGB" else "PNG"
-            img.save(buffer, format=img_format, quality=85, optimize=True)
-            return buffer.getvalue()
+            return await loop.run_in_executor(get_image_pool(), process_image, path)
         except Exception:
-            # 이미지 처리 실패 시 원본 반환
-            return contents
+            logger.warning("이미지 처리 실패, 원본만 저장합니다.", exc_info=True)
+            return None
 
-    async def upload_image(self, file: UploadFile, user_id: uuid.UUID) -> str:
-        """이미지 업로드"""
+    def _spool(self, source: BinaryIO) -> Tuple[str, str]:
+        """업로드 파일을 임시 파일로 나눠 복사 (블로킹, 반환값: (경로, 실제 MIME 타입))
+
+        앞부분으로 실제 형식을 확인하고, 복사 중 크기 제한을 넘으면 바로 중단한다.
+        """
+        target = tempfile.NamedTemporaryFile(prefix="ez-image-", delete=False)
+        try:
+            with target:
+                head = source.read(SNIFF_BYTES)
+                content_type = magic.from_buffer(head, mime=True)
+                if content_type not in settings.ALLOWED_IMAGE_TYPES:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"허용되지 않는 파일 형식입니다. 허용: {', '.join(settings.ALLOWED_IMAGE_TYPES)}",
+                    )
+                size = len(head)
+                target.write(head)
+                while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > settings.MAX_FILE_SIZE:
+                        raise self._too_large()
+                    target.write(chunk)
+        except BaseException:
+            os.unlink(target.name)
+            raise
+        return target.name, content_type
+
+    @staticmethod
+    def _too_large() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"파일 크기는 {settings.MAX_FILE_SIZE // (1024 * 1024)}MB 이하여야 합니다.",
+        )
+
+    async def upload_image(self, file: UploadFile, user_id: uuid.UUID) -> UploadedImage:
+        """이미지 업로드 (상세/썸네일 렌디션과 WebP 버전, 미리보기 생성)
+
+        파일 전체를 메모리에 올리지 않는다. 임시 파일로 나눠 복사한 뒤 이미지 처리
+        프로세스가 그 파일을 직접 읽는다.
+        """
         self._validate_image(file)
+        if file.size is not None and file.size > settings.MAX_FILE_SIZE:
+            raise self._too_large()
+
+        path, content_type = await run_in_threadpool(self._spool, file.file)
+        try:
+            return await self._save_image(path, content_type, user_id)
+        finally:
+            await run_in_threadpool(os.unlink, path)
+
+    async def _save_image(self, path: str, content_type: str, user_id: uuid.UUID) -> UploadedImage:
+        """임시 파일로 받은 이미지의 렌디션을 만들어 저장"""
+        processed = await self._process_image(path)
+        stem = self._generate_stem(user_id)
+        if processed is None:
+            # 이미지 처리 실패 시 원본만 저장
+            key = f"{stem}.{IMAGE_EXTENSIONS.get(content_type, 'jpg')}"
+            await self._store(key, path, content_type)
+            return UploadedImage(self._url_for_key(key), None, None)
+
+        keys = {
+            rendition.name: f"{stem}{rendition.suffix}.{rendition.ext}"
+            for rendition in processed.renditions
+        }
+        await asyncio.gather(
+            *(
+                self._store(keys[rendition.name], rendition.data, rendition.content_type)
+                for rendition in processed.renditions
+            )
+        )
+        urls = {name: self._url_for_key(key) for name, key in keys.items()}
+        return UploadedImage(urls["detail"], urls, processed.placeholder)
+
+    def _require_s3(self) -> None:
+        if self.is_dev:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="직접 업로드는 S3 저장소를 사용할 때만 지원합니다.",
+            )
+
+    def create_direct_upload(
+        self, user_id: uuid.UUID, content_type: str, size: Optional[int] = None
+    ) -> DirectUpload:
+        """S3에 직접 올릴 presigned POST 발급
 
-        # 파일 크기 확인
-        contents = await file.read()
-        if len(contents) > settings.MAX_FILE_SIZE:
+        키는 schedules/{user_id}/ 아래로 고정되고, 정책 조건으로 Content-Type과 크기
+        (MAX_FILE_SIZE 이하)를 제한한다. 올린 파일은 finalize_direct_upload()로 검증/처리한다.
+        finalize하지 않은 파일은 고아 이미지 정리에서 삭제된다.
+        """
+        self._require_s3()
+        if content_type not in settings.ALLOWED_IMAGE_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"파일 크기는 {settings.MAX_FILE_SIZE // (1024 * 1024)}MB 이하여야 합니다.",
+                detail=f"허용되지 않는 파일 형식입니다. 허용: {', '.join(settings.ALLOWED_IMAGE_TYPES)}",
             )
+        if size is not None and size > settings.MAX_FILE_SIZE:
+            raise self._too_large()
 
-        # 이미지 최적화
-        contents = await self._optimize_image(contents, file)
+        key = f"{self._generate_stem(user_id)}{DIRECT_UPLOAD_SUFFIX}"
+        expires_in = settings.DIRECT_UPLOAD_EXPIRE_SECONDS
+        post = self.presign_client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, settings.MAX_FILE_SIZE],
+            ],
+            ExpiresIn=expires_in,
+        )
+        expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+        return DirectUpload(key, post["url"], post["fields"], expires_at)
 
-        if self.is_dev:
-            # 개발 환경: 로컬 파일 시스템에 저장
-            return await self._upload_local(contents, user_id, file.filename or "image.jpg")
-        else:
-            # 운영 환경: S3에 업로드
-            return await self._upload_s3(contents, user_id, file.filename or "image.jpg", file.content_type)
-
-    async def _upload_local(self, contents: bytes, user_id: uuid.UUID, filename: str) -> str:
-        """로컬 파일 시스템에 업로드 (개발용)"""
-        # 사용자별 폴더 생성
-        user_dir = self.upload_dir / str(user_id)
-        user_dir.mkdir(exist_ok=True)
-
-        # 파일 저장
-        new_filename = self._generate_filename(user_id, filename)
-        file_path = user_dir / new_filename
-        
-        with open(file_path, "wb") as f:
-            f.write(contents)
+    def _is_direct_upload_key(self, user_id: uuid.UUID, key: str) -> bool:
+        prefix = f"{IMAGE_KEY_PREFIX}{user_id}/"
+        name = key[len(prefix):]
+        return key.startswith(prefix) and "/" not in name and name.endswith(DIRECT_UPLOAD_SUFFIX)
 
-        # 개발 환경 URL 반환 (API 서버에서 정적 파일 서빙)
-        return f"/uploads/{user_id}/{new_filename}"
+    def _download(self, key: str) -> Tuple[str, str]:
+        """직접 업로드된 객체를 임시 파일로 받기 (블로킹, 반환값은 _spool()과 같다)"""
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="업로드된 파일을 찾을 수 없습니다.",
+                ) from e
+            raise
+        if response["ContentLength"] > settings.MAX_FILE_SIZE:
+            response["Body"].close()
+            raise self._too_large()
+        with response["Body"] as body:
+            return self._spool(body)
+
+    async def finalize_direct_upload(self, user_id: uuid.UUID, key: str) -> UploadedImage:
+        """직접 업로드된 파일 검증 후 렌디션 생성 (원본 업로드 객체는 삭제)
 
-    async def _upload_s3(self, contents: bytes, user_id: uuid.UUID, filename: str, content_type: str) -> str:
-        """S3에 업로드 (운영용)"""
-        key = self._generate_key(user_id, filename)
+        presigned 정책과 별개로 실제 형식과 크기를 다시 확인한다.
+        """
+        self._require_s3()
+        if not self._is_direct_upload_key(user_id, key):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 업로드 키입니다.",
+            )
 
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=contents,
-                ContentType=content_type,
+            path, content_type = await run_in_threadpool(self._download, key)
+        except HTTPException as e:
+            if e.status_code != status.HTTP_404_NOT_FOUND:
+                # 형식/크기가 맞지 않는 파일은 남겨 둘 이유가 없다
+                await self.delete_keys([key])
+            raise
+        try:
+            uploaded = await self._save_image(path, content_type, user_id)
+        finally:
+            await run_in_threadpool(os.unlink, path)
+        await self.delete_keys([key])
+        return uploaded
+
+    def _put(self, key: str, body: Union[bytes, str], content_type: str) -> None:
+        """저장소에 파일 저장 (블로킹, body는 파일 내용 또는 파일 경로)
+
+        운영 환경은 S3_TRANSFER_CONFIG에 따라 큰 파일을 멀티파트로 나눠 올린다.
+        """
+        stream = BytesIO(body) if isinstance(body, bytes) else open(body, "rb")
+        with stream:
+            if self.is_dev:
+                # 개발 환경: 로컬 파일 시스템 (사용자별 폴더)
+                path = self.upload_dir / key
+                path.parent.mkdir(exist_ok=True)
+                with open(path, "wb") as target:
+                    shutil.copyfileobj(stream, target)
+                return
+
+            self.s3_client.upload_fileobj(
+                stream,
+                self.bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=S3_TRANSFER_CONFIG,
             )
-        except ClientError as e:
+
+    async def _store(self, key: str, body: Union[bytes, str], content_type: str) -> None:
+        """저장소에 파일 저장 (스레드 풀에서 실행)"""
+        try:
+            await run_in_threadpool(self._put, key, body, content_type)
+        except (ClientError, S3UploadFailedError) as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"파일 업로드 실패: {str(e)}",
             )
 
-        # URL 생성
-        if settings.AWS_S3_ENDPOINT_URL:
-            # Local development (MinIO)
-            return f"{settings.AWS_S3_ENDPOINT_URL}/{self.bucket}/{key}"
+    def key_for_url(self, image_url: str) -> Optional[str]:
+        """이미지 URL을 저장소 키로 변환 (개발: {user_id}/{파일명}, 운영: schedules/{user_id}/{파일명})
+
+        엔드포인트 설정이 바뀌어도 같은 키가 나오도록 URL 경로만 사용한다.
+        이 서비스가 만든 URL이 아니면 None을 반환한다.
+        """
+        path = urlparse(image_url).path.lstrip("/")
+        if self.is_dev:
+            prefix = "uploads/"
         else:
-            return f"https://{self.bucket}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
+            # path-style URL (MinIO 등)은 버킷 이름으로 시작한다
+            if path.startswith(f"{self.bucket}/"):
+                path = path[len(self.bucket) + 1:]
+            prefix = ""
+        if not path.startswith(prefix):
+            return None
+        key = path[len(prefix):]
+        if not self.is_dev and not key.startswith(IMAGE_KEY_PREFIX):
+            return None
+        return key or None
+
+    @staticmethod
+    def rendition_keys(key: str) -> List[str]:
+        """이미지 키와 같은 업로드에서 만들어진 모든 렌디션 키 (없는 키도 포함될 수 있음)"""
+        stem, _, ext = key.rpartition(".")
+        if not stem:
+            return [key]
+        keys = dict.fromkeys([key])
+        for _, suffix in RENDITIONS.values():
+            for rendition_ext in (ext, "webp"):
+                keys[f"{stem}{suffix}.{rendition_ext}"] = None
+        return list(keys)
 
     async def delete_image(self, image_url: str) -> bool:
-        """이미지 삭제"""
+        """이미지 삭제 (렌디션 포함)"""
+        return await self.delete_images([image_url]) > 0
+
+    async def delete_images(self, image_urls: Sequence[str]) -> int:
+        """이미지 일괄 삭제 (렌디션 포함, 삭제 요청한 키 개수 반환)"""
+        keys = [
+            rendition_key
+            for key in map(self.key_for_url, image_urls)
+            if key
+            for rendition_key in self.rendition_keys(key)
+        ]
+        return await self.delete_keys(keys)
+
+    async def delete_keys(self, keys: Sequence[str]) -> int:
+        """저장소 키 일괄 삭제 (운영: DeleteObjects 1,000개 단위)"""
+        if not keys:
+            return 0
         if self.is_dev:
-            return await self._delete_local(image_url)
-        else:
-            return await self._delete_s3(image_url)
+            return await run_in_threadpool(self._delete_local, keys)
+
+        deleted = 0
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            chunk = keys[start:start + S3_DELETE_BATCH_SIZE]
+            try:
+                response = await run_in_threadpool(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+                )
+            except ClientError:
+                logger.warning("S3 이미지 일괄 삭제 실패 (%d개)", len(chunk), exc_info=True)
+                continue
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.warning("S3 이미지 삭제 실패: %s (%s)", error.get("Key"), error.get("Code"))
+            deleted += len(chunk) - len(errors)
+        return deleted
 
-    async def _delete_local(self, image_url: str) -> bool:
+    def _delete_local(self, keys: Sequence[str]) -> int:
         """로컬 파일 삭제 (개발용)"""
-        try:
-            # URL에서 경로 추출: /uploads/user_id/filename
-            relative_path = image_url.lstrip("/")
-            file_path = Path(relative_path)
-            if file_path.exists():
-                file_path.unlink()
-            return True
-        except Exception:
-            return False
+        deleted = 0
+        for key in keys:
+            try:
+                (self.upload_dir / key).unlink(missing_ok=True)
+                deleted += 1
+            except OSError:
+                logger.warning("로컬 이미지 삭제 실패: %s", key, exc_info=True)
+        return deleted
 
-    async def _delete_s3(self, image_url: str) -> bool:
-        """S3 파일 삭제 (운영용)"""
-        try:
-            # URL에서 키 추출
-            if settings.AWS_S3_ENDPOINT_URL:
-                key = image_url.replace(f"{settings.AWS_S3_ENDPOINT_URL}/{self.bucket}/", "")
-            else:
-                key = image_url.split(f".amazonaws.com/")[-1]
-
-            self.s3_client.delete_object(Bucket=self.bucket, Key=key)
-            return True
-        except ClientError:
-            return False
+    async def iter_image_keys(self) -> AsyncIterator[List[Tuple[str, datetime]]]:
+        """저장된 이미지의 (키, 마지막 수정 시각(UTC)) 목록을 페이지 단위로 조회"""
+        if self.is_dev:
+            for user_dir in sorted(self.upload_dir.iterdir()):
+                if not user_dir.is_dir():
+                    continue
+                yield [
+                    (
+                        f"{user_dir.name}/{path.name}",
+                        datetime.utcfromtimestamp(path.stat().st_mtime),
+                    )
+                    for path in sorted(user_dir.iterdir())
+                    if path.is_file()
+                ]
+            return
+
+        pages = iter(
+            self.s3_client.get_paginator("list_objects_v2").paginate(
+                Bucket=self.bucket, Prefix=IMAGE_KEY_PREFIX
+            )
+        )
+        while True:
+            page = await run_in_threadpool(next, pages, None)
+            if page is None:
+                return
+            yield [
+                (item["Key"], item["LastModified"].astimezone(timezone.utc).replace(tzinfo=None))
+                for item in page.get("Contents", [])
+            ]
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import after_commit, async_session_maker, engine
+from app.models.schedule import Schedule
+from app.services.file_service import S3_DELETE_BATCH_SIZE, FileService
+from app.utils.batching import next_batch
+from app.utils.images import image_stem
+
+logger = logging.getLogger(__name__)
+
+# 고아 이미지 정리를 한 프로세스에서만 실행하기 위한 advisory lock 키
+IMAGE_GC_LOCK_ID = 0x657A_696D  # "ezim"
+
+# 종료 시 남은 삭제 요청을 처리하는 최대 대기 시간 (초)
+DRAIN_TIMEOUT_SECONDS = 5
+
+
+class ImageCleanupQueue:
+    """이미지 삭제 큐
+
+    요청은 삭제할 URL을 넣기만 하고 바로 반환한다. 백그라운드 작업이 window초 동안
+    모은 URL을 DeleteObjects 한 번(최대 1,000개)으로 삭제한다. 프로세스가 종료되어
+    처리하지 못한 삭제는 고아 이미지 정리(ImageGarbageCollector)가 다시 처리한다.
+    """
+
+    def __init__(self, file_service: Optional[FileService] = None, window: float = 1.0):
+        self.file_service = file_service or FileService()
+        self.window = window
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, image_urls: Iterable[str]) -> None:
+        """삭제할 이미지 URL 추가 (기다리지 않음)"""
+        for image_url in image_urls:
+            if image_url:
+                self._queue.put_nowait(image_url)
+        if self._task is None and not self._queue.empty():
+            self._task = asyncio.create_task(self._run())
+
+    async def _delete(self, image_urls: List[str]) -> None:
+        try:
+            await self.file_service.delete_images(image_urls)
+        except Exception:
+            logger.exception(
+                "이미지 삭제 실패 (%d개, 고아 이미지 정리에서 다시 처리)", len(image_urls)
+            )
+
+    async def _run(self) -> None:
+        while True:
+            batch = await next_batch(self._queue, S3_DELETE_BATCH_SIZE, self.window)
+            await self._delete(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        """남은 삭제 요청을 처리한 뒤 백그라운드 작업 종료"""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("종료 전에 이미지 %d개를 삭제하지 못했습니다.", self._queue.qsize())
+        self._task.cancel()
+        self._task = None
+
+
+class ImageGarbageCollector:
+    """고아 이미지 정리
+
+    저장소 목록을 페이지 단위로 읽어, 어떤 일정의 image_url도 가리키지 않는 이미지를
+    삭제한다. 각 페이지에 나온 사용자의 image_url만 user_id 인덱스로 조회하므로 일정
+    테이블 전체를 읽지 않는다. 업로드 직후 아직 일정에 연결되지 않은 이미지를 지우지
+    않도록 IMAGE_GC_GRACE_SECONDS보다 오래된 이미지만 대상으로 한다.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        file_service: Optional[FileService] = None,
+    ):
+        self.session_maker = session_maker
+        self.file_service = file_service or FileService()
+
+    @staticmethod
+    def _user_id(key: str) -> Optional[UUID]:
+        parts = key.split("/")
+        try:
+            return UUID(parts[-2]) if len(parts) >= 2 else None
+        except ValueError:
+            return None
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """한 번 정리하고 삭제한 이미지 수를 반환"""
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=settings.IMAGE_GC_GRACE_SECONDS)
+        deleted = 0
+        async for page in self.file_service.iter_image_keys():
+            candidates = {}
+            for key, modified in page:
+                user_id = self._user_id(key)
+                if modified < cutoff and user_id is not None:
+                    candidates[key] = user_id
+            if not candidates:
+                continue
+            async with self.session_maker() as session:
+                result = await session.execute(
+                    select(Schedule.image_url).where(
+                        and_(
+                            Schedule.user_id.in_(set(candidates.values())),
+                            Schedule.image_url.is_not(None),
+                        )
+                    )
+                )
+                # 렌디션(썸네일, WebP)은 확장자/접미사를 뺀 공통 부분으로 비교한다
+                referenced = {
+                    image_stem(key)
+                    for key in map(self.file_service.key_for_url, result.scalars())
+                    if key
+                }
+            orphans = [key for key in candidates if image_stem(key) not in referenced]
+            if orphans:
+                deleted += await self.file_service.delete_keys(orphans)
+        if deleted:
+            logger.info("고아 이미지 %d개 삭제", deleted)
+        return deleted
+
+
+async def run_image_gc() -> int:
+    """다른 프로세스가 실행 중이 아니면 고아 이미지를 정리 (삭제한 이미지 수 반환)"""
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        locked = await connection.scalar(select(func.pg_try_advisory_lock(IMAGE_GC_LOCK_ID)))
+        if not locked:
+            return 0
+        try:
+            return await ImageGarbageCollector().run_once()
+        finally:
+            await connection.execute(select(func.pg_advisory_unlock(IMAGE_GC_LOCK_ID)))
+
+
+async def _run_image_gc_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.IMAGE_GC_INTERVAL_SECONDS)
+        try:
+            await run_image_gc()
+        except Exception:
+            logger.exception("고아 이미지 정리 실패")
+
+
+_queue: Optional[ImageCleanupQueue] = None
+_gc_task: Optional[asyncio.Task] = None
+
+
+def get_image_cleanup_queue() -> ImageCleanupQueue:
+    """이미지 삭제 큐 조회 (처음 호출 시 생성)"""
+    global _queue
+    if _queue is None:
+        _queue = ImageCleanupQueue(window=settings.IMAGE_DELETE_BATCH_WINDOW_SECONDS)
+    return _queue
+
+
+def delete_images_after_commit(db: AsyncSession, image_urls: Iterable[str]) -> None:
+    """커밋된 뒤에 이미지 삭제를 큐에 넣도록 예약 (롤백되면 일정과 이미지가 함께 남는다)"""
+    image_urls = [image_url for image_url in image_urls if image_url]
+    if not image_urls:
+        return
+
+    async def enqueue() -> None:
+        get_image_cleanup_queue().enqueue(image_urls)
+
+    after_commit(db, enqueue)
+
+
+async def start_image_cleanup() -> None:
+    """고아 이미지 정리 주기 작업 시작 (앱 시작 시 호출)"""
+    global _gc_task
+    if settings.IMAGE_GC_ENABLED and _gc_task is None:
+        _gc_task = asyncio.create_task(_run_image_gc_periodically())
+
+
+async def stop_image_cleanup() -> None:
+    """주기 작업을 멈추고 남은 이미지 삭제 요청 처리 (앱 종료 시 호출)"""
+    global _queue, _gc_task
+    if _gc_task is not None:
+        _gc_task.cancel()
+        try:
+            await _gc_task
+        except asyncio.CancelledError:
+            pass
+        _gc_task = None
+    if _queue is not None:
+        await _queue.close()
+        _queue = None
@@ -0,0 +1,202 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.broker import OVERFLOW, Subscription, get_broker
+from app.core.config import settings
+from app.core.database import after_commit
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# 사용자 정보가 바뀌었음을 모든 워커에 알리는 채널 (메시지는 사용자 ID)
+INVALIDATE_CHANNEL = "auth:invalidate"
+
+# 구독 메시지 대기 주기 (초)
+LISTEN_TIMEOUT_SECONDS = 30
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class Principal(NamedTuple):
+    """인증된 사용자 정보 (비밀번호 해시 제외)"""
+
+    id: UUID
+    email: str
+    name: str
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            user.id,
+            user.email,
+            user.name,
+            user.is_active,
+            user.is_superuser,
+            user.created_at,
+            user.updated_at,
+        )
+
+    def to_user(self) -> User:
+        """세션에 속하지 않은 User 객체로 변환 (엔드포인트 코드가 그대로 쓸 수 있도록)"""
+        return User(**self._asdict())
+
+
+class _LRU(Generic[K, V]):
+    """항목별 만료 시각이 있는 LRU 맵"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PrincipalCache:
+    """인증 사용자 캐시 (프로세스 내 LRU + TTL)
+
+    토큰 캐시는 서명을 검증한 토큰의 사용자 ID를 토큰 만료 시각(exp)까지 보관해 JWT
+    디코딩을 건너뛰고, 사용자 캐시는 활성 여부/이름 등을 ttl초 동안 보관해 DB 조회를
+    건너뛴다. 사용자 수정/삭제 시 invalidate_on_write()가 로컬 항목을 지우고 커밋 후
+    INVALIDATE_CHANNEL로 다른 워커에도 알린다. 무효화 메시지를 놓쳐도 ttl초 뒤에는
+    DB 값이 반영된다.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.ttl = ttl
+        self._tokens: "_LRU[bytes, UUID]" = _LRU(max_size)
+        self._users: "_LRU[UUID, Principal]" = _LRU(max_size)
+        # 무효화될 때마다 증가 (DB에서 읽는 사이 무효화된 값을 캐시하지 않기 위해 사용)
+        self.generation = 0
+
+    @staticmethod
+    def _token_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get_token(self, token: str) -> Optional[UUID]:
+        """검증된 액세스 토큰의 사용자 ID 조회"""
+        return self._tokens.get(self._token_key(token))
+
+    def set_token(self, token: str, user_id: UUID, exp: float) -> None:
+        self._tokens.set(self._token_key(token), user_id, exp - time.time())
+
+    def get_user(self, user_id: UUID) -> Optional[Principal]:
+        return self._users.get(user_id)
+
+    def set_user(self, principal: Principal, generation: int) -> None:
+        """사용자 정보 저장 (조회를 시작한 뒤 무효화가 있었으면 저장하지 않음)"""
+        if generation == self.generation:
+            self._users.set(principal.id, principal, self.ttl)
+
+    def evict(self, user_id: Optional[UUID] = None) -> None:
+        """로컬 사용자 항목 삭제 (user_id가 없으면 전체)"""
+        self.generation += 1
+        if user_id is None:
+            self._users.clear()
+        else:
+            self._users.pop(user_id)
+
+    def invalidate_on_write(self, db: AsyncSession, user_id: UUID) -> None:
+        """지금 로컬 항목을 지우고, 커밋 이후 모든 워커에 무효화를 알리도록 예약
+
+        커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 커밋 이후에도 지운다.
+        """
+        self.evict(user_id)
+
+        async def publish() -> None:
+            self.evict(user_id)
+            await get_broker().publish(INVALIDATE_CHANNEL, str(user_id).encode())
+
+        after_commit(db, publish)
+
+    def handle(self, message: bytes) -> None:
+        """무효화 메시지 처리 (메시지가 유실되었으면 전체 삭제)"""
+        if message == OVERFLOW:
+            self.evict()
+            return
+        try:
+            self.evict(UUID(message.decode()))
+        except ValueError:
+            logger.warning("잘못된 사용자 무효화 메시지: %r", message)
+
+    async def listen(self, subscription: Subscription) -> None:
+        while True:
+            message = await subscription.get(LISTEN_TIMEOUT_SECONDS)
+            if message is not None:
+                self.handle(message)
+
+
+_principal_cache: Optional[PrincipalCache] = None
+_listener: Optional[asyncio.Task] = None
+_subscription: Optional[Subscription] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """인증 사용자 캐시 조회 (처음 호출 시 생성)"""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL
+        )
+    return _principal_cache
+
+
+async def start_principal_cache() -> None:
+    """다른 워커의 무효화 메시지 구독 시작 (init_broker 이후, 앱 시작 시 호출)"""
+    global _listener, _subscription
+    if _listener is None:
+        _subscription = await get_broker().subscribe(INVALIDATE_CHANNEL)
+        _listener = asyncio.create_task(get_principal_cache().listen(_subscription))
+
+
+async def stop_principal_cache() -> None:
+    """무효화 메시지 구독 종료 (앱 종료 시 호출)"""
+    global _listener, _subscription
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
+    if _subscription is not None:
+        await get_broker().unsubscribe(_subscription)
+        _subscription = None
@@ -0,0 +1,50 @@
+import json
+from typing import Dict, Protocol
+
+from app.core.broker import get_broker
+from app.models.schedule import ReminderType
+from app.services.email_service import get_email_queue
+from app.services.reminder_service import ReminderMessage
+from app.services.schedule_change_service import ScheduleChangeService
+
+
+class ReminderSender(Protocol):
+    """알림 타입별 발송기
+
+    실패하면 예외를 발생시키고, 다시 보내도 성공할 수 없으면 PermanentDeliveryError를 발생시킨다.
+    """
+
+    async def send(self, message: ReminderMessage) -> None:
+        ...
+
+
+class NotificationSender:
+    """앱 알림 발송 (사용자 변경 알림 채널로 발행해 /schedules/stream 구독자에게 전달)"""
+
+    async def send(self, message: ReminderMessage) -> None:
+        payload = json.dumps(
+            {
+                "type": "reminder",
+                "id": str(message.schedule_id),
+                "title": message.title,
+                "startDate": message.occurrence_start.isoformat(),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+        await get_broker().publish(ScheduleChangeService.channel(message.user_id), payload)
+
+
+class EmailSender:
+    """이메일 알림 발송 (이메일 발송 큐에서 수신자별로 묶어 전송)"""
+
+    async def send(self, message: ReminderMessage) -> None:
+        await get_email_queue().send(message)
+
+
+def default_senders() -> Dict[ReminderType, ReminderSender]:
+    """알림 타입별 기본 발송기"""
+    return {
+        ReminderType.NOTIFICATION: NotificationSender(),
+        ReminderType.EMAIL: EmailSender(),
+    }
@@ -0,0 +1,328 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import DateTime, and_, cast, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.broker import get_broker
+from app.core.config import settings
+from app.core.database import after_commit
+from app.models.schedule import (
+    ReminderDelivery,
+    ReminderDeliveryStatus,
+    ReminderType,
+    Schedule,
+    ScheduleReminder,
+    ScheduleRepeatType,
+)
+from app.models.user import User
+from app.utils.recurrence import next_occurrence
+
+# 발송 시각이 임박한 알림이 생기면 워커를 깨우는 채널
+WAKE_CHANNEL = "reminders:wake"
+
+# 같은 발생을 다시 고르지 않도록 다음 발생 계산에 더하는 최소 간격
+_EPSILON = timedelta(microseconds=1)
+
+
+class PermanentDeliveryError(Exception):
+    """다시 보내도 성공할 수 없는 알림 발송 실패 (재시도하지 않고 바로 실패로 기록)"""
+
+
+class ReminderMessage(NamedTuple):
+    """발송할 알림 (발송 기록 1건)"""
+
+    delivery_id: UUID
+    reminder_type: ReminderType
+    user_id: UUID
+    email: str
+    name: str
+    schedule_id: UUID
+    title: str
+    location: Optional[str]
+    occurrence_start: datetime
+
+
+def next_fire_at(
+    start_date: datetime,
+    repeat: ScheduleRepeatType,
+    repeat_end_date: Optional[datetime],
+    minutes_before: int,
+    after: datetime,
+) -> Optional[datetime]:
+    """after 이후(포함) 첫 발송 시각 (발생 시작 - minutes_before, 없으면 None)"""
+    lead = timedelta(minutes=minutes_before)
+    occ_start = next_occurrence(start_date, repeat, repeat_end_date, after + lead)
+    return occ_start - lead if occ_start else None
+
+
+def _chunks(items: Sequence[Any]) -> List[Sequence[Any]]:
+    size = settings.REMINDER_BATCH_SIZE
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+class ReminderService:
+    """알림 발송 일정 서비스
+
+    알림마다 다음 발송 시각(fire_at)을 미리 계산해 두고, 워커는 fire_at 부분 인덱스로
+    발송 시각이 된 알림만 FOR UPDATE SKIP LOCKED로 가져간다. 발송한 알림은 같은
+    트랜잭션에서 다음 발생의 발송 시각으로 옮기므로 테이블 전체를 훑지 않는다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _set_fire_at(self, items: Sequence[Tuple[UUID, Optional[datetime]]]) -> None:
+        """알림별 발송 시각을 UPDATE ... FROM (VALUES ...)로 일괄 갱신"""
+        table = ScheduleReminder.__table__
+        for chunk in _chunks(items):
+            changes = values(
+                column("id", table.c.id.type),
+                column("fire_at", table.c.fire_at.type),
+                name="changes",
+            ).data(list(chunk))
+            await self.db.execute(
+                update(ScheduleReminder)
+                .where(ScheduleReminder.id == changes.c.id)
+                # 첫 행이 NULL이면 VALUES 열이 text로 추론되므로 명시적으로 변환
+                .values(fire_at=cast(changes.c.fire_at, DateTime))
+                .execution_options(synchronize_session=False)
+            )
+
+    async def reschedule(self, schedule_ids: Sequence[UUID]) -> None:
+        """일정 알림의 발송 시각 재계산 (일정이나 알림이 바뀐 뒤 같은 트랜잭션에서 호출)
+
+        지금 이후의 발생만 대상으로 하므로 지난 발생의 알림은 다시 보내지 않는다.
+        발송 시각이 워커가 미리 읽어 둔 구간 안이면 커밋 이후 워커를 깨운다.
+        """
+        now = datetime.utcnow()
+        items: List[Tuple[UUID, Optional[datetime]]] = []
+        for chunk in _chunks(schedule_ids):
+            result = await self.db.execute(
+                select(
+                    ScheduleReminder.id,
+                    ScheduleReminder.minutes_before,
+                    Schedule.start_date,
+                    Schedule.repeat,
+                    Schedule.repeat_end_date,
+                )
+                .join(Schedule, ScheduleReminder.schedule_id == Schedule.id)
+                .where(ScheduleReminder.schedule_id.in_(chunk))
+            )
+            for reminder_id, minutes_before, start_date, repeat, repeat_end_date in result.all():
+                fire_at = next_fire_at(start_date, repeat, repeat_end_date, minutes_before, now)
+                items.append((reminder_id, fire_at))
+        if not items:
+            return
+        await self._set_fire_at(items)
+
+        horizon = now + timedelta(seconds=settings.REMINDER_HORIZON_SECONDS)
+        if any(fire_at is not None and fire_at <= horizon for _, fire_at in items):
+
+            async def wake() -> None:
+                await get_broker().publish(WAKE_CHANNEL, b"wake")
+
+            after_commit(self.db, wake)
+
+    async def upcoming(self, until: datetime, limit: int) -> List[Tuple[datetime, UUID]]:
+        """until까지 발송할 알림의 (발송 시각, ID) 목록 (fire_at 인덱스 범위 조회)"""
+        result = await self.db.execute(
+            select(ScheduleReminder.fire_at, ScheduleReminder.id)
+            .where(ScheduleReminder.fire_at <= until)
+            .order_by(ScheduleReminder.fire_at)
+            .limit(limit)
+        )
+        return list(result.tuples().all())
+
+    async def claim_due(
+        self, now: datetime, limit: int
+    ) -> Tuple[int, List[ReminderMessage]]:
+        """발송 시각이 된 알림을 가져가 발송 기록을 만들고 다음 발송 시각으로 이동
+
+        반환값은 (가져간 알림 수, 발송할 알림 목록)이다. 다른 워커가 잡고 있는 알림은
+        건너뛰고(SKIP LOCKED), 발송 기록은 (알림, 발생 시작)이 유일하므로 이미 기록된
+        발생은 다시 반환하지 않는다. 호출자는 커밋한 뒤에 반환된 알림을 발송하고
+        mark_sent/mark_failed로 결과를 기록해야 한다.
+        """
+        result = await self.db.execute(
+            select(
+                ScheduleReminder.id,
+                ScheduleReminder.reminder_type,
+                ScheduleReminder.minutes_before,
+                ScheduleReminder.fire_at,
+                Schedule.id.label("schedule_id"),
+                Schedule.user_id,
+                Schedule.title,
+                Schedule.location,
+                Schedule.start_date,
+                Schedule.repeat,
+                Schedule.repeat_end_date,
+                User.email,
+                User.name,
+            )
+            .join(Schedule, ScheduleReminder.schedule_id == Schedule.id)
+            .join(User, Schedule.user_id == User.id)
+            .where(ScheduleReminder.fire_at <= now)
+            .order_by(ScheduleReminder.fire_at)
+            .limit(limit)
+            .with_for_update(of=ScheduleReminder, skip_locked=True)
+        )
+        rows = result.all()
+        if not rows:
+            return 0, []
+
+        oldest = now - timedelta(minutes=settings.REMINDER_MAX_DELAY_MINUTES)
+        advanced: List[Tuple[UUID, Optional[datetime]]] = []
+        deliveries: List[Dict[str, Any]] = []
+        messages: Dict[UUID, ReminderMessage] = {}
+        for row in rows:
+            # 워커가 멈춰 있던 동안 지난 발생은 건너뛰고 앞으로의 발생으로 이동
+            after = max(row.fire_at, now) + _EPSILON
+            advanced.append(
+                (
+                    row.id,
+                    next_fire_at(
+                        row.start_date, row.repeat, row.repeat_end_date, row.minutes_before, after
+                    ),
+                )
+            )
+            if row.fire_at < oldest:
+                continue
+
+            delivery_id = uuid.uuid4()
+            occurrence_start = row.fire_at + timedelta(minutes=row.minutes_before)
+            deliveries.append(
+                {
+                    "id": delivery_id,
+                    "reminder_id": row.id,
+                    "schedule_id": row.schedule_id,
+                    "user_id": row.user_id,
+                    "reminder_type": row.reminder_type,
+                    "occurrence_start": occurrence_start,
+                    "status": ReminderDeliveryStatus.PENDING,
+                    "attempts": 1,
+                    "created_at": now,
+                    "claimed_at": now,
+                }
+            )
+            messages[delivery_id] = ReminderMessage(
+                delivery_id,
+                row.reminder_type,
+                row.user_id,
+                row.email,
+                row.name,
+                row.schedule_id,
+                row.title,
+                row.location,
+                occurrence_start,
+            )
+
+        inserted = set()
+        if deliveries:
+            stmt = (
+                insert(ReminderDelivery)
+                .values(deliveries)
+                .on_conflict_do_nothing(
+                    constraint="uq_reminder_deliveries_reminder_id_occurrence_start"
+                )
+                .returning(ReminderDelivery.id)
+            )
+            inserted = set((await self.db.execute(stmt)).scalars().all())
+        await self._set_fire_at(advanced)
+        return len(rows), [
+            message for delivery_id, message in messages.items() if delivery_id in inserted
+        ]
+
+    async def claim_retries(self, now: datetime, limit: int) -> List[ReminderMessage]:
+        """발송에 실패했거나 발송 도중 중단되어 pending으로 남은 기록을 다시 가져감
+
+        REMINDER_MAX_ATTEMPTS번 시도했거나, 너무 늦었거나, 일정이 삭제된 기록은
+        실패로 끝낸다.
+        """
+        retry_before = now - timedelta(seconds=settings.REMINDER_RETRY_SECONDS)
+        result = await self.db.execute(
+            select(
+                ReminderDelivery.id,
+                ReminderDelivery.reminder_type,
+                ReminderDelivery.user_id,
+                ReminderDelivery.schedule_id,
+                ReminderDelivery.occurrence_start,
+                ReminderDelivery.attempts,
+                Schedule.title,
+                Schedule.location,
+                User.email,
+                User.name,
+            )
+            .join(User, ReminderDelivery.user_id == User.id)
+            .outerjoin(Schedule, ReminderDelivery.schedule_id == Schedule.id)
+            .where(
+                and_(
+                    ReminderDelivery.status == ReminderDeliveryStatus.PENDING,
+                    ReminderDelivery.claimed_at <= retry_before,
+                )
+            )
+            .order_by(ReminderDelivery.claimed_at)
+            .limit(limit)
+            .with_for_update(of=ReminderDelivery, skip_locked=True)
+        )
+        rows = result.all()
+
+        oldest = now - timedelta(minutes=settings.REMINDER_MAX_DELAY_MINUTES)
+        messages = []
+        for row in rows:
+            if row.title is None:
+                await self.mark_failed(row.id, "일정이 삭제되었습니다.", final=True)
+            elif row.attempts >= settings.REMINDER_MAX_ATTEMPTS or row.occurrence_start < oldest:
+                await self.mark_failed(row.id, None, final=True)
+            else:
+                messages.append(
+                    ReminderMessage(
+                        row.id,
+                        row.reminder_type,
+                        row.user_id,
+                        row.email,
+                        row.name,
+                        row.schedule_id,
+                        row.title,
+                        row.location,
+                        row.occurrence_start,
+                    )
+                )
+        if messages:
+            await self.db.execute(
+                update(ReminderDelivery)
+                .where(ReminderDelivery.id.in_([message.delivery_id for message in messages]))
+                .values(attempts=ReminderDelivery.attempts + 1, claimed_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        return messages
+
+    async def mark_sent(self, delivery_ids: Sequence[UUID]) -> None:
+        """발송 완료 기록"""
+        if not delivery_ids:
+            return
+        await self.db.execute(
+            update(ReminderDelivery)
+            .where(ReminderDelivery.id.in_(delivery_ids))
+            .values(status=ReminderDeliveryStatus.SENT, error=None, delivered_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_failed(self, delivery_id: UUID, error: Optional[str], final: bool = False) -> None:
+        """발송 실패 기록 (final이 아니면 pending으로 남겨 REMINDER_RETRY_SECONDS 뒤 재시도)"""
+        changes: Dict[str, Any] = {}
+        if error is not None:
+            changes["error"] = error[:1000]
+        if final:
+            changes["status"] = ReminderDeliveryStatus.FAILED
+        if not changes:
+            return
+        await self.db.execute(
+            update(ReminderDelivery)
+            .where(ReminderDelivery.id == delivery_id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,163 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.broker import get_broker
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.schedule import ReminderType
+from app.services.reminder_delivery import ReminderSender, default_senders
+from app.services.reminder_service import (
+    WAKE_CHANNEL,
+    PermanentDeliveryError,
+    ReminderMessage,
+    ReminderService,
+)
+
+logger = logging.getLogger(__name__)
+
+# 워커 오류 후 다시 시도하기까지 대기 시간 (초)
+ERROR_BACKOFF_SECONDS = 5
+
+
+class ReminderWorker:
+    """알림 발송 워커
+
+    REMINDER_HORIZON_SECONDS 안에 발송할 알림의 (발송 시각, ID)만 fire_at 인덱스로 읽어
+    힙에 두고, 가장 이른 발송 시각까지 잠들었다가 그때 발송 시각이 된 알림을 배치로
+    가져간다. 힙은 대기 시간을 정하는 데만 쓰고 실제 대상은 DB에서 다시 고르므로, 여러
+    프로세스에서 워커를 실행해도 SKIP LOCKED와 발송 기록의 유일 제약으로 한 번만 발송된다.
+    구간 안에 새 알림이 생기면 WAKE_CHANNEL 메시지로 깨어나 구간을 다시 읽는다.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        senders: Optional[Dict[ReminderType, ReminderSender]] = None,
+    ):
+        self.session_maker = session_maker
+        self.senders = senders or default_senders()
+        self._heap: List[Tuple[datetime, UUID]] = []
+
+    async def _load(self, now: datetime) -> datetime:
+        """다음 구간의 알림을 힙으로 읽고, 구간을 다시 읽어야 하는 시각을 반환"""
+        horizon = now + timedelta(seconds=settings.REMINDER_HORIZON_SECONDS)
+        async with self.session_maker() as session:
+            # fire_at 순으로 정렬된 목록은 그대로 힙이다
+            self._heap = await ReminderService(session).upcoming(
+                horizon, settings.REMINDER_HORIZON_LIMIT
+            )
+        if len(self._heap) >= settings.REMINDER_HORIZON_LIMIT:
+            # 구간을 다 읽지 못했으면 읽은 마지막 알림 이후 다시 읽는다
+            return min(horizon, self._heap[-1][0])
+        return horizon
+
+    async def _deliver(self, messages: Sequence[ReminderMessage]) -> None:
+        """알림을 동시에 발송하고 결과를 기록"""
+        results = await asyncio.gather(
+            *(self.senders[message.reminder_type].send(message) for message in messages),
+            return_exceptions=True,
+        )
+        async with self.session_maker() as session:
+            service = ReminderService(session)
+            await service.mark_sent(
+                [
+                    message.delivery_id
+                    for message, result in zip(messages, results, strict=True)
+                    if not isinstance(result, Exception)
+                ]
+            )
+            for message, result in zip(messages, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.warning("알림 발송 실패: %s", message.delivery_id, exc_info=result)
+                    # 영구 오류는 재시도해도 성공할 수 없으므로 바로 실패로 기록한다
+                    await service.mark_failed(
+                        message.delivery_id,
+                        str(result) or type(result).__name__,
+                        final=isinstance(result, PermanentDeliveryError),
+                    )
+            await session.commit()
+
+    async def dispatch(self, now: datetime) -> int:
+        """now까지 발송 시각이 된 알림을 모두 발송 (발송한 건수 반환)"""
+        sent = 0
+        while True:
+            async with self.session_maker() as session:
+                claimed, messages = await ReminderService(session).claim_due(
+                    now, settings.REMINDER_BATCH_SIZE
+                )
+                await session.commit()
+            if messages:
+                await self._deliver(messages)
+                sent += len(messages)
+            if claimed < settings.REMINDER_BATCH_SIZE:
+                return sent
+
+    async def retry(self, now: datetime) -> int:
+        """실패했거나 중단되어 남은 발송 기록을 다시 발송 (발송 시도 건수 반환)"""
+        async with self.session_maker() as session:
+            messages = await ReminderService(session).claim_retries(
+                now, settings.REMINDER_BATCH_SIZE
+            )
+            await session.commit()
+        if messages:
+            await self._deliver(messages)
+        return len(messages)
+
+    async def run(self) -> None:
+        """워커 루프 (취소될 때까지 실행)"""
+        broker = get_broker()
+        subscription = await broker.subscribe(WAKE_CHANNEL)
+        next_load = datetime.min
+        try:
+            while True:
+                try:
+                    now = datetime.utcnow()
+                    if now >= next_load:
+                        await self.retry(now)
+                        next_load = await self._load(now)
+                    if self._heap and self._heap[0][0] <= now:
+                        await self.dispatch(now)
+                        while self._heap and self._heap[0][0] <= now:
+                            heapq.heappop(self._heap)
+                        continue
+
+                    wake_at = min(next_load, self._heap[0][0]) if self._heap else next_load
+                    timeout = max(0.0, (wake_at - now).total_seconds())
+                    if await subscription.get(timeout=timeout) is not None:
+                        # 구간 안에 새 알림이 생겼으므로 다시 읽는다
+                        next_load = datetime.min
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("알림 발송 워커 오류")
+                    await asyncio.sleep(ERROR_BACKOFF_SECONDS)
+        finally:
+            await broker.unsubscribe(subscription)
+
+
+_worker_task: Optional[asyncio.Task] = None
+
+
+async def start_reminder_worker() -> None:
+    """알림 발송 워커 시작 (앱 시작 시 호출, REMINDER_WORKER_ENABLED가 꺼져 있으면 무시)"""
+    global _worker_task
+    if settings.REMINDER_WORKER_ENABLED and _worker_task is None:
+        _worker_task = asyncio.create_task(ReminderWorker().run())
+
+
+async def stop_reminder_worker() -> None:
+    """알림 발송 워커 종료 (앱 종료 시 호출)"""
+    global _worker_task
+    if _worker_task is not None:
+        _worker_task.cancel()
+        try:
+            await _worker_task
+        except asyncio.CancelledError:
+            pass
+        _worker_task = None
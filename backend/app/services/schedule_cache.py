@@ -0,0 +1,136 @@
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import CacheBackend, get_cache
+from app.core.config import settings
+from app.core.database import after_commit
+from app.services.schedule_count_service import ScheduleCountService
+
+# 버전 키는 데이터 키보다 훨씬 오래 유지해 이전 버전 데이터와 섞이지 않게 한다
+VERSION_TTL = 30 * 24 * 60 * 60
+
+
+class ScheduleCache:
+    """일정 조회 캐시 서비스 (사용자별 버전 스탬프 기반 read-through)
+
+    키는 schedules:{user_id}:v{version}:{kind}:{params} 형식이며, 쓰기 시 버전을
+    INCR 하나로 올려 해당 사용자의 모든 캐시를 한 번에 무효화한다.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend or get_cache()
+
+    @staticmethod
+    def _version_key(user_id: UUID) -> str:
+        return f"schedules:{user_id}:version"
+
+    async def get_version(self, user_id: UUID) -> Optional[str]:
+        """사용자 캐시 버전 조회 (없으면 현재 시각 기반으로 시작)
+
+        백엔드가 꺼져 있거나 오류로 버전을 읽을 수 없으면 None을 반환한다.
+        """
+        key = self._version_key(user_id)
+        version = await self.backend.get(key)
+        if version is None:
+            # 버전 키가 사라져도 이전 번호를 재사용하지 않도록 시각 기반으로 시작
+            await self.backend.add(key, str(time.time_ns() // 1000).encode(), VERSION_TTL)
+            version = await self.backend.get(key)
+        return version.decode() if version is not None else None
+
+    async def change_version(self, db: AsyncSession, user_id: UUID) -> str:
+        """ETag 등에 쓸 사용자 변경 버전 조회
+
+        캐시가 꺼져 있거나 버전을 읽을 수 없으면(Redis 장애 등) 버전 스탬프가 쓰기마다
+        올라간다고 보장할 수 없으므로 DB 카운터 버전을 사용한다.
+        """
+        if self.backend.enabled:
+            version = await self.get_version(user_id)
+            if version is not None:
+                return version
+        return f"db{await ScheduleCountService(db).get_version(user_id)}"
+
+    @staticmethod
+    def etag(user_id: UUID, version: str, kind: str, params: str) -> str:
+        """(사용자, 버전, 조회 종류, 파라미터)로 강한 ETag 생성"""
+        digest = hashlib.sha1(f"{user_id}:{version}:{kind}:{params}".encode()).hexdigest()
+        return f'"{digest}"'
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """사용자의 모든 일정 캐시 무효화"""
+        await self.get_version(user_id)
+        await self.backend.incr(self._version_key(user_id), VERSION_TTL)
+
+    async def invalidate_on_write(self, db: AsyncSession, user_id: UUID) -> None:
+        """지금 한 번 무효화하고, 커밋 이후 한 번 더 무효화하도록 예약
+
+        커밋 전에 다른 요청이 이전 데이터를 새 버전으로 캐시하는 경우를 막기 위해
+        커밋 이후에도 버전을 올린다.
+        """
+        await self.invalidate(user_id)
+
+        async def invalidate() -> None:
+            await self.invalidate(user_id)
+
+        after_commit(db, invalidate)
+
+    async def _key(
+        self, user_id: UUID, kind: str, params: str, version: Optional[str]
+    ) -> Optional[str]:
+        """캐시 키 생성 (버전을 알 수 없으면 None을 반환해 캐시를 건너뛴다)"""
+        if version is None:
+            version = await self.get_version(user_id)
+            if version is None:
+                return None
+        return f"schedules:{user_id}:v{version}:{kind}:{params}"
+
+    async def get_or_load(
+        self,
+        user_id: UUID,
+        kind: str,
+        params: str,
+        loader: Callable[[], Awaitable[Any]],
+        version: Optional[str] = None,
+    ) -> Any:
+        """캐시에서 조회하고 없으면 loader 결과를 캐시 (None은 캐시하지 않음)
+
+        loader는 JSON으로 직렬화 가능한 값을 반환해야 한다.
+        """
+        key = await self._key(user_id, kind, params, version)
+        if key is None:
+            return await loader()
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        value = await loader()
+        if value is not None:
+            encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+            if len(encoded) <= settings.CACHE_MAX_ENTRY_BYTES:
+                await self.backend.set(key, encoded, settings.CACHE_TTL)
+        return value
+
+    async def get_or_load_json(
+        self,
+        user_id: UUID,
+        kind: str,
+        params: str,
+        loader: Callable[[], Awaitable[bytes]],
+        version: Optional[str] = None,
+    ) -> bytes:
+        """get_or_load와 같지만 이미 직렬화된 JSON 바이트를 그대로 캐시하고 반환"""
+        key = await self._key(user_id, kind, params, version)
+        if key is None:
+            return await loader()
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return cached
+
+        encoded = await loader()
+        if len(encoded) <= settings.CACHE_MAX_ENTRY_BYTES:
+            await self.backend.set(key, encoded, settings.CACHE_TTL)
+        return encoded
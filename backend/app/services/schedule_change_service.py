@@ -0,0 +1,96 @@
+import json
+from datetime import datetime
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.broker import get_broker
+from app.core.database import after_commit
+from app.models.schedule import ScheduleChange, schedule_change_seq
+from app.utils.pagination import encode_sync_token
+
+
+class ScheduleChangeService:
+    """일정 변경 로그 서비스 (델타 동기화용)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def channel(user_id: UUID) -> str:
+        """사용자 변경 알림 채널 이름"""
+        return f"schedules:events:{user_id}"
+
+    async def record_many(
+        self,
+        user_id: UUID,
+        schedule_ids: Sequence[UUID],
+        deleted: bool = False,
+    ) -> Dict[UUID, int]:
+        """일정 변경 기록 (일정별 최신 변경으로 덮어쓰고 새 순번 부여)
+
+        여러 일정을 한 문장으로 기록하며 ID는 중복되지 않아야 한다. 커밋 이후 사용자
+        채널로 변경 이벤트를 발행하고, 일정 ID별로 부여된 순번을 반환한다.
+        """
+        if not schedule_ids:
+            return {}
+        changed_at = datetime.utcnow()
+        stmt = insert(ScheduleChange).values(
+            [
+                {
+                    "schedule_id": schedule_id,
+                    "user_id": user_id,
+                    "deleted": deleted,
+                    "changed_at": changed_at,
+                }
+                for schedule_id in schedule_ids
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScheduleChange.schedule_id],
+            set_={
+                "seq": schedule_change_seq.next_value(),
+                "deleted": stmt.excluded.deleted,
+                "changed_at": stmt.excluded.changed_at,
+            },
+        )
+        result = await self.db.execute(
+            stmt.returning(ScheduleChange.schedule_id, ScheduleChange.seq)
+        )
+        seqs = dict(result.tuples().all())
+
+        event_type = "delete" if deleted else "upsert"
+        messages = [
+            json.dumps(
+                {"type": event_type, "id": str(schedule_id), "token": encode_sync_token(seq)},
+                separators=(",", ":"),
+            ).encode()
+            for schedule_id, seq in sorted(seqs.items(), key=lambda item: item[1])
+        ]
+
+        async def publish() -> None:
+            broker = get_broker()
+            for message in messages:
+                await broker.publish(self.channel(user_id), message)
+
+        after_commit(self.db, publish)
+        return seqs
+
+    async def get_since(
+        self,
+        user_id: UUID,
+        since: int,
+        limit: int,
+    ) -> Tuple[List[ScheduleChange], bool]:
+        """since 순번 이후의 변경 조회 (반환값: (변경 목록, 다음 페이지 존재 여부))"""
+        result = await self.db.execute(
+            select(ScheduleChange)
+            .where(ScheduleChange.user_id == user_id, ScheduleChange.seq > since)
+            .order_by(ScheduleChange.seq.asc())
+            .limit(limit + 1)
+        )
+        changes = list(result.scalars().all())
+        return changes[:limit], len(changes) > limit
@@ -0,0 +1,123 @@
+import json
+from collections import OrderedDict
+from typing import Hashable, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.schedule import Schedule, ScheduleCounter
+
+# (user_id, version, filter_key) -> (total, exact)
+# 키에 버전이 들어가므로 쓰기가 일어나면 이전 항목은 자연히 무효화되고 LRU로 밀려난다
+_filtered_totals: "OrderedDict[Tuple[UUID, int, Hashable], Tuple[int, bool]]" = OrderedDict()
+
+
+class ScheduleCountService:
+    """일정 개수 서비스 (사용자별 카운터, 필터별 개수 캐시, 플래너 추정치)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _get_counter(self, user_id: UUID) -> Tuple[int, int]:
+        """카운터 (total, version) 조회 (없으면 현재 일정 개수로 초기화)"""
+        counter_query = select(ScheduleCounter.total, ScheduleCounter.version).where(
+            ScheduleCounter.user_id == user_id
+        )
+        counter = (await self.db.execute(counter_query)).one_or_none()
+        if counter:
+            return counter.total, counter.version
+
+        total_result = await self.db.execute(
+            select(func.count()).select_from(Schedule).where(Schedule.user_id == user_id)
+        )
+        await self.db.execute(
+            insert(ScheduleCounter)
+            .values(user_id=user_id, total=total_result.scalar() or 0, version=0)
+            .on_conflict_do_nothing(index_elements=[ScheduleCounter.user_id])
+        )
+        counter = (await self.db.execute(counter_query)).one()
+        return counter.total, counter.version
+
+    async def get_version(self, user_id: UUID) -> int:
+        """사용자 일정 변경 버전 조회"""
+        _, version = await self._get_counter(user_id)
+        return version
+
+    async def changed(self, user_id: UUID, delta: int = 0) -> None:
+        """일정 변경 기록 (개수 증감 및 버전 증가, 변경 내용이 flush된 뒤 호출)"""
+        result = await self.db.execute(
+            update(ScheduleCounter)
+            .where(ScheduleCounter.user_id == user_id)
+            .values(total=ScheduleCounter.total + delta, version=ScheduleCounter.version + 1)
+        )
+        if result.rowcount > 0:
+            return
+
+        # 카운터가 없으면 이미 반영된 현재 개수로 만든다. 그 사이 다른 트랜잭션이 먼저
+        # 만들었으면 그 개수에는 이 변경이 빠져 있으므로 증감과 버전 증가를 그 행에 반영한다
+        total_result = await self.db.execute(
+            select(func.count()).select_from(Schedule).where(Schedule.user_id == user_id)
+        )
+        stmt = insert(ScheduleCounter).values(
+            user_id=user_id, total=total_result.scalar() or 0, version=1
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ScheduleCounter.user_id],
+                set_={
+                    "total": ScheduleCounter.total + delta,
+                    "version": ScheduleCounter.version + 1,
+                },
+            )
+        )
+
+    async def count(
+        self,
+        user_id: UUID,
+        query: Select,
+        filter_key: Hashable = None,
+        estimate: bool = False,
+    ) -> Tuple[int, bool]:
+        """일정 개수 조회 (반환값: (개수, 정확한 값 여부))
+
+        필터가 없으면 카운터 값을 그대로 사용하고, 필터가 있으면 카운터 버전별로 캐시한다.
+        """
+        user_total, version = await self._get_counter(user_id)
+        if filter_key is None:
+            return user_total, True
+
+        key = (user_id, version, filter_key)
+        cached = _filtered_totals.get(key)
+        if cached is not None and (cached[1] or estimate):
+            _filtered_totals.move_to_end(key)
+            return cached
+
+        total, exact = None, True
+        if estimate:
+            planned = await self._estimate(query)
+            if planned >= settings.COUNT_ESTIMATE_THRESHOLD:
+                total, exact = planned, False
+        if total is None:
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await self.db.execute(count_query)).scalar() or 0
+
+        _filtered_totals[key] = (total, exact)
+        _filtered_totals.move_to_end(key)
+        while len(_filtered_totals) > settings.COUNT_CACHE_SIZE:
+            _filtered_totals.popitem(last=False)
+        return total, exact
+
+    async def _estimate(self, query: Select) -> int:
+        """플래너 추정 행 수 조회"""
+        compiled = query.compile(
+            dialect=self.db.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        connection = await self.db.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,206 @@
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import UploadFile
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import async_session_maker, run_after_commit
+from app.models.schedule import ImportJobStatus, ScheduleImportJob
+from app.services.schedule_service import ScheduleService
+from app.utils.ical import ImportedEvent, Property, iter_events, to_event
+
+logger = logging.getLogger(__name__)
+
+RawEvents = Iterator[Tuple[Dict[str, Property], List[Dict[str, Property]]]]
+
+
+def read_batch(events: RawEvents, size: int) -> Tuple[List[ImportedEvent], int]:
+    """다음 VEVENT 최대 size개를 읽어 변환 (블로킹, 스레드 풀에서 실행)
+
+    (변환된 이벤트, 건너뛴 이벤트 수)를 반환하며, 합이 size보다 작으면 파일 끝이다.
+    """
+    batch: List[ImportedEvent] = []
+    skipped = 0
+    for props, alarms in islice(events, size):
+        event = to_event(props, alarms)
+        if event is None:
+            skipped += 1
+        else:
+            batch.append(event)
+    return batch, skipped
+
+
+class ScheduleImportService:
+    """일정 가져오기(ICS) 서비스
+
+    파일을 VEVENT 단위로 읽으면서 IMPORT_BATCH_SIZE개씩 COPY로 추가한다.
+    파일 전체나 전체 일정 목록을 메모리에 올리지 않는다. 파일 읽기와 파싱은 배치마다
+    스레드 풀에서 실행하고, 이벤트 루프에서는 COPY와 진행 상황 갱신만 한다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_job(
+        self,
+        user_id: UUID,
+        filename: Optional[str],
+        total_bytes: int,
+    ) -> ScheduleImportJob:
+        """가져오기 작업 생성"""
+        job = ScheduleImportJob(
+            user_id=user_id,
+            filename=filename[:255] if filename else None,
+            status=ImportJobStatus.PENDING,
+            total_bytes=total_bytes,
+            processed_bytes=0,
+            imported=0,
+            skipped=0,
+            simplified=0,
+        )
+        self.db.add(job)
+        await self.db.flush()
+        return job
+
+    async def get_job(self, job_id: UUID, user_id: UUID) -> Optional[ScheduleImportJob]:
+        """가져오기 작업 조회"""
+        result = await self.db.execute(
+            select(ScheduleImportJob).where(
+                and_(ScheduleImportJob.id == job_id, ScheduleImportJob.user_id == user_id)
+            )
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _rows(
+        user_id: UUID, event: ImportedEvent, now: datetime
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """가져온 이벤트를 일정 행과 알림 행으로 변환"""
+        schedule_id = uuid.uuid4()
+        schedule_row = {
+            "id": schedule_id,
+            "user_id": user_id,
+            "title": event.title,
+            "description": event.description,
+            "start_date": event.start_date,
+            "end_date": event.end_date,
+            "all_day": event.all_day,
+            "priority": event.priority,
+            "color": None,
+            "location": event.location,
+            "image_url": None,
+            "repeat": event.repeat,
+            "repeat_end_date": event.repeat_end_date,
+            "created_at": now,
+            "updated_at": now,
+        }
+        reminder_rows = [
+            {
+                "id": uuid.uuid4(),
+                "schedule_id": schedule_id,
+                "reminder_type": reminder_type,
+                "minutes_before": minutes_before,
+                "created_at": now,
+            }
+            for reminder_type, minutes_before in event.reminders
+        ]
+        return schedule_row, reminder_rows
+
+    async def run(
+        self,
+        job: ScheduleImportJob,
+        stream: BinaryIO,
+        commit: bool = False,
+    ) -> ScheduleImportJob:
+        """ICS 스트림을 읽어 일정 추가
+
+        commit이면 배치마다 커밋해 진행 상황을 다른 요청에서 조회할 수 있게 한다
+        (백그라운드 작업용). 이때 실패하면 이미 커밋된 배치는 그대로 남는다.
+        """
+        schedule_service = ScheduleService(self.db)
+        now = datetime.utcnow()
+        schedule_rows: List[Dict[str, Any]] = []
+        reminder_rows: List[Dict[str, Any]] = []
+
+        async def flush() -> None:
+            await schedule_service.insert_many(job.user_id, schedule_rows, reminder_rows)
+            job.imported += len(schedule_rows)
+            job.processed_bytes = stream.tell()
+            schedule_rows.clear()
+            reminder_rows.clear()
+            if commit:
+                await self.db.commit()
+                await run_after_commit(self.db)
+
+        job.status = ImportJobStatus.RUNNING
+        if commit:
+            await self.db.commit()
+        events = iter_events(stream)
+        while True:
+            batch, skipped = await run_in_threadpool(
+                read_batch, events, settings.IMPORT_BATCH_SIZE
+            )
+            job.skipped += skipped
+            for event in batch:
+                if event.simplified:
+                    job.simplified += 1
+                schedule_row, rows = self._rows(job.user_id, event, now)
+                schedule_rows.append(schedule_row)
+                reminder_rows.extend(rows)
+            await flush()
+            if len(batch) + skipped < settings.IMPORT_BATCH_SIZE:
+                break
+
+        job.status = ImportJobStatus.COMPLETED
+        job.processed_bytes = job.total_bytes
+        job.finished_at = datetime.utcnow()
+        if commit:
+            await self.db.commit()
+        return job
+
+
+async def save_upload(upload: UploadFile) -> str:
+    """업로드 파일을 임시 파일로 복사 (요청이 끝나면 업로드 파일이 닫히므로 백그라운드 작업용)"""
+    with tempfile.NamedTemporaryFile(prefix="ez-import-", suffix=".ics", delete=False) as target:
+        await run_in_threadpool(shutil.copyfileobj, upload.file, target)
+    return target.name
+
+
+async def run_import_job(job_id: UUID, path: str) -> None:
+    """임시 파일로 저장된 ICS를 가져오는 백그라운드 작업 (끝나면 임시 파일 삭제)"""
+    try:
+        async with async_session_maker() as session:
+            job = await session.get(ScheduleImportJob, job_id)
+            if job is None:
+                return
+            try:
+                with open(path, "rb") as stream:
+                    await ScheduleImportService(session).run(job, stream, commit=True)
+            except Exception:
+                logger.exception("일정 가져오기 실패: %s", job_id)
+                await session.rollback()
+                await session.execute(
+                    update(ScheduleImportJob)
+                    .where(ScheduleImportJob.id == job_id)
+                    .values(
+                        status=ImportJobStatus.FAILED,
+                        error="가져오기 중 오류가 발생했습니다.",
+                        finished_at=datetime.utcnow(),
+                    )
+                )
+                await session.commit()
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -1,13 +1,114 @@
-from datetime import datetime
-from typing import List, Optional, Tuple
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import (
+    JSON,
+    Interval,
+    Select,
+    Table,
+    column,
+    delete,
+    insert,
+    select,
+    update,
+    values,
+    func,
+    and_,
+    or_,
+    case,
+    literal,
+    literal_column,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.schedule import Schedule, ScheduleReminder, SchedulePriority
-from app.schemas.schedule import ScheduleCreate, ScheduleUpdate
+from app.models.schedule import (
+    ReminderType,
+    Schedule,
+    ScheduleReminder,
+    SchedulePriority,
+    ScheduleRepeatType,
+)
+from app.schemas.schedule import (
+    ReminderCreate,
+    ScheduleBulkOperation,
+    ScheduleCreate,
+    ScheduleUpdate,
+)
+from app.services.reminder_service import ReminderService
+from app.services.schedule_cache import ScheduleCache
+from app.services.schedule_change_service import ScheduleChangeService
+from app.services.schedule_count_service import ScheduleCountService
+from app.utils.recurrence import Occurrence, expand, expand_schedules, to_naive_utc
+from app.utils.search import search_grams, split_terms
+
+# 부분 조회(fields=)로 선택할 수 있는 일정 컬럼 (id는 항상 포함)
+SPARSE_FIELDS = (
+    "user_id",
+    "title",
+    "description",
+    "start_date",
+    "end_date",
+    "all_day",
+    "priority",
+    "color",
+    "location",
+    "repeat",
+    "repeat_end_date",
+    "image_url",
+    "image_renditions",
+    "image_placeholder",
+    "created_at",
+    "updated_at",
+)
+
+# 요약 조회의 우선순위 마스크 비트
+PRIORITY_BITS = {
+    SchedulePriority.HIGH: 1,
+    SchedulePriority.MEDIUM: 2,
+    SchedulePriority.LOW: 4,
+    SchedulePriority.DEFAULT: 8,
+}
+
+# 일괄 작업에서 한 문장에 넣는 최대 행 수 (PostgreSQL 바인드 파라미터 수 제한 대비)
+BULK_CHUNK_SIZE = 500
+
+SUMMARY_STEPS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+
+def _truncate(value: datetime, granularity: str) -> datetime:
+    """구간 시작 시각으로 내림 (week는 월요일 기준, PostgreSQL date_trunc와 동일)"""
+    day = datetime.combine(value.date(), datetime.min.time())
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+class BulkResult(NamedTuple):
+    """일괄 작업 항목별 결과"""
+
+    index: int
+    op: str
+    status: int
+    id: Optional[UUID]
+
+
+class DuplicateOperationError(Exception):
+    """일괄 작업에 같은 일정에 대한 수정/삭제가 중복됨"""
+
+
+def _chunks(items: Sequence[Any], size: int = BULK_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class ScheduleService:
@@ -16,6 +117,79 @@ class ScheduleService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _changed(
+        self,
+        user_id: UUID,
+        upserted: Sequence[UUID] = (),
+        deleted: Sequence[UUID] = (),
+        delta: int = 0,
+    ) -> None:
+        """일정 변경 후처리 (개수 카운터 갱신, 변경 로그 기록, 알림 발송 시각 재계산,
+        조회 캐시 무효화)"""
+        # 카운터 행 잠금을 먼저 잡아 사용자별 변경 순번이 커밋 순서와 같게 한다
+        await ScheduleCountService(self.db).changed(user_id, delta=delta)
+        change_service = ScheduleChangeService(self.db)
+        await change_service.record_many(user_id, upserted)
+        await change_service.record_many(user_id, deleted, deleted=True)
+        await ReminderService(self.db).reschedule(upserted)
+        await ScheduleCache().invalidate_on_write(self.db, user_id)
+
+    @staticmethod
+    def _overlaps(start_date: Optional[datetime], end_date: Optional[datetime]):
+        """일정 기간과 [start_date, end_date] 구간의 겹침 조건 (None은 상/하한 없음)
+
+        (user_id, period) GiST 인덱스를 타도록 period 컬럼에 직접 && 연산을 건다.
+        """
+        start_date = to_naive_utc(start_date) if start_date else None
+        end_date = to_naive_utc(end_date) if end_date else None
+        window = func.tsrange(start_date, end_date, literal_column("'[]'"))
+        return Schedule.period.op("&&")(window)
+
+    @staticmethod
+    def _search_filter(terms: List[str]):
+        """모든 검색어를 제목 또는 설명에 포함하는 조건
+
+        search_grams 조각 포함(@>)으로 인덱스에서 후보를 찾는다. 2글자 이하 검색어는 조각
+        포함이 곧 부분 문자열 일치이고, 더 긴 검색어는 search_text LIKE로 다시 확인한다
+        (trigram 인덱스로도 찾을 수 있다).
+        """
+        conditions = []
+        for term in terms:
+            conditions.append(Schedule.search_grams.contains(search_grams(term)))
+            if len(term) > 2:
+                conditions.append(Schedule.search_text.contains(term, autoescape=True))
+        return and_(*conditions)
+
+    @staticmethod
+    def _reminders_json():
+        """일정 알림을 JSON 배열로 모으는 상관 서브쿼리 (알림을 별도 쿼리 없이 같은 행으로 조회)"""
+        reminder = func.json_build_object(
+            "id", ScheduleReminder.id,
+            "reminder_type", ScheduleReminder.reminder_type,
+            "minutes_before", ScheduleReminder.minutes_before,
+        )
+        reminders = func.json_agg(
+            aggregate_order_by(reminder, ScheduleReminder.created_at, ScheduleReminder.id)
+        )
+        return (
+            select(func.coalesce(reminders, literal_column("'[]'::json"), type_=JSON))
+            .where(ScheduleReminder.schedule_id == Schedule.id)
+            .scalar_subquery()
+        )
+
+    def _projection(
+        self,
+        fields: Sequence[str],
+        include_reminders: bool,
+        required: Sequence[str] = ("start_date",),
+    ) -> List[Any]:
+        """부분 조회 컬럼 목록 (정렬/커서/반복 전개에 필요한 컬럼은 항상 포함)"""
+        names = dict.fromkeys(["id", *required, *fields])
+        columns: List[Any] = [getattr(Schedule, name) for name in names]
+        if include_reminders:
+            columns.append(self._reminders_json().label("reminders"))
+        return columns
+
     async def get_by_id(self, schedule_id: UUID, user_id: UUID) -> Optional[Schedule]:
         """ID로 일정 조회"""
         result = await self.db.execute(
@@ -25,144 +199,623 @@ class ScheduleService:
         )
         return result.scalar_one_or_none()
 
-    async def get_list(
+    def _filtered_query(
         self,
         user_id: UUID,
-        page: int = 1,
-        page_size: int = 20,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         priority: Optional[List[SchedulePriority]] = None,
         search: Optional[str] = None,
-    ) -> Tuple[List[Schedule], int]:
-        """일정 목록 조회 (페이지네이션)"""
-        # 기본 쿼리
-        query = select(Schedule).options(selectinload(Schedule.reminders)).where(
-            Schedule.user_id == user_id
-        )
+    ) -> Select:
+        """목록 필터가 적용된 기본 쿼리"""
+        query = select(Schedule).where(Schedule.user_id == user_id)
 
-        # 날짜 필터
-        if start_date:
-            query = query.where(Schedule.start_date >= start_date)
-        if end_date:
-            query = query.where(Schedule.start_date <= end_date)
+        # 날짜 필터 (기간이 구간과 겹치는 일정)
+        if start_date or end_date:
+            query = query.where(self._overlaps(start_date, end_date))
 
         # 우선순위 필터
         if priority:
             query = query.where(Schedule.priority.in_(priority))
 
         # 검색
-        if search:
-            search_filter = or_(
-                Schedule.title.ilike(f"%{search}%"),
-                Schedule.description.ilike(f"%{search}%"),
-            )
-            query = query.where(search_filter)
+        if search and split_terms(search):
+            query = query.where(self._search_filter(split_terms(search)))
+
+        return query
+
+    async def get_by_ids(
+        self,
+        schedule_ids: List[UUID],
+        user_id: UUID,
+        fields: Optional[Sequence[str]] = None,
+        include_reminders: bool = True,
+    ) -> List[Any]:
+        """ID 목록으로 일정 조회 (없는 일정은 제외, fields / include_reminders는 get_list와 같다)"""
+        if not schedule_ids:
+            return []
+        if fields is None:
+            query = select(Schedule).options(selectinload(Schedule.reminders))
+        else:
+            query = select(*self._projection(fields, include_reminders))
+        result = await self.db.execute(
+            query.where(and_(Schedule.id.in_(schedule_ids), Schedule.user_id == user_id))
+        )
+        return list(result.scalars().all() if fields is None else result.all())
+
+    async def get_list(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        priority: Optional[List[SchedulePriority]] = None,
+        search: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
+        include_reminders: bool = True,
+    ) -> Tuple[List[Any], bool]:
+        """일정 목록 조회 (페이지네이션)
 
-        # 전체 개수 조회
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        after가 주어지면 OFFSET 대신 (start_date, id) 키 이후부터 조회한다 (키셋 페이지네이션).
+        fields가 주어지면 엔티티 대신 해당 컬럼만 조회한 행을 반환하고, 알림은
+        include_reminders일 때만 같은 행에 JSON으로 포함한다.
+        반환값은 (일정 목록, 다음 페이지 존재 여부)이며 전체 개수는 count_list로 조회한다.
+        """
+        query = self._filtered_query(user_id, start_date, end_date, priority, search)
+        if fields is None:
+            query = query.options(selectinload(Schedule.reminders))
+        else:
+            query = query.with_only_columns(*self._projection(fields, include_reminders))
 
-        # 페이지네이션 및 정렬
-        query = query.order_by(Schedule.start_date.asc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        # 페이지네이션 및 정렬 (다음 페이지 존재 여부 확인을 위해 1건 더 조회)
+        query = query.order_by(Schedule.start_date.asc(), Schedule.id.asc())
+        if after:
+            query = query.where(tuple_(Schedule.start_date, Schedule.id) > tuple_(*after))
+        else:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_size + 1)
 
         result = await self.db.execute(query)
-        schedules = list(result.scalars().all())
+        schedules = list(result.scalars().all() if fields is None else result.all())
+        has_more = len(schedules) > page_size
+
+        return schedules[:page_size], has_more
+
+    async def count_list(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        priority: Optional[List[SchedulePriority]] = None,
+        search: Optional[str] = None,
+        estimate: bool = False,
+    ) -> Tuple[int, bool]:
+        """일정 목록 전체 개수 조회 (반환값: (개수, 정확한 값 여부))"""
+        filter_key = None
+        if start_date or end_date or priority or search:
+            filter_key = (
+                to_naive_utc(start_date) if start_date else None,
+                to_naive_utc(end_date) if end_date else None,
+                tuple(sorted(p.value for p in priority)) if priority else None,
+                search,
+            )
+
+        query = self._filtered_query(user_id, start_date, end_date, priority, search)
+        return await ScheduleCountService(self.db).count(
+            user_id, query, filter_key=filter_key, estimate=estimate
+        )
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[int, datetime, UUID]] = None,
+    ) -> Tuple[List[Tuple[Schedule, int]], bool]:
+        """일정 검색 (관련도 순, (rank, start_date, id) 키셋 페이지네이션)
+
+        제목 완전 일치 > 제목 접두 일치 > 제목 포함 > 설명 포함 순으로 점수를 매긴다.
+        반환값은 ((일정, 점수) 목록, 다음 페이지 존재 여부)이다.
+        """
+        terms = split_terms(query)
+        if not terms:
+            return [], False
+
+        title = func.lower(Schedule.title)
+        phrase = " ".join(terms)
+        rank = case((title == phrase, 100), (title.startswith(phrase, autoescape=True), 50), else_=0)
+        for term in terms:
+            rank = rank + case((title.contains(term, autoescape=True), 10), else_=1)
 
-        return schedules, total
+        stmt = (
+            select(Schedule, rank)
+            .options(selectinload(Schedule.reminders))
+            .where(and_(Schedule.user_id == user_id, self._search_filter(terms)))
+        )
+        if after:
+            after_rank, after_start_date, after_id = after
+            stmt = stmt.where(
+                or_(
+                    rank < after_rank,
+                    and_(
+                        rank == after_rank,
+                        tuple_(Schedule.start_date, Schedule.id) > tuple_(after_start_date, after_id),
+                    ),
+                )
+            )
+        stmt = stmt.order_by(rank.desc(), Schedule.start_date.asc(), Schedule.id.asc())
+        stmt = stmt.limit(limit + 1)
+
+        result = await self.db.execute(stmt)
+        hits = list(result.tuples().all())
+        return hits[:limit], len(hits) > limit
 
     async def get_by_date_range(
         self,
         user_id: UUID,
         start_date: datetime,
         end_date: datetime,
-    ) -> List[Schedule]:
-        """날짜 범위로 일정 조회"""
+        fields: Optional[Sequence[str]] = None,
+        include_reminders: bool = True,
+    ) -> Tuple[List[Any], List[Occurrence]]:
+        """날짜 범위로 일정 조회 (반복 일정은 구간 내 발생으로 전개)
+
+        기간이 구간과 겹치는 일정만 인덱스로 추린 뒤, 반복 일정은 실제 발생으로 전개한다.
+        fields / include_reminders는 get_list와 같다.
+        """
+        start_date = to_naive_utc(start_date)
+        end_date = to_naive_utc(end_date)
+
+        if fields is None:
+            query = select(Schedule).options(selectinload(Schedule.reminders))
+        else:
+            required = ("start_date", "end_date", "repeat", "repeat_end_date")
+            query = select(*self._projection(fields, include_reminders, required))
         result = await self.db.execute(
-            select(Schedule)
-            .options(selectinload(Schedule.reminders))
+            query
+            .where(and_(Schedule.user_id == user_id, self._overlaps(start_date, end_date)))
+            .order_by(Schedule.start_date.asc())
+        )
+        candidates = list(result.scalars().all() if fields is None else result.all())
+
+        occurrences = expand_schedules(candidates, start_date, end_date)
+        occurring_ids = {o.schedule_id for o in occurrences}
+        schedules = [s for s in candidates if s.id in occurring_ids]
+        return schedules, occurrences
+
+    async def stream_all(self, user_id: UUID, batch_size: int) -> AsyncIterator[Sequence[Any]]:
+        """사용자의 모든 일정을 서버 측 커서로 batch_size개씩 조회 (시작 시각 순)
+
+        행은 전체 컬럼과 알림 JSON을 가진 부분 조회 행이며, 메모리에는 한 배치만 유지된다.
+        """
+        result = await self.db.stream(
+            select(*self._projection(SPARSE_FIELDS, True))
+            .where(Schedule.user_id == user_id)
+            .order_by(Schedule.start_date.asc(), Schedule.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def get_summary(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str = "day",
+    ) -> List[Tuple[date, int, int]]:
+        """날짜 범위의 구간별 일정 요약 조회 (반환값: (구간 시작일, 발생 수, 우선순위 마스크) 목록)
+
+        구간 경계는 start_date의 UTC 오프셋 기준 자정이며, 일정이 걸친 모든 구간에 집계한다.
+        단일 일정은 SQL에서 바로 집계하고, 반복 일정은 필요한 컬럼만 조회해 발생으로 전개한다.
+        빈 구간은 반환하지 않는다.
+        """
+        offset = start_date.utcoffset() or timedelta(0)
+        window_start = to_naive_utc(start_date)
+        window_end = to_naive_utc(end_date)
+        local_start = window_start + offset
+        local_end = window_end + offset
+        step = SUMMARY_STEPS[granularity]
+
+        priority_bit = case(
+            *((Schedule.priority == priority, bit) for priority, bit in PRIORITY_BITS.items()),
+            else_=0,
+        )
+        shift = literal(offset, Interval())
+        occurrence_start = func.greatest(Schedule.start_date + shift, local_start)
+        occurrence_end = func.least(
+            func.greatest(Schedule.start_date, func.coalesce(Schedule.end_date, Schedule.start_date))
+            + shift,
+            local_end,
+        )
+        spans = (
+            select(
+                func.generate_series(
+                    func.date_trunc(granularity, occurrence_start),
+                    func.date_trunc(granularity, occurrence_end),
+                    literal(step, Interval()),
+                ).label("bucket"),
+                priority_bit.label("bit"),
+            )
             .where(
                 and_(
                     Schedule.user_id == user_id,
-                    Schedule.start_date >= start_date,
-                    Schedule.start_date <= end_date,
+                    Schedule.repeat == ScheduleRepeatType.NONE,
+                    self._overlaps(window_start, window_end),
                 )
             )
-            .order_by(Schedule.start_date.asc())
+            .subquery()
         )
-        return list(result.scalars().all())
+        result = await self.db.execute(
+            select(spans.c.bucket, func.count(), func.bit_or(spans.c.bit)).group_by(spans.c.bucket)
+        )
+        buckets: Dict[date, List[int]] = {
+            bucket.date(): [count, mask] for bucket, count, mask in result.all()
+        }
+
+        result = await self.db.execute(
+            select(
+                Schedule.id,
+                Schedule.start_date,
+                Schedule.end_date,
+                Schedule.repeat,
+                Schedule.repeat_end_date,
+                Schedule.priority,
+            ).where(
+                and_(
+                    Schedule.user_id == user_id,
+                    Schedule.repeat != ScheduleRepeatType.NONE,
+                    self._overlaps(window_start, window_end),
+                )
+            )
+        )
+        for row in result.all():
+            bit = PRIORITY_BITS.get(row.priority, 0)
+            occurrences = expand(
+                row.id,
+                row.start_date,
+                row.end_date,
+                row.repeat,
+                row.repeat_end_date,
+                window_start,
+                window_end,
+            )
+            for occurrence in occurrences:
+                occurrence_end = max(occurrence.start_date, occurrence.end_date or occurrence.start_date)
+                bucket = _truncate(max(occurrence.start_date + offset, local_start), granularity)
+                last = _truncate(min(occurrence_end + offset, local_end), granularity)
+                while bucket <= last:
+                    entry = buckets.setdefault(bucket.date(), [0, 0])
+                    entry[0] += 1
+                    entry[1] |= bit
+                    bucket += step
+
+        return [(day, count, mask) for day, (count, mask) in sorted(buckets.items())]
+
+    @staticmethod
+    def _reminder_rows(
+        schedule_id: UUID, reminders: Sequence[ReminderCreate], now: datetime
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": uuid.uuid4(),
+                "schedule_id": schedule_id,
+                "reminder_type": reminder.reminder_type,
+                "minutes_before": reminder.minutes_before,
+                "created_at": now,
+            }
+            for reminder in reminders
+        ]
+
+    async def _copy_rows(self, table: Table, rows: Sequence[Dict[str, Any]]) -> None:
+        """행 일괄 추가 (asyncpg 연결이면 COPY, 아니면 다중 행 INSERT)
+
+        모든 행은 같은 키를 가져야 하며, 생성 컬럼과 파이썬 기본값은 적용되지 않는다.
+        """
+        if not rows:
+            return
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if hasattr(driver_connection, "copy_records_to_table"):
+            columns = list(rows[0])
+            records = [
+                tuple(
+                    row[name].value if isinstance(row[name], Enum) else row[name]
+                    for name in columns
+                )
+                for row in rows
+            ]
+            await driver_connection.copy_records_to_table(
+                table.name, records=records, columns=columns
+            )
+            return
+        for chunk in _chunks(rows):
+            await self.db.execute(insert(table).values(list(chunk)))
+
+    async def insert_many(
+        self,
+        user_id: UUID,
+        schedule_rows: Sequence[Dict[str, Any]],
+        reminder_rows: Sequence[Dict[str, Any]] = (),
+    ) -> None:
+        """일정과 알림 행을 COPY로 일괄 추가 (가져오기용)
+
+        행에는 id, created_at 등 모든 컬럼 값이 채워져 있어야 한다.
+        """
+        await self._copy_rows(Schedule.__table__, schedule_rows)
+        await self._copy_rows(ScheduleReminder.__table__, reminder_rows)
+        if schedule_rows:
+            await self._changed(
+                user_id,
+                upserted=[row["id"] for row in schedule_rows],
+                delta=len(schedule_rows),
+            )
+
+    async def bulk(
+        self,
+        user_id: UUID,
+        operations: Sequence[ScheduleBulkOperation],
+    ) -> Tuple[List[BulkResult], List[str]]:
+        """일정 일괄 생성/수정/삭제 (반환값: (항목별 결과, 삭제된 일정의 이미지 URL 목록))
+
+        작업 종류별로 묶어 생성은 다중 행 INSERT, 수정은 변경 필드 조합별
+        UPDATE ... FROM (VALUES ...), 삭제는 DELETE ... RETURNING 한 문장씩 실행하고,
+        알림도 한 번에 교체/추가한다. 모두 호출자의 트랜잭션 안에서 실행된다.
+        같은 일정에 대한 수정/삭제가 중복되면 DuplicateOperationError를 발생시킨다.
+        """
+        target_ids = [op.id for op in operations if op.op != "create"]
+        if len(set(target_ids)) != len(target_ids):
+            raise DuplicateOperationError("같은 일정에 대한 작업이 중복되었습니다.")
+
+        now = datetime.utcnow()
+        results: Dict[int, BulkResult] = {}
+        reminder_rows: List[Dict[str, Any]] = []
+
+        # 생성
+        schedule_rows = []
+        for index, op in enumerate(operations):
+            if op.op != "create":
+                continue
+            schedule_id = uuid.uuid4()
+            schedule_rows.append(
+                {
+                    **op.data.model_dump(exclude={"reminders"}),
+                    "id": schedule_id,
+                    "user_id": user_id,
+                    "image_url": None,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            reminder_rows.extend(self._reminder_rows(schedule_id, op.data.reminders, now))
+            results[index] = BulkResult(index, op.op, 201, schedule_id)
+        for chunk in _chunks(schedule_rows):
+            await self.db.execute(insert(Schedule).values(list(chunk)))
+        created_ids = [row["id"] for row in schedule_rows]
+
+        # 수정 (변경 필드 조합이 같은 작업끼리 한 문장으로)
+        groups: Dict[Tuple[str, ...], List[Tuple[UUID, Dict[str, Any]]]] = {}
+        for op in operations:
+            if op.op == "update":
+                data = op.data.model_dump(exclude_unset=True, exclude={"reminders"})
+                groups.setdefault(tuple(sorted(data)), []).append((op.id, data))
+
+        table = Schedule.__table__
+        updated_ids = set()
+        for names, items in groups.items():
+            for chunk in _chunks(items):
+                changes = values(
+                    column("id", table.c.id.type),
+                    *(column(name, table.c[name].type) for name in names),
+                    name="changes",
+                ).data([(schedule_id, *(data[name] for name in names)) for schedule_id, data in chunk])
+                stmt = (
+                    update(Schedule)
+                    .where(and_(Schedule.id == changes.c.id, Schedule.user_id == user_id))
+                    .values(updated_at=now, **{name: changes.c[name] for name in names})
+                    .returning(Schedule.id)
+                    .execution_options(synchronize_session=False)
+                )
+                updated_ids.update((await self.db.execute(stmt)).scalars().all())
+
+        replaced_ids = []
+        for index, op in enumerate(operations):
+            if op.op != "update":
+                continue
+            found = op.id in updated_ids
+            results[index] = BulkResult(index, op.op, 200 if found else 404, op.id)
+            if found and op.data.reminders is not None:
+                replaced_ids.append(op.id)
+                reminder_rows.extend(self._reminder_rows(op.id, op.data.reminders, now))
+        for chunk in _chunks(replaced_ids):
+            await self.db.execute(
+                delete(ScheduleReminder).where(ScheduleReminder.schedule_id.in_(chunk))
+            )
+
+        # 삭제
+        delete_ids = [op.id for op in operations if op.op == "delete"]
+        deleted: Dict[UUID, Optional[str]] = {}
+        for chunk in _chunks(delete_ids):
+            owned = select(Schedule.id).where(
+                and_(Schedule.id.in_(chunk), Schedule.user_id == user_id)
+            )
+            await self.db.execute(
+                delete(ScheduleReminder).where(ScheduleReminder.schedule_id.in_(owned))
+            )
+            result = await self.db.execute(
+                delete(Schedule)
+                .where(and_(Schedule.id.in_(chunk), Schedule.user_id == user_id))
+                .returning(Schedule.id, Schedule.image_url)
+                .execution_options(synchronize_session=False)
+            )
+            deleted.update(result.tuples().all())
+        for index, op in enumerate(operations):
+            if op.op == "delete":
+                results[index] = BulkResult(index, op.op, 200 if op.id in deleted else 404, op.id)
+
+        for chunk in _chunks(reminder_rows):
+            await self.db.execute(insert(ScheduleReminder).values(list(chunk)))
+
+        upserted = created_ids + list(updated_ids)
+        if upserted or deleted:
+            await self._changed(
+                user_id,
+                upserted=upserted,
+                deleted=list(deleted),
+                delta=len(created_ids) - len(deleted),
+            )
+
+        image_urls = [image_url for image_url in deleted.values() if image_url]
+        return [results[index] for index in range(len(operations))], image_urls
 
     async def create(
         self,
         user_id: UUID,
         schedule_in: ScheduleCreate,
         image_url: Optional[str] = None,
-    ) -> Schedule:
-        """일정 생성"""
-        schedule_data = schedule_in.model_dump(exclude={"reminders"})
-        schedule = Schedule(user_id=user_id, image_url=image_url, **schedule_data)
-
-        # 알림 생성
-        for reminder_in in schedule_in.reminders:
-            reminder = ScheduleReminder(
-                reminder_type=reminder_in.reminder_type,
-                minutes_before=reminder_in.minutes_before,
-            )
-            schedule.reminders.append(reminder)
+        image_renditions: Optional[Dict[str, str]] = None,
+        image_placeholder: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """일정 생성 (INSERT ... RETURNING과 알림 다중 행 INSERT)
 
-        self.db.add(schedule)
-        await self.db.flush()
-        
-        # 관계를 포함하여 다시 조회
+        다시 조회하지 않고 RETURNING 결과에 알림 행을 붙여 응답 형태로 반환한다.
+        """
+        now = datetime.utcnow()
+        schedule_id = uuid.uuid4()
         result = await self.db.execute(
-            select(Schedule)
-            .options(selectinload(Schedule.reminders))
-            .where(Schedule.id == schedule.id)
+            insert(Schedule)
+            .values(
+                **schedule_in.model_dump(exclude={"reminders"}),
+                id=schedule_id,
+                user_id=user_id,
+                image_url=image_url,
+                image_renditions=image_renditions,
+                image_placeholder=image_placeholder,
+                created_at=now,
+                updated_at=now,
+            )
+            .returning(*self._projection(SPARSE_FIELDS, include_reminders=False))
         )
-        return result.scalar_one()
+        schedule = dict(result.one()._mapping)
 
-    async def update(self, schedule_id: UUID, schedule_in: ScheduleUpdate) -> Optional[Schedule]:
-        """일정 수정"""
-        result = await self.db.execute(
-            select(Schedule)
-            .options(selectinload(Schedule.reminders))
-            .where(Schedule.id == schedule_id)
-        )
-        schedule = result.scalar_one_or_none()
+        reminder_rows = self._reminder_rows(schedule_id, schedule_in.reminders, now)
+        if reminder_rows:
+            await self.db.execute(insert(ScheduleReminder).values(reminder_rows))
+        await self._changed(user_id, upserted=[schedule_id], delta=1)
 
-        if not schedule:
-            return None
+        schedule["reminders"] = reminder_rows
+        return schedule
+
+    async def _replace_reminders(
+        self,
+        schedule_id: UUID,
+        current: Sequence[Dict[str, Any]],
+        reminders: Sequence[ReminderCreate],
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """알림 목록 교체 (같은 (타입, 분) 알림은 그대로 두고 바뀐 것만 삭제/추가)
+
+        current는 _reminders_json 형식의 현재 알림 목록이며, 교체된 알림 목록을 반환한다.
+        """
+        wanted = Counter((r.reminder_type, r.minutes_before) for r in reminders)
+        kept: List[Dict[str, Any]] = []
+        removed: List[UUID] = []
+        for reminder in current:
+            key = (ReminderType(reminder["reminder_type"]), reminder["minutes_before"])
+            if wanted[key] > 0:
+                wanted[key] -= 1
+                kept.append(reminder)
+            else:
+                removed.append(UUID(reminder["id"]))
+
+        added = []
+        for reminder in reminders:
+            key = (reminder.reminder_type, reminder.minutes_before)
+            if wanted[key] > 0:
+                wanted[key] -= 1
+                added.append(reminder)
 
+        if removed:
+            await self.db.execute(
+                delete(ScheduleReminder).where(ScheduleReminder.id.in_(removed))
+            )
+        added_rows = self._reminder_rows(schedule_id, added, now)
+        if added_rows:
+            await self.db.execute(insert(ScheduleReminder).values(added_rows))
+        return kept + added_rows
+
+    async def update(
+        self,
+        schedule_id: UUID,
+        user_id: UUID,
+        schedule_in: ScheduleUpdate,
+    ) -> Optional[Dict[str, Any]]:
+        """일정 수정 (없거나 다른 사용자의 일정이면 None)
+
+        소유자 조건을 건 UPDATE ... RETURNING 한 문장으로 수정하면서 현재 알림 목록도
+        함께 돌려받고, 알림은 바뀐 것만 삭제/추가한다.
+        """
         update_data = schedule_in.model_dump(exclude_unset=True, exclude={"reminders"})
-        for field, value in update_data.items():
-            setattr(schedule, field, value)
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            update(Schedule)
+            .where(and_(Schedule.id == schedule_id, Schedule.user_id == user_id))
+            .values(**update_data, updated_at=now)
+            .returning(*self._projection(SPARSE_FIELDS, include_reminders=True))
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        schedule = dict(row._mapping)
 
-        # 알림 업데이트
         if schedule_in.reminders is not None:
-            # 기존 알림 삭제
-            for reminder in schedule.reminders:
-                await self.db.delete(reminder)
-
-            # 새 알림 생성
-            for reminder_in in schedule_in.reminders:
-                reminder = ScheduleReminder(
-                    schedule_id=schedule_id,
-                    reminder_type=reminder_in.reminder_type,
-                    minutes_before=reminder_in.minutes_before,
-                )
-                self.db.add(reminder)
+            schedule["reminders"] = await self._replace_reminders(
+                schedule_id, schedule["reminders"], schedule_in.reminders, now
+            )
+        await self._changed(user_id, upserted=[schedule_id])
+        return schedule
 
-        await self.db.flush()
-        
-        # 관계를 포함하여 다시 조회
+    async def lock_image(self, schedule_id: UUID, user_id: UUID) -> Tuple[bool, Optional[str]]:
+        """이미지 교체 전 일정 행 잠금 (반환값: (사용자의 일정인지 여부, 현재 image_url))"""
+        current = (
+            await self.db.execute(
+                select(Schedule.image_url)
+                .where(and_(Schedule.id == schedule_id, Schedule.user_id == user_id))
+                .with_for_update()
+            )
+        ).one_or_none()
+        if current is None:
+            return False, None
+        return True, current.image_url
+
+    async def set_image(
+        self,
+        schedule_id: UUID,
+        user_id: UUID,
+        image_url: str,
+        image_renditions: Optional[Dict[str, str]],
+        image_placeholder: Optional[str],
+    ) -> Dict[str, Any]:
+        """일정 이미지 교체 (lock_image로 행을 잠근 같은 트랜잭션에서 호출)"""
         result = await self.db.execute(
-            select(Schedule)
-            .options(selectinload(Schedule.reminders))
-            .where(Schedule.id == schedule_id)
+            update(Schedule)
+            .where(and_(Schedule.id == schedule_id, Schedule.user_id == user_id))
+            .values(
+                image_url=image_url,
+                image_renditions=image_renditions,
+                image_placeholder=image_placeholder,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(*self._projection(SPARSE_FIELDS, include_reminders=True))
+            .execution_options(synchronize_session=False)
         )
-        return result.scalar_one()
+        schedule = dict(result.one()._mapping)
+        await self._changed(user_id, upserted=[schedule_id])
+        return schedule
 
     async def delete(self, schedule_id: UUID) -> bool:
         """일정 삭제"""
@@ -176,5 +829,6 @@ class ScheduleService:
 
         await self.db.delete(schedule)
         await self.db.flush()
+        await self._changed(schedule.user_id, deleted=[schedule_id], delta=-1)
         return True
 
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.principal_cache import get_principal_cache
 
 
 class UserService:
@@ -33,7 +34,7 @@ class UserService:
         user = User(
             email=user_in.email,
             name=user_in.name,
-            hashed_password=get_password_hash(user_in.password),
+            hashed_password=await get_password_hash(user_in.password),
         )
         self.db.add(user)
         await self.db.flush()
@@ -48,13 +49,14 @@ class UserService:
 
         update_data = user_in.model_dump(exclude_unset=True)
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash(update_data.pop("password"))
 
         for field, value in update_data.items():
             setattr(user, field, value)
 
         await self.db.flush()
         await self.db.refresh(user)
+        get_principal_cache().invalidate_on_write(self.db, user.id)
         return user
 
     async def delete(self, user_id: UUID) -> bool:
@@ -65,6 +67,7 @@ class UserService:
 
         await self.db.delete(user)
         await self.db.flush()
+        get_principal_cache().invalidate_on_write(self.db, user.id)
         return True
 
     async def authenticate(self, email: str, password: str) -> Optional[User]:
@@ -72,7 +75,12 @@ class UserService:
         user = await self.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await verify_password(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            # 해시 설정이 바뀌었으면 로그인하면서 새 설정으로 다시 저장
+            user.hashed_password = new_hash
+            await self.db.flush()
         return user
 
@@ -0,0 +1,20 @@
+import asyncio
+from typing import List, TypeVar
+
+T = TypeVar("T")
+
+
+async def next_batch(queue: "asyncio.Queue[T]", max_size: int, window: float) -> List[T]:
+    """큐에서 첫 항목을 기다린 뒤 window초 동안 최대 max_size개까지 모아 반환"""
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + window
+    while len(batch) < max_size:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
@@ -0,0 +1,414 @@
+import calendar
+import re
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.models.schedule import ReminderType, SchedulePriority, ScheduleRepeatType
+
+# 스키마와 같은 길이 제한
+TITLE_MAX_LENGTH = 200
+DESCRIPTION_MAX_LENGTH = 2000
+LOCATION_MAX_LENGTH = 500
+REMINDER_MAX_MINUTES = 10080
+
+_FREQUENCIES = {
+    "DAILY": ScheduleRepeatType.DAILY,
+    "WEEKLY": ScheduleRepeatType.WEEKLY,
+    "MONTHLY": ScheduleRepeatType.MONTHLY,
+    "YEARLY": ScheduleRepeatType.YEARLY,
+}
+
+_WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+_DURATION = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+class Property(NamedTuple):
+    """iCalendar 속성 (이름, 파라미터, 값)"""
+
+    name: str
+    params: Dict[str, str]
+    value: str
+
+
+class ImportedEvent(NamedTuple):
+    """일정으로 변환된 VEVENT"""
+
+    title: str
+    description: Optional[str]
+    start_date: datetime
+    end_date: Optional[datetime]
+    all_day: bool
+    priority: SchedulePriority
+    location: Optional[str]
+    repeat: ScheduleRepeatType
+    repeat_end_date: Optional[datetime]
+    reminders: List[Tuple[ReminderType, int]]
+    # 반복 규칙을 표현할 수 없어 단일 일정으로 가져왔는지 여부
+    simplified: bool
+
+
+def iter_lines(stream: BinaryIO) -> Iterator[str]:
+    """접힌 줄을 펼친 논리 줄 단위로 읽기 (파일 전체를 메모리에 올리지 않는다)"""
+    current: Optional[str] = None
+    for raw in stream:
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def parse_property(line: str) -> Optional[Property]:
+    """NAME;PARAM=VALUE:VALUE 형식의 줄 해석 (형식이 잘못되면 None)"""
+    in_quotes = False
+    for i, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            head, value = line[:i], line[i + 1:]
+            break
+    else:
+        return None
+
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw_param in raw_params:
+        key, _, param_value = raw_param.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return Property(name.upper(), params, value)
+
+
+def iter_events(stream: BinaryIO) -> Iterator[Tuple[Dict[str, Property], List[Dict[str, Property]]]]:
+    """VEVENT 단위로 (속성, VALARM 속성 목록) 반환"""
+    event: Optional[Dict[str, Property]] = None
+    alarms: List[Dict[str, Property]] = []
+    alarm: Optional[Dict[str, Property]] = None
+    for line in iter_lines(stream):
+        prop = parse_property(line)
+        if prop is None:
+            continue
+        if prop.name == "BEGIN" and prop.value.upper() == "VEVENT":
+            event, alarms = {}, []
+        elif prop.name == "END" and prop.value.upper() == "VEVENT":
+            if event is not None:
+                yield event, alarms
+            event = None
+        elif prop.name == "BEGIN" and prop.value.upper() == "VALARM" and event is not None:
+            alarm = {}
+        elif prop.name == "END" and prop.value.upper() == "VALARM":
+            if alarm is not None:
+                alarms.append(alarm)
+            alarm = None
+        elif alarm is not None:
+            alarm.setdefault(prop.name, prop)
+        elif event is not None:
+            event.setdefault(prop.name, prop)
+
+
+def unescape_text(value: str) -> str:
+    """TEXT 값의 이스케이프 해제"""
+    result = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            result.append("\n" if escaped in ("n", "N") else escaped)
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def parse_datetime(prop: Property) -> Tuple[datetime, bool]:
+    """DATE / DATE-TIME 값을 naive UTC로 변환 (반환값: (시각, 날짜만 있는지 여부))
+
+    TZID가 있으면 해당 시간대 기준으로, Z로 끝나면 UTC로 해석하고, 둘 다 없으면
+    (floating time) 값을 그대로 사용한다. 값이 잘못되면 ValueError를 발생시킨다.
+    """
+    value = prop.value.strip()
+    if prop.params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value[:8], "%Y%m%d"), True
+
+    if value.endswith("Z"):
+        parsed = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S")
+        return parsed, False
+
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    tzid = prop.params.get("TZID")
+    if tzid:
+        try:
+            zone = ZoneInfo(tzid)
+        except (ZoneInfoNotFoundError, ValueError):
+            return parsed, False
+        return parsed.replace(tzinfo=zone).astimezone(timezone.utc).replace(tzinfo=None), False
+    return parsed, False
+
+
+def parse_duration(value: str) -> timedelta:
+    """DURATION 값 해석 (형식이 잘못되면 ValueError)"""
+    match = _DURATION.match(value.strip())
+    if not match:
+        raise ValueError(f"invalid duration: {value}")
+    parts = {key: int(number or 0) for key, number in match.groupdict().items() if key != "sign"}
+    duration = timedelta(**parts)
+    return -duration if match.group("sign") == "-" else duration
+
+
+def _priority(value: Optional[Property]) -> SchedulePriority:
+    """PRIORITY (1~9, 0은 미지정) 변환"""
+    try:
+        level = int(value.value) if value else 0
+    except ValueError:
+        return SchedulePriority.DEFAULT
+    if 1 <= level <= 4:
+        return SchedulePriority.HIGH
+    if level == 5:
+        return SchedulePriority.MEDIUM
+    if 6 <= level <= 9:
+        return SchedulePriority.LOW
+    return SchedulePriority.DEFAULT
+
+
+def _nth_start(start_date: datetime, repeat: ScheduleRepeatType, count: int) -> datetime:
+    """count번째 발생의 시작 시각 (월 단위 반복은 해당 날짜가 없는 달을 건너뛴다)"""
+    if repeat == ScheduleRepeatType.DAILY:
+        return start_date + timedelta(days=count - 1)
+    if repeat == ScheduleRepeatType.WEEKLY:
+        return start_date + timedelta(weeks=count - 1)
+
+    months = 1 if repeat == ScheduleRepeatType.MONTHLY else 12
+    occurrence, seen, k = start_date, 0, 0
+    while seen < count:
+        year, month0 = divmod(start_date.year * 12 + start_date.month - 1 + k * months, 12)
+        if start_date.day <= calendar.monthrange(year, month0 + 1)[1]:
+            occurrence = start_date.replace(year=year, month=month0 + 1)
+            seen += 1
+        k += 1
+    return occurrence
+
+
+def _repeat(
+    rule: Optional[Property], start_date: datetime
+) -> Tuple[ScheduleRepeatType, Optional[datetime], bool]:
+    """RRULE 변환 (반환값: (반복 타입, 반복 종료일, 단순화 여부))
+
+    간격이 1이고 BY* 규칙이 시작 시각과 같은 경우만 표현할 수 있다.
+    그 밖의 규칙은 단일 일정으로 가져온다.
+    """
+    if rule is None:
+        return ScheduleRepeatType.NONE, None, False
+
+    parts = dict(part.partition("=")[::2] for part in rule.value.upper().split(";") if part)
+    repeat = _FREQUENCIES.get(parts.pop("FREQ", ""))
+    if repeat is None or parts.pop("INTERVAL", "1") != "1":
+        return ScheduleRepeatType.NONE, None, True
+
+    # 반복 타입별로 시작 시각과 같아서 생략해도 되는 BY* 규칙
+    implied = {"BYDAY": _WEEKDAYS[start_date.weekday()]} if repeat == ScheduleRepeatType.WEEKLY else {}
+    if repeat in (ScheduleRepeatType.MONTHLY, ScheduleRepeatType.YEARLY):
+        implied["BYMONTHDAY"] = str(start_date.day)
+    if repeat == ScheduleRepeatType.YEARLY:
+        implied["BYMONTH"] = str(start_date.month)
+    parts.pop("WKST", None)
+    for key in [key for key in parts if key.startswith("BY")]:
+        if parts.pop(key) != implied.get(key):
+            return ScheduleRepeatType.NONE, None, True
+
+    repeat_end_date = None
+    if "UNTIL" in parts:
+        try:
+            repeat_end_date, _ = parse_datetime(Property("UNTIL", {}, parts["UNTIL"]))
+        except ValueError:
+            return ScheduleRepeatType.NONE, None, True
+    elif "COUNT" in parts:
+        try:
+            count = int(parts["COUNT"])
+        except ValueError:
+            return ScheduleRepeatType.NONE, None, True
+        if count < 1:
+            return ScheduleRepeatType.NONE, None, True
+        repeat_end_date = _nth_start(start_date, repeat, count)
+    return repeat, repeat_end_date, False
+
+
+def _reminder(alarm: Dict[str, Property], start_date: datetime) -> Optional[Tuple[ReminderType, int]]:
+    """VALARM 변환 (일정 시작 전 알림만 표현할 수 있다)"""
+    trigger = alarm.get("TRIGGER")
+    if trigger is None:
+        return None
+    try:
+        if trigger.params.get("VALUE") == "DATE-TIME":
+            fire_at, _ = parse_datetime(trigger)
+            offset = fire_at - start_date
+        else:
+            offset = parse_duration(trigger.value)
+    except ValueError:
+        return None
+
+    minutes_before = int(-offset.total_seconds() // 60)
+    if offset > timedelta(0) or minutes_before > REMINDER_MAX_MINUTES:
+        return None
+
+    action = alarm.get("ACTION")
+    reminder_type = ReminderType.EMAIL if action and action.value.upper() == "EMAIL" else ReminderType.NOTIFICATION
+    return reminder_type, minutes_before
+
+
+def to_event(
+    props: Dict[str, Property], alarms: List[Dict[str, Property]]
+) -> Optional[ImportedEvent]:
+    """VEVENT를 일정으로 변환 (시작 시각이 없거나 표현할 수 없는 이벤트는 None)
+
+    반복 일정의 개별 수정본(RECURRENCE-ID)과 취소된 이벤트는 가져오지 않는다.
+    """
+    if "DTSTART" not in props or "RECURRENCE-ID" in props:
+        return None
+    if props.get("STATUS") and props["STATUS"].value.upper() == "CANCELLED":
+        return None
+
+    try:
+        start_date, all_day = parse_datetime(props["DTSTART"])
+        end_date: Optional[datetime] = None
+        if "DTEND" in props:
+            end_date, _ = parse_datetime(props["DTEND"])
+        elif "DURATION" in props:
+            end_date = start_date + parse_duration(props["DURATION"].value)
+    except ValueError:
+        return None
+
+    if all_day and end_date is not None:
+        # 종일 일정의 DTEND는 다음 날 0시(미포함)이므로 마지막 날로 바꾼다
+        end_date = end_date - timedelta(days=1)
+        if end_date <= start_date:
+            end_date = None
+
+    title = unescape_text(props["SUMMARY"].value).strip() if "SUMMARY" in props else ""
+    description = unescape_text(props["DESCRIPTION"].value) if "DESCRIPTION" in props else None
+    location = unescape_text(props["LOCATION"].value) if "LOCATION" in props else None
+    repeat, repeat_end_date, simplified = _repeat(props.get("RRULE"), start_date)
+
+    reminders = []
+    for alarm in alarms:
+        reminder = _reminder(alarm, start_date)
+        if reminder is not None:
+            reminders.append(reminder)
+
+    return ImportedEvent(
+        title=(title or "(제목 없음)")[:TITLE_MAX_LENGTH],
+        description=description[:DESCRIPTION_MAX_LENGTH] if description else None,
+        start_date=start_date,
+        end_date=end_date,
+        all_day=all_day,
+        priority=_priority(props.get("PRIORITY")),
+        location=location[:LOCATION_MAX_LENGTH] if location else None,
+        repeat=repeat,
+        repeat_end_date=repeat_end_date,
+        reminders=reminders,
+        simplified=simplified,
+    )
+
+
+# 내보내기 -------------------------------------------------------------------
+
+CALENDAR_HEADER = "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//EZ Calendar//KO\r\nCALSCALE:GREGORIAN\r\n"
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+_PRIORITY_LEVELS = {
+    SchedulePriority.HIGH: 1,
+    SchedulePriority.MEDIUM: 5,
+    SchedulePriority.LOW: 9,
+}
+
+
+def escape_text(value: str) -> str:
+    """TEXT 값 이스케이프"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """75옥텟 단위로 줄 접기 (UTF-8 문자 중간에서 자르지 않는다)"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts, current, size, limit = [], [], 0, 75
+    for char in line:
+        width = len(char.encode())
+        if size + width > limit:
+            parts.append("".join(current))
+            # 이어지는 줄은 공백 1자로 시작하므로 74옥텟까지
+            current, size, limit = [], 0, 74
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_datetime(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def format_event(schedule) -> str:
+    """일정을 VEVENT로 변환 (시각은 UTC, 종일 일정은 날짜 값)
+
+    schedule은 ScheduleResponse와 같은 속성을 가져야 한다.
+    """
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{schedule.id}@ez-calendar",
+        f"DTSTAMP:{_format_datetime(schedule.updated_at)}",
+    ]
+    if schedule.all_day:
+        last_day = (schedule.end_date or schedule.start_date).date()
+        lines.append(f"DTSTART;VALUE=DATE:{schedule.start_date:%Y%m%d}")
+        lines.append(f"DTEND;VALUE=DATE:{last_day + timedelta(days=1):%Y%m%d}")
+    else:
+        lines.append(f"DTSTART:{_format_datetime(schedule.start_date)}")
+        if schedule.end_date:
+            lines.append(f"DTEND:{_format_datetime(schedule.end_date)}")
+
+    lines.append(f"SUMMARY:{escape_text(schedule.title)}")
+    if schedule.description:
+        lines.append(f"DESCRIPTION:{escape_text(schedule.description)}")
+    if schedule.location:
+        lines.append(f"LOCATION:{escape_text(schedule.location)}")
+    if schedule.priority in _PRIORITY_LEVELS:
+        lines.append(f"PRIORITY:{_PRIORITY_LEVELS[schedule.priority]}")
+
+    frequency = next((k for k, v in _FREQUENCIES.items() if v == schedule.repeat), None)
+    if frequency:
+        rule = f"RRULE:FREQ={frequency}"
+        if schedule.repeat_end_date:
+            # 반복 종료일은 해당 날짜의 끝까지 포함한다
+            until = schedule.repeat_end_date.date()
+            rule += f";UNTIL={until:%Y%m%d}" if schedule.all_day else f";UNTIL={until:%Y%m%d}T235959Z"
+        lines.append(rule)
+
+    for reminder in schedule.reminders:
+        action = "EMAIL" if reminder.reminder_type == ReminderType.EMAIL else "DISPLAY"
+        lines += [
+            "BEGIN:VALARM",
+            f"ACTION:{action}",
+            f"TRIGGER:-PT{reminder.minutes_before}M",
+            f"DESCRIPTION:{escape_text(schedule.title)}",
+        ]
+        if action == "EMAIL":
+            lines.append(f"SUMMARY:{escape_text(schedule.title)}")
+        lines.append("END:VALARM")
+
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
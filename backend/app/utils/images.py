@@ -0,0 +1,91 @@
+import base64
+from io import BytesIO
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from PIL import Image, ImageOps
+
+# 이 모듈의 함수는 프로세스 풀에서 실행되므로 자식 프로세스가 가볍게 가져올 수 있도록
+# PIL과 표준 라이브러리만 사용한다
+
+# 렌디션 이름 -> (최대 변 길이, 파일명 접미사)
+RENDITIONS: Dict[str, Tuple[int, str]] = {
+    "detail": (1920, ""),
+    "thumbnail": (320, "_thumb"),
+}
+
+# 미리보기 이미지 최대 변 길이 (data URI로 수백 바이트)
+PLACEHOLDER_SIZE = 16
+
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+PLACEHOLDER_QUALITY = 50
+
+
+class Rendition(NamedTuple):
+    """생성된 이미지 파일 하나"""
+
+    name: str  # detail | thumbnail | detailWebp | thumbnailWebp
+    suffix: str  # 원본 파일명 뒤에 붙일 접미사 ("", "_thumb")
+    ext: str
+    content_type: str
+    data: bytes
+
+
+class ProcessedImage(NamedTuple):
+    """이미지 처리 결과"""
+
+    renditions: List[Rendition]
+    placeholder: Optional[str]  # data:image/jpeg;base64,...
+
+
+def image_stem(name: str) -> str:
+    """렌디션 파일명/키에서 공통 부분 (확장자, 썸네일 접미사 제외)"""
+    stem = name.rsplit(".", 1)[0]
+    for _, suffix in RENDITIONS.values():
+        if suffix and stem.endswith(suffix):
+            return stem[: -len(suffix)]
+    return stem
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = BytesIO()
+    if fmt == "WEBP":
+        image.save(buffer, format=fmt, quality=quality, method=4)
+    else:
+        image.save(buffer, format=fmt, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def process_image(source: Union[bytes, str]) -> ProcessedImage:
+    """상세/썸네일 렌디션(각각 WebP 포함)과 목록용 미리보기(LQIP) 생성
+
+    source는 이미지 내용 또는 파일 경로이며, 이미지가 아니면 PIL 예외를 그대로 올린다.
+    """
+    image = Image.open(BytesIO(source) if isinstance(source, bytes) else source)
+    # JPEG은 디코딩 단계에서 필요한 크기 근처로 줄여 읽는다
+    detail_size = RENDITIONS["detail"][0]
+    image.draft("RGB", (detail_size, detail_size))
+    image = ImageOps.exif_transpose(image)
+
+    has_alpha = image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    fmt, ext, content_type = (
+        ("PNG", "png", "image/png") if has_alpha else ("JPEG", "jpg", "image/jpeg")
+    )
+
+    renditions: List[Rendition] = []
+    # 큰 것부터 만들어 다음 렌디션은 줄인 이미지에서 다시 줄인다
+    for name, (size, suffix) in sorted(RENDITIONS.items(), key=lambda item: -item[1][0]):
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        encoded = _encode(image, fmt, JPEG_QUALITY)
+        renditions.append(Rendition(name, suffix, ext, content_type, encoded))
+        encoded = _encode(image, "WEBP", WEBP_QUALITY)
+        renditions.append(Rendition(f"{name}Webp", suffix, "webp", "image/webp", encoded))
+
+    image.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BILINEAR)
+    placeholder = _encode(image.convert("RGB"), "JPEG", PLACEHOLDER_QUALITY)
+    return ProcessedImage(
+        renditions, f"data:image/jpeg;base64,{base64.b64encode(placeholder).decode()}"
+    )
@@ -0,0 +1,61 @@
+import base64
+from datetime import datetime
+from typing import List, Tuple
+from uuid import UUID
+
+
+def _encode(parts: List[str]) -> str:
+    raw = "|".join(parts).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(token: str, size: int) -> List[str]:
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+    parts = raw.split("|")
+    if len(parts) != size:
+        raise ValueError("cursor size mismatch")
+    return parts
+
+
+def encode_cursor(start_date: datetime, schedule_id: UUID) -> str:
+    """(start_date, id) 키를 불투명한 커서 토큰으로 인코딩"""
+    return _encode([start_date.isoformat(), str(schedule_id)])
+
+
+def decode_cursor(token: str) -> Tuple[datetime, UUID]:
+    """커서 토큰을 (start_date, id) 키로 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        start_date, schedule_id = _decode(token, 2)
+        return datetime.fromisoformat(start_date), UUID(schedule_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("유효하지 않은 커서입니다.") from e
+
+
+def encode_search_cursor(rank: int, start_date: datetime, schedule_id: UUID) -> str:
+    """(rank, start_date, id) 검색 키를 불투명한 커서 토큰으로 인코딩"""
+    return _encode([str(rank), start_date.isoformat(), str(schedule_id)])
+
+
+def decode_search_cursor(token: str) -> Tuple[int, datetime, UUID]:
+    """검색 커서 토큰을 (rank, start_date, id) 키로 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        rank, start_date, schedule_id = _decode(token, 3)
+        return int(rank), datetime.fromisoformat(start_date), UUID(schedule_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("유효하지 않은 커서입니다.") from e
+
+
+def encode_sync_token(seq: int) -> str:
+    """변경 순번을 불투명한 동기화 토큰으로 인코딩"""
+    return _encode(["sync", str(seq)])
+
+
+def decode_sync_token(token: str) -> int:
+    """동기화 토큰을 변경 순번으로 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        kind, seq = _decode(token, 2)
+        if kind != "sync":
+            raise ValueError("not a sync token")
+        return int(seq)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("유효하지 않은 동기화 토큰입니다.") from e
@@ -0,0 +1,162 @@
+import calendar
+from datetime import datetime, time, timedelta, timezone
+from typing import Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+from app.models.schedule import Schedule, ScheduleRepeatType
+
+# 고정 간격 반복 타입의 간격
+_FIXED_STEPS = {
+    ScheduleRepeatType.DAILY: timedelta(days=1),
+    ScheduleRepeatType.WEEKLY: timedelta(weeks=1),
+}
+
+# 달력 기반 반복 타입의 간격 (개월 수)
+_MONTH_STEPS = {
+    ScheduleRepeatType.MONTHLY: 1,
+    ScheduleRepeatType.YEARLY: 12,
+}
+
+
+class Occurrence(NamedTuple):
+    """반복 일정의 개별 발생"""
+
+    schedule_id: UUID
+    start_date: datetime
+    end_date: Optional[datetime]
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """타임존이 있는 datetime을 naive UTC로 변환"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _ceil_div(a: timedelta, b: timedelta) -> int:
+    return -((-a) // b)
+
+
+def _repeat_until(repeat_end_date: Optional[datetime], window_end: datetime) -> datetime:
+    """발생 시작 시각의 상한 (반복 종료일은 해당 날짜의 끝까지 포함)"""
+    if repeat_end_date is None:
+        return window_end
+    return min(window_end, datetime.combine(repeat_end_date.date(), time.max))
+
+
+def _month_index(value: datetime) -> int:
+    return value.year * 12 + value.month - 1
+
+
+def expand(
+    schedule_id: UUID,
+    start_date: datetime,
+    end_date: Optional[datetime],
+    repeat: ScheduleRepeatType,
+    repeat_end_date: Optional[datetime],
+    window_start: datetime,
+    window_end: datetime,
+) -> List[Occurrence]:
+    """하나의 일정을 [window_start, window_end] 구간의 발생 목록으로 전개
+
+    시리즈 시작부터 한 칸씩 진행하지 않고, 구간과 겹치는 발생 번호의 범위를
+    직접 계산한 뒤 그 범위만 생성한다.
+    """
+    duration = (end_date - start_date) if end_date else timedelta(0)
+    until = _repeat_until(repeat_end_date, window_end)
+    # 발생 시작이 이 값 이상이어야 발생 종료가 window_start 이후가 된다
+    lower = window_start - duration
+
+    def occurrence(occ_start: datetime) -> Occurrence:
+        return Occurrence(schedule_id, occ_start, occ_start + duration if end_date else None)
+
+    if repeat == ScheduleRepeatType.NONE or repeat is None:
+        if start_date <= window_end and start_date >= lower:
+            return [occurrence(start_date)]
+        return []
+
+    if until < start_date:
+        return []
+
+    if repeat in _FIXED_STEPS:
+        step = _FIXED_STEPS[repeat]
+        first = max(0, _ceil_div(lower - start_date, step))
+        last = (until - start_date) // step
+        return [occurrence(start_date + step * k) for k in range(first, last + 1)]
+
+    months = _MONTH_STEPS[repeat]
+    base = _month_index(start_date)
+    first = max(0, (_month_index(lower) - base) // months)
+    last = (_month_index(until) - base) // months
+
+    result = []
+    for k in range(first, last + 1):
+        year, month0 = divmod(base + k * months, 12)
+        # 해당 월에 같은 날짜가 없으면 건너뛴다 (RFC 5545와 동일)
+        if start_date.day > calendar.monthrange(year, month0 + 1)[1]:
+            continue
+        occ_start = start_date.replace(year=year, month=month0 + 1)
+        if lower <= occ_start <= until:
+            result.append(occurrence(occ_start))
+    return result
+
+
+def expand_schedules(
+    schedules: Iterable[Schedule],
+    window_start: datetime,
+    window_end: datetime,
+) -> List[Occurrence]:
+    """여러 일정을 구간 내 발생 목록으로 일괄 전개 (시작 시각 순 정렬)"""
+    window_start = to_naive_utc(window_start)
+    window_end = to_naive_utc(window_end)
+
+    occurrences: List[Occurrence] = []
+    for schedule in schedules:
+        occurrences.extend(
+            expand(
+                schedule.id,
+                schedule.start_date,
+                schedule.end_date,
+                schedule.repeat,
+                schedule.repeat_end_date,
+                window_start,
+                window_end,
+            )
+        )
+    occurrences.sort(key=lambda o: o.start_date)
+    return occurrences
+
+
+def next_occurrence(
+    start_date: datetime,
+    repeat: ScheduleRepeatType,
+    repeat_end_date: Optional[datetime],
+    not_before: datetime,
+) -> Optional[datetime]:
+    """not_before 이후(포함) 첫 발생의 시작 시각 (더 이상 발생이 없으면 None)
+
+    expand와 마찬가지로 발생 번호를 직접 계산하므로 시리즈 길이와 무관하게 상수 시간이다.
+    """
+    if repeat == ScheduleRepeatType.NONE or repeat is None:
+        return start_date if start_date >= not_before else None
+
+    until = _repeat_until(repeat_end_date, datetime.max)
+    if repeat in _FIXED_STEPS:
+        step = _FIXED_STEPS[repeat]
+        occ_start = start_date + step * max(0, _ceil_div(not_before - start_date, step))
+        return occ_start if occ_start <= until else None
+
+    months = _MONTH_STEPS[repeat]
+    base = _month_index(start_date)
+    k = max(0, (_month_index(not_before) - base) // months)
+    while True:
+        year, month0 = divmod(base + k * months, 12)
+        if datetime(year, month0 + 1, 1) > until:
+            return None
+        k += 1
+        # 해당 월에 같은 날짜가 없으면 건너뛴다 (윤일 연간 반복도 최대 8년 안에 찾는다)
+        if start_date.day > calendar.monthrange(year, month0 + 1)[1]:
+            continue
+        occ_start = start_date.replace(year=year, month=month0 + 1)
+        if occ_start >= not_before:
+            return occ_start if occ_start <= until else None
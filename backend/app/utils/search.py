@@ -0,0 +1,54 @@
+import html
+import re
+from typing import List, Optional
+
+# 하이라이트 스니펫 앞뒤로 남길 글자 수
+SNIPPET_CONTEXT = 40
+
+
+def split_terms(query: str) -> List[str]:
+    """검색어를 소문자 단어 목록으로 분리 (중복 제거, 순서 유지)"""
+    terms: List[str] = []
+    for term in query.lower().split():
+        if term not in terms:
+            terms.append(term)
+    return terms
+
+
+def search_grams(term: str) -> List[str]:
+    """검색어가 포함되려면 있어야 하는 search_grams 조각 (2글자 이하는 검색어 자체)"""
+    if len(term) <= 2:
+        return [term]
+    return list(dict.fromkeys(term[i:i + 2] for i in range(len(term) - 1)))
+
+
+def highlight(text: Optional[str], terms: List[str], snippet: bool = False) -> Optional[str]:
+    """검색어를 <mark>로 감싼 HTML 조각 생성 (본문은 이스케이프)
+
+    snippet이 True면 첫 일치 위치 주변만 잘라서 반환하고, 일치가 없으면 None을 반환한다.
+    """
+    if not text or not terms:
+        return None
+
+    alternatives = sorted(terms, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(t) for t in alternatives), re.IGNORECASE)
+    first = pattern.search(text)
+    if first is None:
+        return None if snippet else html.escape(text)
+
+    prefix = suffix = ""
+    if snippet:
+        start = max(0, first.start() - SNIPPET_CONTEXT)
+        end = min(len(text), first.end() + SNIPPET_CONTEXT)
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        text = text[start:end]
+
+    parts = []
+    position = 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return prefix + "".join(parts) + suffix
@@ -0,0 +1,54 @@
+"""Add schedules.period generated column with per-user GiST index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 일정이 차지하는 기간 (반복 일정은 반복 종료까지, 종료일이 없으면 상한 없음)
+PERIOD_EXPRESSION = (
+    "tsrange(start_date, CASE "
+    "WHEN repeat = 'none' THEN greatest(start_date, end_date) "
+    "WHEN repeat_end_date IS NULL THEN NULL "
+    "ELSE greatest(start_date, date(repeat_end_date) + 1 + (coalesce(end_date, start_date) - start_date)) "
+    "END, '[]')"
+)
+
+
+def upgrade() -> None:
+    # uuid 컬럼을 GiST 인덱스에 함께 넣기 위해 필요
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column(
+        "schedules",
+        sa.Column(
+            "period",
+            postgresql.TSRANGE(),
+            sa.Computed(PERIOD_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_schedules_user_id_period",
+        "schedules",
+        ["user_id", "period"],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_user_id_period", table_name="schedules")
+    op.drop_column("schedules", "period")
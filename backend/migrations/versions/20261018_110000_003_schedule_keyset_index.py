@@ -0,0 +1,29 @@
+"""Add (user_id, start_date, id) index for keyset pagination
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_schedules_user_id_start_date_id",
+        "schedules",
+        ["user_id", "start_date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_user_id_start_date_id", table_name="schedules")
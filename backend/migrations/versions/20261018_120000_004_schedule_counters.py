@@ -0,0 +1,41 @@
+"""Add schedule_counters table for per-user totals
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schedule_counters",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # 기존 일정 개수로 카운터 초기화
+    op.execute(
+        """
+        INSERT INTO schedule_counters (user_id, total, version)
+        SELECT user_id, count(*), 0 FROM schedules GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("schedule_counters")
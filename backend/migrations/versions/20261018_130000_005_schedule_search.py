@@ -0,0 +1,46 @@
+"""Add schedules.search_text generated column with trigram index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 13:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 부분 문자열(한국어 포함) 검색을 위한 trigram, uuid를 GIN 인덱스에 함께 넣기 위한 btree_gin
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    op.add_column(
+        "schedules",
+        sa.Column(
+            "search_text",
+            sa.Text(),
+            sa.Computed("lower(title || ' ' || coalesce(description, ''))", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_schedules_user_id_search_text",
+        "schedules",
+        ["user_id", "search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_user_id_search_text", table_name="schedules")
+    op.drop_column("schedules", "search_text")
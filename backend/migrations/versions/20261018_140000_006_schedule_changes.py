@@ -0,0 +1,55 @@
+"""Add schedule_changes log for delta sync
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE schedule_change_seq")
+
+    op.create_table(
+        "schedule_changes",
+        sa.Column("schedule_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "seq",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('schedule_change_seq')"),
+            nullable=False,
+        ),
+        sa.Column("deleted", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("changed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("schedule_id"),
+    )
+    op.create_index(
+        "ix_schedule_changes_user_id_seq", "schedule_changes", ["user_id", "seq"], unique=False
+    )
+
+    # 기존 일정을 변경 로그에 채워 since 없이 동기화하면 전체를 받을 수 있게 한다
+    op.execute(
+        """
+        INSERT INTO schedule_changes (schedule_id, user_id, deleted, changed_at)
+        SELECT id, user_id, false, updated_at FROM schedules ORDER BY updated_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_changes_user_id_seq", table_name="schedule_changes")
+    op.drop_table("schedule_changes")
+    op.execute("DROP SEQUENCE IF EXISTS schedule_change_seq")
@@ -0,0 +1,51 @@
+"""Add schedule_import_jobs for ICS import progress
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    import_job_status = postgresql.ENUM(
+        "pending", "running", "completed", "failed", name="importjobstatus", create_type=True
+    )
+
+    op.create_table(
+        "schedule_import_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("filename", sa.String(255), nullable=True),
+        sa.Column("status", import_job_status, nullable=False),
+        sa.Column("total_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("processed_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("imported", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("simplified", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_schedule_import_jobs_user_id"), "schedule_import_jobs", ["user_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_schedule_import_jobs_user_id"), table_name="schedule_import_jobs")
+    op.drop_table("schedule_import_jobs")
+    op.execute("DROP TYPE IF EXISTS importjobstatus")
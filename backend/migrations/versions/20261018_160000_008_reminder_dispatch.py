@@ -0,0 +1,147 @@
+"""Add schedule_reminders.fire_at and reminder_deliveries for reminder dispatch
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 16:00:00
+
+"""
+import calendar
+from datetime import datetime, time, timedelta
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# 이 리비전 시점의 schedules.repeat 값별 반복 간격
+_FIXED_STEPS = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
+_MONTH_STEPS = {"monthly": 1, "yearly": 12}
+
+
+def _next_occurrence(
+    start_date: datetime,
+    repeat: Optional[str],
+    repeat_end_date: Optional[datetime],
+    not_before: datetime,
+) -> Optional[datetime]:
+    """not_before 이후(포함) 첫 발생의 시작 시각 (app.utils.recurrence.next_occurrence 고정본)"""
+    if repeat == "none" or repeat is None:
+        return start_date if start_date >= not_before else None
+
+    until = (
+        datetime.combine(repeat_end_date.date(), time.max) if repeat_end_date else datetime.max
+    )
+    if repeat in _FIXED_STEPS:
+        step = _FIXED_STEPS[repeat]
+        occ_start = start_date + step * max(0, -((start_date - not_before) // step))
+        return occ_start if occ_start <= until else None
+
+    months = _MONTH_STEPS[repeat]
+    base = start_date.year * 12 + start_date.month - 1
+    k = max(0, (not_before.year * 12 + not_before.month - 1 - base) // months)
+    while True:
+        year, month0 = divmod(base + k * months, 12)
+        if datetime(year, month0 + 1, 1) > until:
+            return None
+        k += 1
+        # 해당 월에 같은 날짜가 없으면 건너뛴다
+        if start_date.day > calendar.monthrange(year, month0 + 1)[1]:
+            continue
+        occ_start = start_date.replace(year=year, month=month0 + 1)
+        if occ_start >= not_before:
+            return occ_start if occ_start <= until else None
+
+
+def _backfill_fire_at() -> None:
+    """기존 알림의 다음 발송 시각 계산 (반복 전개가 필요하므로 파이썬에서 배치로 계산)"""
+    conn = op.get_bind()
+    now = datetime.utcnow()
+    select_batch = sa.text(
+        "SELECT r.id, r.minutes_before, s.start_date, s.repeat, s.repeat_end_date "
+        "FROM schedule_reminders r JOIN schedules s ON s.id = r.schedule_id "
+        "WHERE r.id > :after ORDER BY r.id LIMIT :limit"
+    )
+    update_fire_at = sa.text("UPDATE schedule_reminders SET fire_at = :fire_at WHERE id = :id")
+    after = "00000000-0000-0000-0000-000000000000"
+    while True:
+        rows = conn.execute(select_batch, {"after": after, "limit": BACKFILL_BATCH_SIZE}).all()
+        if not rows:
+            break
+        params = []
+        for reminder_id, minutes_before, start_date, repeat, repeat_end_date in rows:
+            lead = timedelta(minutes=minutes_before or 0)
+            occ_start = _next_occurrence(start_date, repeat, repeat_end_date, now + lead)
+            if occ_start is not None:
+                params.append({"id": reminder_id, "fire_at": occ_start - lead})
+        if params:
+            conn.execute(update_fire_at, params)
+        after = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column("schedule_reminders", sa.Column("fire_at", sa.DateTime(), nullable=True))
+    _backfill_fire_at()
+    op.create_index(
+        "ix_schedule_reminders_fire_at",
+        "schedule_reminders",
+        ["fire_at"],
+        unique=False,
+        postgresql_where=sa.text("fire_at IS NOT NULL"),
+    )
+
+    reminder_delivery_status = postgresql.ENUM(
+        "pending", "sent", "failed", name="reminderdeliverystatus", create_type=True
+    )
+    reminder_type = postgresql.ENUM(
+        "notification", "email", name="remindertype", create_type=False
+    )
+
+    op.create_table(
+        "reminder_deliveries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("reminder_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("schedule_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("reminder_type", reminder_type, nullable=False),
+        sa.Column("occurrence_start", sa.DateTime(), nullable=False),
+        sa.Column("status", reminder_delivery_status, nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "reminder_id",
+            "occurrence_start",
+            name="uq_reminder_deliveries_reminder_id_occurrence_start",
+        ),
+    )
+    op.create_index(
+        op.f("ix_reminder_deliveries_user_id"), "reminder_deliveries", ["user_id"], unique=False
+    )
+    op.create_index(
+        "ix_reminder_deliveries_pending_claimed_at",
+        "reminder_deliveries",
+        ["claimed_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminder_deliveries_pending_claimed_at", table_name="reminder_deliveries")
+    op.drop_index(op.f("ix_reminder_deliveries_user_id"), table_name="reminder_deliveries")
+    op.drop_table("reminder_deliveries")
+    op.execute("DROP TYPE IF EXISTS reminderdeliverystatus")
+    op.drop_index("ix_schedule_reminders_fire_at", table_name="schedule_reminders")
+    op.drop_column("schedule_reminders", "fire_at")
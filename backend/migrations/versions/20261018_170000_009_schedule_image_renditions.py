@@ -0,0 +1,32 @@
+"""Add schedules.image_renditions and image_placeholder
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 17:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 이미지는 렌디션이 없으므로 NULL로 둔다 (클라이언트는 imageUrl을 그대로 사용)
+    op.add_column(
+        "schedules",
+        sa.Column("image_renditions", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column("schedules", sa.Column("image_placeholder", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("schedules", "image_placeholder")
+    op.drop_column("schedules", "image_renditions")
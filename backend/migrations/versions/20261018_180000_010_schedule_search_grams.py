@@ -0,0 +1,71 @@
+"""Add schedules.search_grams generated column with GIN index for short search terms
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 18:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 검색 텍스트의 1글자 조각과 이웃한 2글자 조각 배열 (공백이 들어간 조각 제외)
+# SQL_ASCII DB에서는 문자 함수가 바이트 단위로 동작하므로 UTF-8 문자 단위로 나눈다
+SEARCH_GRAMS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION schedule_search_grams(value text) RETURNS text[]
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT coalesce(array_agg(DISTINCT gram), '{}')
+    FROM (
+        SELECT c, c || lead(c) OVER (ORDER BY i) AS pair
+        FROM (
+            SELECT m[1] AS c, i
+            FROM regexp_matches(
+                value,
+                CASE WHEN getdatabaseencoding() = 'SQL_ASCII'
+                    THEN '[^\x80-\xbf][\x80-\xbf]*' ELSE '.' END,
+                'g'
+            ) WITH ORDINALITY AS matches (m, i)
+        ) AS chars
+    ) AS pairs,
+    LATERAL (VALUES (c), (pair)) AS grams (gram)
+    WHERE gram !~ '\s'
+$$
+"""
+SEARCH_GRAMS_EXPRESSION = "schedule_search_grams(lower(title || ' ' || coalesce(description, '')))"
+
+
+def upgrade() -> None:
+    # trigram은 3글자 미만 검색어(대부분의 한국어 단어)나 LC_CTYPE=C인 DB의 한국어에서
+    # 조각을 만들지 못해 전체를 읽게 되므로, 1~2글자 조각 배열로 인덱스를 추가한다
+    op.execute(SEARCH_GRAMS_FUNCTION)
+    op.add_column(
+        "schedules",
+        sa.Column(
+            "search_grams",
+            postgresql.ARRAY(sa.Text()),
+            sa.Computed(SEARCH_GRAMS_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    # btree_gin(마이그레이션 005)으로 user_id를 같은 GIN 인덱스에 넣는다
+    op.create_index(
+        "ix_schedules_user_id_search_grams",
+        "schedules",
+        ["user_id", "search_grams"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedules_user_id_search_grams", table_name="schedules")
+    op.drop_column("schedules", "search_grams")
+    op.execute("DROP FUNCTION IF EXISTS schedule_search_grams(text)")
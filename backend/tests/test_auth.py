@@ -1,7 +1,18 @@
+import asyncio
+
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
+from passlib.hash import bcrypt
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.security import PasswordHasher
+from app.models.user import User
+from app.services.principal_cache import get_principal_cache
+from app.services.user_service import UserService
+from tests.test_schedules import get_auth_header
 
 
 @pytest.mark.asyncio
@@ -84,3 +95,69 @@ async def test_login_wrong_password(client: AsyncClient):
     response = await client.post(f"{settings.API_V1_PREFIX}/auth/login", json=login_data)
     assert response.status_code == 401
 
+
+
+@pytest.mark.asyncio
+async def test_principal_cache(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    """인증 사용자 캐시 적중 및 수정/무효화 메시지 반영 테스트"""
+    headers = await get_auth_header(client, "principal@example.com")
+    response = await client.get(f"{settings.API_V1_PREFIX}/users/me", headers=headers)
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    # 캐시에 올라간 뒤에는 DB에서 사용자를 조회하지 않는다
+    async def fail(self, user_id):
+        raise AssertionError("사용자를 DB에서 조회함")
+
+    monkeypatch.setattr(UserService, "get_by_id", fail)
+    response = await client.get(f"{settings.API_V1_PREFIX}/users/me", headers=headers)
+    assert response.status_code == 200
+    monkeypatch.undo()
+
+    # 수정하면 캐시가 무효화되어 바뀐 이름이 보인다
+    await client.put(f"{settings.API_V1_PREFIX}/users/me", json={"name": "새 이름"}, headers=headers)
+    response = await client.get(f"{settings.API_V1_PREFIX}/users/me", headers=headers)
+    assert response.json()["name"] == "새 이름"
+
+    # 다른 워커에서 비활성화된 경우 무효화 메시지를 받으면 반영된다
+    await db_session.execute(update(User).where(User.id == user_id).values(is_active=False))
+    get_principal_cache().handle(user_id.encode())
+    response = await client.get(f"{settings.API_V1_PREFIX}/users/me", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password(client: AsyncClient, db_session: AsyncSession):
+    """해시 설정이 바뀐 비밀번호를 로그인 시 다시 해싱하는지 테스트"""
+    await get_auth_header(client, "rehash@example.com")
+    old_hash = bcrypt.using(rounds=4).hash("testpassword123")
+    await db_session.execute(
+        update(User).where(User.email == "rehash@example.com").values(hashed_password=old_hash)
+    )
+
+    login_data = {"email": "rehash@example.com", "password": "testpassword123"}
+    response = await client.post(f"{settings.API_V1_PREFIX}/auth/login", json=login_data)
+    assert response.status_code == 200
+
+    new_hash = (
+        await db_session.execute(
+            select(User.hashed_password).where(User.email == "rehash@example.com")
+        )
+    ).scalar_one()
+    assert new_hash != old_hash
+    assert bcrypt.from_string(new_hash).rounds == settings.PASSWORD_BCRYPT_ROUNDS
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_full():
+    """대기 중인 해싱이 한도를 넘으면 503으로 거절하는지 테스트"""
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    try:
+        running = asyncio.create_task(hasher.hash("testpassword123"))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as error:
+            await hasher.hash("testpassword123")
+        assert error.value.status_code == 503
+        assert await running
+    finally:
+        hasher.close()
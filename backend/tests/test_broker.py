@@ -0,0 +1,32 @@
+import pytest
+
+from app.core.broker import OVERFLOW, MemoryBroker, Subscription
+
+
+@pytest.mark.asyncio
+async def test_memory_broker_delivers_to_channel_subscribers():
+    """프로세스 내 브로커 채널별 전달 테스트"""
+    broker = MemoryBroker()
+    subscription = await broker.subscribe("schedules:events:a")
+    other = await broker.subscribe("schedules:events:b")
+
+    await broker.publish("schedules:events:a", b"hello")
+
+    assert await subscription.get(timeout=1) == b"hello"
+    assert await other.get(timeout=0.01) is None
+
+    await broker.unsubscribe(subscription)
+    await broker.publish("schedules:events:a", b"again")
+    assert await subscription.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_subscription_overflow_requests_resync():
+    """느린 구독자 큐가 넘치면 resync 메시지로 대체되는지 테스트"""
+    subscription = Subscription("schedules:events:a", maxsize=2)
+    subscription.deliver(b"1")
+    subscription.deliver(b"2")
+    subscription.deliver(b"3")
+
+    assert await subscription.get(timeout=1) == OVERFLOW
+    assert await subscription.get(timeout=0.01) is None
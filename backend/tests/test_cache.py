@@ -0,0 +1,28 @@
+import pytest
+
+from app.core.cache import MemoryCacheBackend
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """프로세스 내 캐시 크기 제한 테스트"""
+    cache = MemoryCacheBackend(max_bytes=15)
+    await cache.set("a", b"12345", ttl=60)
+    await cache.set("b", b"12345", ttl=60)
+    await cache.get("a")
+    await cache.set("c", b"12345", ttl=60)
+
+    assert await cache.get("a") == b"12345"
+    assert await cache.get("b") is None
+    assert await cache.get("c") == b"12345"
+    assert cache.size <= 15
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_incr_and_add():
+    """프로세스 내 캐시 INCR / SET NX 테스트"""
+    cache = MemoryCacheBackend(max_bytes=1024)
+    assert await cache.add("version", b"10", ttl=60) is True
+    assert await cache.add("version", b"20", ttl=60) is False
+    assert await cache.incr("version", ttl=60) == 11
+    assert await cache.get("version") == b"11"
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.concurrency import AdaptiveLimiter, ConcurrencyLimitMiddleware, route_class
+from app.core.config import settings
+
+
+def test_route_class():
+    """요청 그룹 분류 테스트"""
+    prefix = settings.API_V1_PREFIX
+    assert route_class("GET", "/health") is None
+    assert route_class("GET", f"{prefix}/system/time") is None
+    assert route_class("GET", f"{prefix}/schedules/stream") is None
+    assert route_class("GET", f"{prefix}/schedules/range") == "read"
+    assert route_class("PUT", f"{prefix}/schedules/abc") == "write"
+    assert route_class("POST", f"{prefix}/schedules/import") == "heavy"
+    assert route_class("GET", f"{prefix}/schedules/import/abc") == "read"
+    assert route_class("POST", f"{prefix}/schedules/abc/image") == "heavy"
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_then_sheds():
+    """한도를 넘은 요청이 대기 후 실행되거나 거절되는지 테스트"""
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=10, max_queue=1)
+    assert await limiter.acquire(timeout=0)
+
+    waiting = asyncio.create_task(limiter.acquire(timeout=1))
+    await asyncio.sleep(0)
+    # 대기열이 가득 차면 기다리지 않고 거절
+    assert not await limiter.acquire(timeout=1)
+
+    limiter.release(0.01)
+    assert await waiting
+    assert limiter.in_flight == 1
+
+    # 자리가 나지 않으면 timeout 뒤 거절
+    assert not await limiter.acquire(timeout=0.01)
+    assert limiter.queued == 0
+
+
+def test_limiter_adapts_to_latency():
+    """응답 시간이 늘면 한도를 줄이고 안정되면 다시 늘리는지 테스트"""
+    limiter = AdaptiveLimiter(initial_limit=20, min_limit=2, max_limit=100, max_queue=10)
+    # 한도를 다 쓰고 있는 상태로 가정
+    limiter.in_flight = 1000
+    for _ in range(50):
+        limiter.release(0.01)
+    grown = limiter.limit
+    assert grown > 20
+
+    for _ in range(20):
+        limiter.release(0.2)
+    assert limiter.limit < grown / 2
+
+    limiter.release(0.01, failed=True)
+    assert limiter.limit >= limiter.min_limit
+
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_without_starving_health():
+    """과부하 시 503과 Retry-After로 거절하고 헬스체크는 통과하는지 테스트"""
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def app(scope, receive, send):
+        if scope["path"].endswith("/slow"):
+            started.set()
+            await finish.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1, max_queue=0)
+    middleware = ConcurrencyLimitMiddleware(app, limiters={"read": limiter}, queue_timeout=0)
+    prefix = settings.API_V1_PREFIX
+    transport = ASGITransport(app=middleware)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        slow = asyncio.create_task(client.get(f"{prefix}/schedules/slow"))
+        await started.wait()
+
+        response = await client.get(f"{prefix}/schedules/range")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(settings.CONCURRENCY_RETRY_AFTER_SECONDS)
+
+        assert (await client.get("/health")).status_code == 200
+        assert (await client.get(f"{prefix}/system/time")).status_code == 200
+
+        finish.set()
+        assert (await slow).status_code == 200
+    assert limiter.in_flight == 0
@@ -0,0 +1,161 @@
+import asyncio
+import smtplib
+import socket
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.models.schedule import ReminderType
+from app.services import email_service
+from app.services.email_service import EmailQueue, SMTPPool, build_email
+from app.services.reminder_service import PermanentDeliveryError, ReminderMessage
+
+
+def make_message(email: str, title: str, hour: int = 9) -> ReminderMessage:
+    return ReminderMessage(
+        uuid.uuid4(),
+        ReminderType.EMAIL,
+        uuid.uuid4(),
+        email,
+        "테스트 사용자",
+        uuid.uuid4(),
+        title,
+        None,
+        datetime(2024, 5, 1, hour),
+    )
+
+
+def test_build_email_digest():
+    """같은 수신자의 알림을 다이제스트 한 통으로 작성하는지 테스트"""
+    email = build_email(
+        [make_message("a@example.com", "점심"), make_message("a@example.com", "회의", hour=8)]
+    )
+    assert email["To"] == "a@example.com"
+    assert "2개" in email["Subject"]
+    body = email.get_content()
+    assert body.index("회의") < body.index("점심")
+
+
+@pytest.mark.asyncio
+async def test_email_queue_resolves_when_build_fails(monkeypatch):
+    """여러 줄 제목 처리, SMTP 미설정 및 메일 작성 실패 시 send()가 끝나는지 테스트"""
+    email = build_email([make_message("a@example.com", "line1\nline2")])
+    assert email["Subject"] == "[EZ Calendar] line1 line2"
+
+    queue = EmailQueue(
+        None, window=0.01, batch_size=100, digest_size=20, max_attempts=3, retry_base=0
+    )
+    # SMTP가 없으면 보낸 것으로 처리하지 않는다
+    with pytest.raises(PermanentDeliveryError):
+        await asyncio.wait_for(queue.send(make_message("a@example.com", "line1\r\nline2")), 3)
+
+    def broken_build(messages):
+        raise ValueError("broken")
+
+    monkeypatch.setattr(email_service, "build_email", broken_build)
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(queue.send(make_message("a@example.com", "회의")), 3)
+    await queue.close()
+
+
+class FlakyPool:
+    """첫 전송은 연결 끊김으로 실패하는 풀"""
+
+    def __init__(self):
+        self.sent = []
+        self.calls = 0
+
+    async def send(self, email):
+        self.calls += 1
+        if self.calls == 1:
+            raise smtplib.SMTPServerDisconnected("closed")
+        self.sent.append(email)
+
+    async def close(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_email_queue_batches_by_recipient_and_retries():
+    """수신자별 묶음 발송 및 재시도 테스트"""
+    pool = FlakyPool()
+    queue = EmailQueue(
+        pool, window=0.05, batch_size=100, digest_size=20, max_attempts=3, retry_base=0
+    )
+    await asyncio.gather(
+        queue.send(make_message("a@example.com", "회의")),
+        queue.send(make_message("a@example.com", "점심")),
+        queue.send(make_message("b@example.com", "운동")),
+    )
+    await queue.close()
+
+    assert sorted(email["To"] for email in pool.sent) == ["a@example.com", "b@example.com"]
+    assert pool.calls == 3
+
+
+class RejectingPool:
+    """수신자를 영구 거부(550)하는 풀"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def send(self, email):
+        self.calls += 1
+        raise smtplib.SMTPDataError(550, b"mailbox unavailable")
+
+    async def close(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_email_queue_permanent_error_not_retried():
+    """영구 오류는 재시도하지 않고 PermanentDeliveryError로 실패하는지 테스트"""
+    pool = RejectingPool()
+    queue = EmailQueue(
+        pool, window=0.01, batch_size=100, digest_size=20, max_attempts=3, retry_base=0
+    )
+    with pytest.raises(PermanentDeliveryError):
+        await asyncio.wait_for(queue.send(make_message("a@example.com", "회의")), 3)
+    await queue.close()
+
+    assert pool.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_smtp_pool_delivers_to_local_server():
+    """로컬 SMTP 서버(aiosmtpd)로 풀링된 연결 발송 테스트"""
+    controller_module = pytest.importorskip("aiosmtpd.controller")
+
+    class Handler:
+        def __init__(self):
+            self.envelopes = []
+
+        async def handle_DATA(self, server, session, envelope):
+            self.envelopes.append(envelope)
+            return "250 OK"
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = Handler()
+    controller = controller_module.Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        pool = SMTPPool("127.0.0.1", port, size=2)
+        queue = EmailQueue(
+            pool, window=0.05, batch_size=100, digest_size=20, max_attempts=3, retry_base=0
+        )
+        await asyncio.gather(
+            *(queue.send(make_message(f"user{i % 3}@example.com", f"일정 {i}")) for i in range(9))
+        )
+        await queue.close()
+    finally:
+        controller.stop()
+
+    assert sorted(envelope.rcpt_tos[0] for envelope in handler.envelopes) == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
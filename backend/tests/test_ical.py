@@ -0,0 +1,67 @@
+from datetime import datetime
+from io import BytesIO
+
+from app.models.schedule import ReminderType, SchedulePriority, ScheduleRepeatType
+from app.utils.ical import fold_line, iter_events, to_event
+
+ICS = b"""BEGIN:VCALENDAR\r
+VERSION:2.0\r
+BEGIN:VEVENT\r
+UID:1\r
+SUMMARY:Weekly sync\\, team\r
+DESCRIPTION:line one\\nline two that is folded\r
+  across lines\r
+DTSTART;TZID=Asia/Seoul:20250303T100000\r
+DTEND;TZID=Asia/Seoul:20250303T110000\r
+RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=3\r
+PRIORITY:1\r
+BEGIN:VALARM\r
+ACTION:EMAIL\r
+TRIGGER:-PT15M\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+SUMMARY:Holiday\r
+DTSTART;VALUE=DATE:20250505\r
+DTEND;VALUE=DATE:20250506\r
+RRULE:FREQ=MONTHLY;INTERVAL=2\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+SUMMARY:No start\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+
+def test_parse_ics_events():
+    """VEVENT / RRULE / VALARM 변환 테스트"""
+    events = [to_event(props, alarms) for props, alarms in iter_events(BytesIO(ICS))]
+    assert len(events) == 3
+
+    weekly = events[0]
+    assert weekly.title == "Weekly sync, team"
+    assert weekly.description == "line one\nline two that is folded across lines"
+    assert weekly.start_date == datetime(2025, 3, 3, 1, 0)
+    assert weekly.end_date == datetime(2025, 3, 3, 2, 0)
+    assert weekly.repeat == ScheduleRepeatType.WEEKLY
+    assert weekly.repeat_end_date == datetime(2025, 3, 17, 1, 0)
+    assert weekly.priority == SchedulePriority.HIGH
+    assert weekly.reminders == [(ReminderType.EMAIL, 15)]
+    assert weekly.simplified is False
+
+    holiday = events[1]
+    assert holiday.all_day is True
+    assert holiday.end_date is None
+    assert holiday.repeat == ScheduleRepeatType.NONE
+    assert holiday.simplified is True
+
+    assert events[2] is None
+
+
+def test_fold_line_keeps_multibyte_characters():
+    """긴 줄 접기 시 UTF-8 문자를 자르지 않는지 테스트"""
+    line = "SUMMARY:" + "가" * 60
+    folded = fold_line(line)
+    parts = folded.rstrip("\r\n").split("\r\n ")
+    assert all(len(part.encode()) <= 75 for part in parts)
+    assert "".join(parts) == line
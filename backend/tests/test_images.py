@@ -0,0 +1,262 @@
+import base64
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from io import BytesIO
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.schedule import ScheduleCreate
+from app.services.file_service import FileService, close_image_pool
+from app.services.image_cleanup import ImageCleanupQueue, ImageGarbageCollector
+from app.services.schedule_service import ScheduleService
+from app.utils.images import process_image
+from tests.conftest import test_async_session_maker as session_maker
+from tests.test_schedules import get_auth_header
+
+
+def write_image(user_dir, name: str, age_seconds: int = 0):
+    path = user_dir / name
+    path.write_bytes(b"image")
+    if age_seconds:
+        old = time.time() - age_seconds
+        os.utime(path, (old, old))
+    return path
+
+
+@pytest.mark.asyncio
+async def test_image_gc_deletes_only_old_orphans(
+    client: AsyncClient, db_session: AsyncSession, tmp_path, monkeypatch
+):
+    """일정이 가리키지 않는 오래된 이미지만 정리하는지 테스트"""
+    monkeypatch.chdir(tmp_path)
+    await get_auth_header(client, "images@example.com")
+    user = (await db_session.execute(select(User))).scalar_one()
+
+    user_dir = tmp_path / "uploads" / str(user.id)
+    user_dir.mkdir(parents=True)
+    day = 24 * 60 * 60
+    kept = write_image(user_dir, "kept.jpg", age_seconds=2 * day)
+    kept_renditions = [
+        write_image(user_dir, name, age_seconds=2 * day) for name in ("kept_thumb.jpg", "kept.webp")
+    ]
+    orphan = write_image(user_dir, "orphan.jpg", age_seconds=2 * day)
+    fresh = write_image(user_dir, "fresh.jpg")
+
+    await ScheduleService(db_session).create(
+        user.id,
+        ScheduleCreate(title="이미지 일정", start_date=datetime.now()),
+        image_url=f"/uploads/{user.id}/kept.jpg",
+    )
+    # 정리 작업은 별도 세션을 쓰므로 커밋해 둔다
+    await db_session.commit()
+
+    collector = ImageGarbageCollector(session_maker=session_maker)
+    assert await collector.run_once() == 1
+    assert kept.exists() and fresh.exists()
+    assert all(path.exists() for path in kept_renditions)
+    assert not orphan.exists()
+
+
+@pytest.mark.asyncio
+async def test_image_cleanup_queue_drains_on_close(tmp_path, monkeypatch):
+    """삭제 큐가 종료 시 남은 요청을 처리하는지 테스트"""
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "user"
+    user_dir.mkdir(parents=True)
+    images = [write_image(user_dir, f"{i}.jpg") for i in range(3)]
+
+    queue = ImageCleanupQueue(FileService(), window=0.05)
+    queue.enqueue([f"/uploads/user/{i}.jpg" for i in range(3)])
+    await queue.close()
+
+    assert not any(image.exists() for image in images)
+
+
+def jpeg_bytes(size) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, (200, 80, 40)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_process_image_renditions():
+    """상세/썸네일 렌디션, WebP 버전, 미리보기 생성 테스트"""
+    processed = process_image(jpeg_bytes((2400, 1200)))
+    renditions = {rendition.name: rendition for rendition in processed.renditions}
+    assert set(renditions) == {"detail", "detailWebp", "thumbnail", "thumbnailWebp"}
+
+    assert Image.open(BytesIO(renditions["detail"].data)).size == (1920, 960)
+    thumbnail = Image.open(BytesIO(renditions["thumbnailWebp"].data))
+    assert thumbnail.format == "WEBP" and thumbnail.size == (320, 160)
+    assert processed.placeholder.startswith("data:image/jpeg;base64,")
+    assert len(processed.placeholder) < 1000
+
+
+@pytest.mark.asyncio
+async def test_upload_image_stores_renditions(client: AsyncClient, tmp_path, monkeypatch):
+    """업로드 시 렌디션 저장 및 일정에 미리보기 저장 테스트"""
+    monkeypatch.chdir(tmp_path)
+    headers = await get_auth_header(client, "renditions@example.com")
+    try:
+        response = await client.post(
+            f"{settings.API_V1_PREFIX}/schedules/upload",
+            data={"title": "사진 일정", "startDate": datetime.now().isoformat()},
+            files={"image": ("photo.jpg", jpeg_bytes((800, 600)), "image/jpeg")},
+            headers=headers,
+        )
+    finally:
+        close_image_pool()
+    assert response.status_code == 201
+    data = response.json()["data"]
+
+    renditions = data["imageRenditions"]
+    assert renditions["detail"] == data["imageUrl"]
+    assert renditions["thumbnail"].endswith("_thumb.jpg")
+    assert renditions["thumbnailWebp"].endswith("_thumb.webp")
+    for url in renditions.values():
+        assert (tmp_path / url.lstrip("/")).exists()
+    assert data["imagePlaceholder"].startswith("data:image/jpeg;base64,")
+
+    # 일정 삭제 시 렌디션도 함께 삭제 대상이 된다
+    keys = FileService().rendition_keys(FileService().key_for_url(data["imageUrl"]))
+    assert {f"/uploads/{key}" for key in keys} == set(renditions.values())
+
+
+@pytest.mark.asyncio
+async def test_upload_rejects_by_content_and_size(client: AsyncClient, tmp_path, monkeypatch):
+    """실제 내용이 이미지가 아니거나 크기 제한을 넘는 업로드 거절 테스트"""
+    monkeypatch.chdir(tmp_path)
+    headers = await get_auth_header(client, "upload-limit@example.com")
+    form = {"title": "사진 일정", "startDate": datetime.now().isoformat()}
+    url = f"{settings.API_V1_PREFIX}/schedules/upload"
+
+    # Content-Type은 이미지지만 내용은 텍스트
+    not_image = b"not an image" * 100
+    response = await client.post(
+        url, data=form, files={"image": ("photo.jpg", not_image, "image/jpeg")}, headers=headers
+    )
+    assert response.status_code == 400
+    assert "형식" in response.json()["detail"]
+
+    # 본문이 한도를 넘으면 파싱하기 전에 거절
+    too_large = b"\xff\xd8\xff" + b"\0" * (settings.MAX_FILE_SIZE + 128 * 1024)
+    response = await client.post(
+        url, data=form, files={"image": ("photo.jpg", too_large, "image/jpeg")}, headers=headers
+    )
+    assert response.status_code == 413
+
+    # Content-Length 없이(chunked) 보내면 받은 크기가 한도를 넘는 순간 중단
+    twice_the_limit = b"\xff\xd8\xff" + b"\0" * (2 * settings.MAX_FILE_SIZE)
+    encoded = httpx.Request(
+        "POST", url, data=form, files={"image": ("photo.jpg", twice_the_limit, "image/jpeg")}
+    )
+    body = encoded.read()
+    chunk_size = 256 * 1024
+    sent = []
+
+    async def chunks():
+        for start in range(0, len(body), chunk_size):
+            sent.append(start)
+            yield body[start:start + chunk_size]
+
+    response = await client.post(
+        url,
+        content=chunks(),
+        headers={**headers, "Content-Type": encoded.headers["Content-Type"]},
+    )
+    assert response.status_code == 413
+    assert len(sent) * chunk_size < len(body) * 0.75
+    assert not list(tmp_path.glob("uploads/*/*"))
+
+
+def s3_file_service(monkeypatch) -> FileService:
+    monkeypatch.setattr(settings, "DEBUG", False)
+    return FileService()
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_presigned_post(monkeypatch):
+    """직접 업로드 presigned POST 조건과 키 범위 테스트 (네트워크 없이 서명만 확인)"""
+    monkeypatch.setattr(settings, "AWS_S3_PUBLIC_ENDPOINT_URL", "http://localhost:9000")
+    service = s3_file_service(monkeypatch)
+    user_id = uuid.uuid4()
+
+    upload = service.create_direct_upload(user_id, "image/png", 1024)
+    assert upload.url.startswith("http://localhost:9000")
+    assert upload.key.startswith(f"schedules/{user_id}/") and upload.key.endswith(".upload")
+    assert upload.fields["key"] == upload.key
+    policy = json.loads(base64.b64decode(upload.fields["policy"]))
+    assert ["content-length-range", 1, settings.MAX_FILE_SIZE] in policy["conditions"]
+    assert {"Content-Type": "image/png"} in policy["conditions"]
+
+    with pytest.raises(HTTPException) as error:
+        service.create_direct_upload(user_id, "text/html")
+    assert error.value.status_code == 400
+
+    # 다른 사용자 경로의 키는 저장소에 접근하기 전에 거절
+    with pytest.raises(HTTPException) as error:
+        await service.finalize_direct_upload(uuid.uuid4(), upload.key)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_attach_image_checks_schedule_first(client: AsyncClient, monkeypatch):
+    """없는 일정이면 직접 업로드한 파일을 처리/삭제하지 않는지 테스트"""
+    headers = await get_auth_header(client, "attach@example.com")
+    finalized = []
+
+    async def finalize_direct_upload(self, user_id, key):
+        finalized.append(key)
+
+    monkeypatch.setattr(FileService, "finalize_direct_upload", finalize_direct_upload)
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules/{uuid.uuid4()}/image",
+        json={"key": "schedules/user/photo.upload"},
+        headers=headers,
+    )
+    assert response.status_code == 404
+    assert finalized == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not settings.AWS_S3_ENDPOINT_URL, reason="AWS_S3_ENDPOINT_URL(MinIO)이 설정된 경우에만 실행"
+)
+async def test_direct_upload_to_minio(monkeypatch):
+    """MinIO에 직접 업로드 후 렌디션 생성 테스트"""
+    service = s3_file_service(monkeypatch)
+    try:
+        service.s3_client.create_bucket(Bucket=service.bucket)
+    except service.s3_client.exceptions.BucketAlreadyOwnedByYou:
+        pass
+    user_id = uuid.uuid4()
+
+    upload = service.create_direct_upload(user_id, "image/jpeg")
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            upload.url,
+            data=upload.fields,
+            files={"file": ("photo.jpg", jpeg_bytes((800, 600)), "image/jpeg")},
+        )
+    assert response.status_code in (200, 204)
+
+    try:
+        uploaded = await service.finalize_direct_upload(user_id, upload.key)
+    finally:
+        close_image_pool()
+    keys = [service.key_for_url(url) for url in uploaded.renditions.values()]
+    for key in keys:
+        service.s3_client.head_object(Bucket=service.bucket, Key=key)
+    with pytest.raises(service.s3_client.exceptions.ClientError):
+        service.s3_client.head_object(Bucket=service.bucket, Key=upload.key)
+    await service.delete_keys(keys)
@@ -0,0 +1,68 @@
+import uuid
+from datetime import datetime
+
+from app.models.schedule import ScheduleRepeatType
+from app.utils.recurrence import expand, next_occurrence
+
+
+def test_expand_weekly_respects_repeat_end_date():
+    """주간 반복 종료일 테스트"""
+    occurrences = expand(
+        uuid.uuid4(),
+        datetime(2024, 1, 1, 9),
+        None,
+        ScheduleRepeatType.WEEKLY,
+        datetime(2024, 1, 22),
+        datetime(2024, 1, 1),
+        datetime(2024, 12, 31),
+    )
+    assert [o.start_date.day for o in occurrences] == [1, 8, 15, 22]
+
+
+def test_expand_monthly_skips_missing_days():
+    """월간 반복 시 없는 날짜 건너뛰기 테스트"""
+    occurrences = expand(
+        uuid.uuid4(),
+        datetime(2024, 1, 31, 9),
+        None,
+        ScheduleRepeatType.MONTHLY,
+        None,
+        datetime(2024, 1, 1),
+        datetime(2024, 6, 30),
+    )
+    assert [o.start_date.month for o in occurrences] == [1, 3, 5]
+
+
+def test_expand_includes_occurrence_spanning_window_start():
+    """구간 시작에 걸친 발생 포함 테스트"""
+    occurrences = expand(
+        uuid.uuid4(),
+        datetime(2020, 2, 27),
+        datetime(2020, 3, 3),
+        ScheduleRepeatType.YEARLY,
+        None,
+        datetime(2024, 3, 1),
+        datetime(2024, 3, 31),
+    )
+    assert len(occurrences) == 1
+    assert occurrences[0].start_date == datetime(2024, 2, 27)
+
+
+def test_next_occurrence():
+    """다음 발생 계산 테스트"""
+    start = datetime(2024, 1, 31, 9)
+    assert next_occurrence(start, ScheduleRepeatType.NONE, None, datetime(2024, 1, 31)) == start
+    assert next_occurrence(start, ScheduleRepeatType.NONE, None, datetime(2024, 2, 1)) is None
+    assert next_occurrence(
+        start, ScheduleRepeatType.DAILY, None, datetime(2024, 3, 5, 10)
+    ) == datetime(2024, 3, 6, 9)
+    # 2월에는 31일이 없으므로 3월로 넘어간다
+    assert next_occurrence(
+        start, ScheduleRepeatType.MONTHLY, None, datetime(2024, 2, 1)
+    ) == datetime(2024, 3, 31, 9)
+    assert next_occurrence(
+        start, ScheduleRepeatType.WEEKLY, datetime(2024, 2, 10), datetime(2024, 2, 8)
+    ) is None
+    assert next_occurrence(
+        datetime(2024, 2, 29, 9), ScheduleRepeatType.YEARLY, None, datetime(2024, 3, 1)
+    ) == datetime(2028, 2, 29, 9)
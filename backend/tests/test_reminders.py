@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.schedule import (
+    ReminderDelivery,
+    ReminderDeliveryStatus,
+    ReminderType,
+    ScheduleReminder,
+)
+from app.services.reminder_service import PermanentDeliveryError, ReminderService
+from app.services.reminder_worker import ReminderWorker
+from tests.conftest import test_async_session_maker as session_maker
+from tests.test_schedules import get_auth_header
+
+
+async def create_daily_schedule(client: AsyncClient, headers: dict, start: datetime) -> str:
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules",
+        json={
+            "title": "매일 회의",
+            "start_date": start.isoformat(),
+            "repeat": "daily",
+            "reminders": [{"reminder_type": "notification", "minutes_before": 10}],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_claim_due_reminders_once(client: AsyncClient, db_session: AsyncSession):
+    """반복 일정 알림 발송 시각 계산 및 중복 발송 방지 테스트"""
+    headers = await get_auth_header(client, "reminder@example.com")
+    start = datetime.utcnow().replace(microsecond=0) - timedelta(days=3, hours=1)
+    await create_daily_schedule(client, headers, start)
+
+    reminder = (await db_session.execute(select(ScheduleReminder))).scalar_one()
+    fire_at = (await db_session.execute(select(ScheduleReminder.fire_at))).scalar_one()
+    # 다음 발생(3일 1시간 전 시작 → 내일 같은 시각)의 10분 전
+    assert fire_at == start + timedelta(days=4) - timedelta(minutes=10)
+
+    service = ReminderService(db_session)
+    claimed, messages = await service.claim_due(fire_at, 100)
+    assert claimed == 1
+    assert [m.occurrence_start for m in messages] == [start + timedelta(days=4)]
+    assert messages[0].title == "매일 회의"
+
+    # 다음 발생으로 이동
+    next_fire_at = (await db_session.execute(select(ScheduleReminder.fire_at))).scalar_one()
+    assert next_fire_at == fire_at + timedelta(days=1)
+
+    # 같은 발생을 다시 가져가도 발송 기록이 있으므로 반환하지 않는다
+    await db_session.execute(
+        update(ScheduleReminder).where(ScheduleReminder.id == reminder.id).values(fire_at=fire_at)
+    )
+    claimed, messages = await service.claim_due(fire_at, 100)
+    assert claimed == 1
+    assert messages == []
+
+
+@pytest.mark.asyncio
+async def test_reminder_worker_dispatch(client: AsyncClient, db_session: AsyncSession):
+    """워커 발송 및 발송 기록 테스트"""
+    headers = await get_auth_header(client, "worker@example.com")
+    await create_daily_schedule(client, headers, datetime.utcnow() + timedelta(minutes=15))
+    # 워커는 별도 세션을 쓰므로 커밋해 둔다
+    await db_session.commit()
+
+    class FakeSender:
+        def __init__(self):
+            self.messages = []
+
+        async def send(self, message):
+            self.messages.append(message)
+
+    sender = FakeSender()
+    worker = ReminderWorker(
+        session_maker=session_maker,
+        senders={ReminderType.NOTIFICATION: sender, ReminderType.EMAIL: sender},
+    )
+    # 10분 전 알림이므로 약 5분 뒤에 발송 시각이 된다
+    now = datetime.utcnow() + timedelta(minutes=6)
+    assert await worker.dispatch(now) == 1
+    assert await worker.dispatch(now) == 0
+    assert [m.title for m in sender.messages] == ["매일 회의"]
+
+    delivery = (await db_session.execute(select(ReminderDelivery))).scalar_one()
+    assert delivery.status == ReminderDeliveryStatus.SENT
+    assert delivery.delivered_at is not None
+
+
+@pytest.mark.asyncio
+async def test_reminder_worker_permanent_failure(client: AsyncClient, db_session: AsyncSession):
+    """영구 발송 오류는 재시도 없이 실패로 기록되는지 테스트"""
+    headers = await get_auth_header(client, "worker-failed@example.com")
+    await create_daily_schedule(client, headers, datetime.utcnow() + timedelta(minutes=15))
+    await db_session.commit()
+
+    class RejectingSender:
+        async def send(self, message):
+            raise PermanentDeliveryError("550 mailbox unavailable")
+
+    sender = RejectingSender()
+    worker = ReminderWorker(
+        session_maker=session_maker,
+        senders={ReminderType.NOTIFICATION: sender, ReminderType.EMAIL: sender},
+    )
+    now = datetime.utcnow() + timedelta(minutes=6)
+    assert await worker.dispatch(now) == 1
+
+    delivery = (await db_session.execute(select(ReminderDelivery))).scalar_one()
+    assert delivery.status == ReminderDeliveryStatus.FAILED
+    assert delivery.error == "550 mailbox unavailable"
+    assert await worker.retry(now + timedelta(seconds=settings.REMINDER_RETRY_SECONDS + 1)) == 0
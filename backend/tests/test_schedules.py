@@ -1,8 +1,25 @@
+import asyncio
+import json
+import uuid
+
 import pytest
 from datetime import datetime
+from typing import List
 from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import cache as cache_module
+from app.core.cache import RedisCacheBackend
 from app.core.config import settings
+from app.core.database import get_session_maker
+from app.main import app
+from app.models.schedule import Schedule, ScheduleCounter
+from app.models.user import User
+from app.services.principal_cache import get_principal_cache
+from app.services.schedule_count_service import ScheduleCountService
+from app.services.schedule_service import ScheduleService
+from tests.conftest import test_async_session_maker as session_maker
 
 
 async def get_auth_header(client: AsyncClient, email: str = "schedule@example.com") -> dict:
@@ -127,6 +144,57 @@ async def test_update_schedule(client: AsyncClient):
     assert data["priority"] == update_data["priority"]
 
 
+@pytest.mark.asyncio
+async def test_update_schedule_reminders(client: AsyncClient):
+    """일정 알림 수정 시 바뀐 알림만 교체되는지 테스트"""
+    headers = await get_auth_header(client, "update-reminders@example.com")
+
+    schedule_data = {
+        "title": "알림 일정",
+        "start_date": datetime.now().isoformat(),
+        "reminders": [
+            {"reminder_type": "notification", "minutes_before": 10},
+            {"reminder_type": "email", "minutes_before": 30},
+        ],
+    }
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    schedule_id = create_response.json()["data"]["id"]
+    kept_id = create_response.json()["data"]["reminders"][0]["id"]
+
+    update_data = {
+        "reminders": [
+            {"reminder_type": "notification", "minutes_before": 10},
+            {"reminder_type": "notification", "minutes_before": 5},
+        ]
+    }
+    response = await client.put(
+        f"{settings.API_V1_PREFIX}/schedules/{schedule_id}", json=update_data, headers=headers
+    )
+    assert response.status_code == 200
+    reminders = response.json()["data"]["reminders"]
+    assert [(r["type"], r["minutesBefore"]) for r in reminders] == [
+        ("notification", 10),
+        ("notification", 5),
+    ]
+    assert reminders[0]["id"] == kept_id
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/{schedule_id}", headers=headers
+    )
+    assert response.json()["data"]["reminders"] == reminders
+
+    # 다른 사용자의 일정은 수정할 수 없다
+    other_headers = await get_auth_header(client, "update-other@example.com")
+    response = await client.put(
+        f"{settings.API_V1_PREFIX}/schedules/{schedule_id}",
+        json={"title": "남의 일정"},
+        headers=other_headers,
+    )
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_delete_schedule(client: AsyncClient):
     """일정 삭제 테스트"""
@@ -159,3 +227,745 @@ async def test_delete_schedule(client: AsyncClient):
     )
     assert get_response.status_code == 404
 
+
+
+@pytest.mark.asyncio
+async def test_get_schedules_by_range_expands_repeat(client: AsyncClient):
+    """반복 일정 범위 조회 테스트"""
+    headers = await get_auth_header(client, "repeat@example.com")
+
+    # 작년에 시작한 매일 반복 일정
+    schedule_data = {
+        "title": "매일 반복 일정",
+        "start_date": "2023-01-01T09:00:00",
+        "end_date": "2023-01-01T10:00:00",
+        "all_day": False,
+        "priority": "default",
+        "repeat": "daily",
+        "reminders": [],
+    }
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    schedule_id = create_response.json()["data"]["id"]
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/range",
+        params={"startDate": "2024-03-01T00:00:00", "endDate": "2024-03-31T23:59:59"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [s["id"] for s in body["data"]] == [schedule_id]
+    assert len(body["occurrences"]) == 31
+    first = body["occurrences"][0]
+    assert first["scheduleId"] == schedule_id
+    assert first["startDate"] == "2024-03-01T09:00:00"
+    assert first["endDate"] == "2024-03-01T10:00:00"
+
+
+@pytest.mark.asyncio
+async def test_get_schedules_by_range_includes_overlapping(client: AsyncClient):
+    """구간 이전에 시작한 여러 날 일정 범위 조회 테스트"""
+    headers = await get_auth_header(client, "overlap@example.com")
+
+    schedule_data = {
+        "title": "여러 날 일정",
+        "start_date": "2024-02-27T09:00:00",
+        "end_date": "2024-03-02T18:00:00",
+        "all_day": False,
+        "priority": "default",
+        "repeat": "none",
+        "reminders": [],
+    }
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    schedule_id = create_response.json()["data"]["id"]
+
+    params = {"startDate": "2024-03-01T00:00:00", "endDate": "2024-03-31T23:59:59"}
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/range", params=params, headers=headers
+    )
+    assert [s["id"] for s in response.json()["data"]] == [schedule_id]
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules", params=params, headers=headers
+    )
+    assert [s["id"] for s in response.json()["items"]] == [schedule_id]
+
+
+@pytest.mark.asyncio
+async def test_get_schedules_with_cursor(client: AsyncClient):
+    """커서 페이지네이션 테스트"""
+    headers = await get_auth_header(client, "cursor@example.com")
+
+    for day in range(1, 6):
+        schedule_data = {
+            "title": f"커서 일정 {day}",
+            "start_date": f"2024-03-0{day}T09:00:00",
+            "all_day": False,
+            "priority": "default",
+            "repeat": "none",
+            "reminders": [],
+        }
+        await client.post(f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers)
+
+    titles = []
+    params = {"page_size": 2, "includeTotal": "false"}
+    while True:
+        response = await client.get(
+            f"{settings.API_V1_PREFIX}/schedules", params=params, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        titles += [s["title"] for s in data["items"]]
+        if not data["nextCursor"]:
+            break
+        params["cursor"] = data["nextCursor"]
+
+    assert titles == [f"커서 일정 {day}" for day in range(1, 6)]
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules", params={"cursor": "invalid"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_schedules_total_tracks_writes(client: AsyncClient):
+    """일정 개수 카운터 및 필터 개수 캐시 무효화 테스트"""
+    headers = await get_auth_header(client, "totals@example.com")
+
+    schedule_ids = []
+    for priority in ("high", "high", "low"):
+        schedule_data = {
+            "title": f"{priority} 일정",
+            "start_date": datetime.now().isoformat(),
+            "all_day": False,
+            "priority": priority,
+            "repeat": "none",
+            "reminders": [],
+        }
+        response = await client.post(
+            f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+        )
+        schedule_ids.append(response.json()["data"]["id"])
+
+    url = f"{settings.API_V1_PREFIX}/schedules"
+    data = (await client.get(url, headers=headers)).json()
+    assert data["total"] == 3
+    assert data["totalExact"] is True
+
+    params = {"priority": "high", "estimate": "true"}
+    data = (await client.get(url, params=params, headers=headers)).json()
+    assert data["total"] == 2
+    assert data["totalExact"] is True
+
+    await client.delete(f"{url}/{schedule_ids[0]}", headers=headers)
+
+    assert (await client.get(url, headers=headers)).json()["total"] == 2
+    assert (await client.get(url, params=params, headers=headers)).json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_first_schedule_counters_concurrent(client: AsyncClient, db_session: AsyncSession):
+    """카운터가 없을 때 동시에 일어난 첫 쓰기가 모두 반영되는지 테스트"""
+    await get_auth_header(client, "counter-race@example.com")
+    user = (await db_session.execute(select(User))).scalar_one()
+    # 다른 세션에서 사용자를 볼 수 있도록 커밋해 둔다
+    await db_session.commit()
+
+    async def create(session: AsyncSession) -> None:
+        session.add(Schedule(user_id=user.id, title="동시 생성", start_date=datetime.now()))
+        await session.flush()
+        await ScheduleCountService(session).changed(user.id, 1)
+
+    async with session_maker() as first, session_maker() as second:
+        await create(first)
+        # 두 번째 트랜잭션은 첫 번째가 만든 카운터 행 때문에 커밋까지 기다린다
+        waiting = asyncio.create_task(create(second))
+        await asyncio.sleep(0.2)
+        await first.commit()
+        await waiting
+        await second.commit()
+
+    counter = (await db_session.execute(select(ScheduleCounter))).scalar_one()
+    assert (counter.total, counter.version) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_search_schedules(client: AsyncClient):
+    """일정 검색 테스트"""
+    headers = await get_auth_header(client, "search@example.com")
+
+    for title, description in (
+        ("주간 회의", "팀 <회의>실 예약"),
+        ("점심 약속", "회의 끝나고 이동"),
+        ("운동", None),
+    ):
+        schedule_data = {
+            "title": title,
+            "description": description,
+            "start_date": datetime.now().isoformat(),
+            "all_day": False,
+            "priority": "default",
+            "repeat": "none",
+            "reminders": [],
+        }
+        await client.post(f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers)
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/search", params={"q": "회의"}, headers=headers
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["title"] for item in items] == ["주간 회의", "점심 약속"]
+    assert items[0]["highlight"]["title"] == "주간 <mark>회의</mark>"
+    assert items[0]["highlight"]["description"] == "팀 &lt;<mark>회의</mark>&gt;실 예약"
+    assert items[1]["highlight"]["description"] == "<mark>회의</mark> 끝나고 이동"
+
+
+@pytest.mark.asyncio
+async def test_search_short_terms_use_index(client: AsyncClient, db_session: AsyncSession):
+    """짧은 한국어 검색어 결과 및 search_grams 인덱스 사용 테스트"""
+    headers = await get_auth_header(client, "search-grams@example.com")
+    for title in ("회의", "주간회의록 정리", "운동"):
+        await client.post(
+            f"{settings.API_V1_PREFIX}/schedules",
+            json={"title": title, "start_date": datetime.now().isoformat()},
+            headers=headers,
+        )
+
+    for query, expected in (("의", 2), ("회의", 2), ("회의록", 1), ("의 운", 0)):
+        response = await client.get(
+            f"{settings.API_V1_PREFIX}/schedules/search", params={"q": query}, headers=headers
+        )
+        assert len(response.json()["items"]) == expected, query
+
+    # 테스트 DB에는 btree_gin이 없으므로 search_grams만으로 인덱스를 만든다
+    await db_session.execute(
+        text("CREATE INDEX ix_test_search_grams ON schedules USING gin (search_grams)")
+    )
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    stmt = select(Schedule.id).where(ScheduleService._search_filter(["회의"]))
+    compiled = stmt.compile(dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = (await db_session.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    assert any("ix_test_search_grams" in line for line in plan), plan
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_invalidated_on_update(client: AsyncClient):
+    """조회 캐시 무효화 테스트"""
+    headers = await get_auth_header(client, "cache@example.com")
+
+    schedule_data = {
+        "title": "캐시 전 일정",
+        "start_date": "2024-03-10T09:00:00",
+        "all_day": False,
+        "priority": "default",
+        "repeat": "none",
+        "reminders": [],
+    }
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    schedule_id = create_response.json()["data"]["id"]
+
+    detail_url = f"{settings.API_V1_PREFIX}/schedules/{schedule_id}"
+    range_url = f"{settings.API_V1_PREFIX}/schedules/range"
+    params = {"startDate": "2024-03-01T00:00:00", "endDate": "2024-03-31T23:59:59"}
+
+    # 캐시 채우기
+    assert (await client.get(detail_url, headers=headers)).json()["data"]["title"] == "캐시 전 일정"
+    assert (await client.get(range_url, params=params, headers=headers)).json() == (
+        await client.get(range_url, params=params, headers=headers)
+    ).json()
+
+    await client.put(detail_url, json={"title": "캐시 후 일정"}, headers=headers)
+
+    assert (await client.get(detail_url, headers=headers)).json()["data"]["title"] == "캐시 후 일정"
+    data = (await client.get(range_url, params=params, headers=headers)).json()["data"]
+    assert data[0]["title"] == "캐시 후 일정"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_schedule(client: AsyncClient):
+    """ETag 조건부 조회 테스트"""
+    headers = await get_auth_header(client, "etag@example.com")
+
+    schedule_data = {
+        "title": "ETag 일정",
+        "start_date": datetime.now().isoformat(),
+        "all_day": False,
+        "priority": "default",
+        "repeat": "none",
+        "reminders": [],
+    }
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    detail_url = f"{settings.API_V1_PREFIX}/schedules/{create_response.json()['data']['id']}"
+
+    response = await client.get(detail_url, headers=headers)
+    etag = response.headers["etag"]
+
+    response = await client.get(detail_url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    await client.put(detail_url, json={"title": "ETag 수정"}, headers=headers)
+
+    response = await client.get(detail_url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    # "*"는 조회 전에 일치시키지 않으므로 없는 일정은 404
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/{uuid.uuid4()}",
+        headers={**headers, "If-None-Match": "*"},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_schedule_redis_down(client: AsyncClient, monkeypatch):
+    """Redis 장애 시 ETag가 DB 카운터 버전으로 바뀌는지 테스트"""
+    headers = await get_auth_header(client, "etag-down@example.com")
+
+    # 연결할 수 없는 Redis: GET/SET NX/INCR가 모두 실패한다
+    backend = RedisCacheBackend("redis://127.0.0.1:1/0")
+    monkeypatch.setattr(cache_module, "_cache", backend)
+
+    schedule_data = {
+        "title": "Redis 장애 일정",
+        "start_date": datetime.now().isoformat(),
+        "all_day": False,
+        "priority": "default",
+        "repeat": "none",
+        "reminders": [],
+    }
+    create_response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    detail_url = f"{settings.API_V1_PREFIX}/schedules/{create_response.json()['data']['id']}"
+
+    response = await client.get(detail_url, headers=headers)
+    etag = response.headers["etag"]
+
+    response = await client.get(detail_url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.put(detail_url, json={"title": "Redis 장애 수정"}, headers=headers)
+
+    response = await client.get(detail_url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["title"] == "Redis 장애 수정"
+    assert response.headers["etag"] != etag
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_releases_auth_session(client: AsyncClient, db_session: AsyncSession):
+    """SSE 스트림이 열려 있는 동안 인증용 세션/연결을 잡고 있지 않은지 테스트"""
+    headers = await get_auth_header(client, "stream@example.com")
+    await db_session.commit()
+    # 사용자 조회(DB)를 거치도록 캐시를 비운다
+    get_principal_cache().evict()
+
+    opened: List[AsyncSession] = []
+
+    def tracking_session_maker() -> AsyncSession:
+        session = session_maker()
+        opened.append(session)
+        return session
+
+    app.dependency_overrides[get_session_maker] = lambda: tracking_session_maker
+
+    # httpx의 ASGI 전송은 응답 전체를 기다리므로 앱을 직접 호출한다
+    started = asyncio.Event()
+    disconnected = asyncio.Event()
+    statuses = []
+
+    async def receive() -> dict:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+        elif message["type"] == "http.response.body" and message.get("body"):
+            started.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": f"{settings.API_V1_PREFIX}/schedules/stream",
+        "raw_path": f"{settings.API_V1_PREFIX}/schedules/stream".encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"authorization", headers["Authorization"].encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    stream = asyncio.create_task(app(scope, receive, send))
+    try:
+        await asyncio.wait_for(started.wait(), 5)
+        assert statuses == [200]
+        assert opened and not any(session.in_transaction() for session in opened)
+        async with session_maker() as check:
+            idle = await check.execute(
+                text(
+                    "SELECT count(*) FROM pg_stat_activity "
+                    "WHERE datname = current_database() AND state = 'idle in transaction'"
+                )
+            )
+            assert idle.scalar() == 0
+    finally:
+        disconnected.set()
+        await asyncio.wait_for(stream, 5)
+
+
+@pytest.mark.asyncio
+async def test_sync_schedules(client: AsyncClient):
+    """델타 동기화 테스트"""
+    headers = await get_auth_header(client, "sync@example.com")
+    url = f"{settings.API_V1_PREFIX}/schedules"
+
+    schedule_ids = []
+    for title in ("동기화 1", "동기화 2"):
+        schedule_data = {
+            "title": title,
+            "start_date": datetime.now().isoformat(),
+            "all_day": False,
+            "priority": "default",
+            "repeat": "none",
+            "reminders": [],
+        }
+        response = await client.post(url, json=schedule_data, headers=headers)
+        schedule_ids.append(response.json()["data"]["id"])
+
+    data = (await client.get(f"{url}/sync", headers=headers)).json()
+    assert sorted(s["id"] for s in data["upserted"]) == sorted(schedule_ids)
+    assert data["deleted"] == []
+    token = data["nextToken"]
+
+    # 변경 없음
+    data = (await client.get(f"{url}/sync", params={"since": token}, headers=headers)).json()
+    assert data["upserted"] == [] and data["deleted"] == []
+    assert data["nextToken"] == token
+
+    await client.put(f"{url}/{schedule_ids[0]}", json={"title": "동기화 수정"}, headers=headers)
+    await client.delete(f"{url}/{schedule_ids[1]}", headers=headers)
+
+    data = (await client.get(f"{url}/sync", params={"since": token}, headers=headers)).json()
+    assert [s["title"] for s in data["upserted"]] == ["동기화 수정"]
+    assert data["deleted"] == [schedule_ids[1]]
+    assert data["hasMore"] is False
+
+
+@pytest.mark.asyncio
+async def test_schedule_summary(client: AsyncClient):
+    """일별/주별 일정 요약 조회 테스트 (반복 일정 및 여러 날에 걸친 일정 포함)"""
+    headers = await get_auth_header(client, "summary@example.com")
+
+    schedules = [
+        {
+            "title": "출장",
+            "start_date": "2025-03-03T09:00:00",
+            "end_date": "2025-03-05T18:00:00",
+            "priority": "high",
+        },
+        {
+            "title": "주간 회의",
+            "start_date": "2025-03-04T10:00:00",
+            "end_date": "2025-03-04T11:00:00",
+            "priority": "low",
+            "repeat": "weekly",
+        },
+    ]
+    for schedule_data in schedules:
+        await client.post(
+            f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+        )
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/summary",
+        params={"startDate": "2025-03-01T00:00:00", "endDate": "2025-03-15T00:00:00"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["granularity"] == "day"
+    assert data["buckets"] == [
+        {"date": "2025-03-03", "count": 1, "priorityMask": 1},
+        {"date": "2025-03-04", "count": 2, "priorityMask": 5},
+        {"date": "2025-03-05", "count": 1, "priorityMask": 1},
+        {"date": "2025-03-11", "count": 1, "priorityMask": 4},
+    ]
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/summary",
+        params={
+            "startDate": "2025-03-01T00:00:00",
+            "endDate": "2025-03-15T00:00:00",
+            "granularity": "week",
+        },
+        headers=headers,
+    )
+    assert response.json()["buckets"] == [
+        {"date": "2025-03-03", "count": 2, "priorityMask": 5},
+        {"date": "2025-03-10", "count": 1, "priorityMask": 4},
+    ]
+
+    # 타임존 유무가 다른 경계도 UTC로 맞춰 비교한다
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/summary",
+        params={"startDate": "2025-03-01", "endDate": "2025-03-03T12:00:00Z"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert [bucket["date"] for bucket in response.json()["buckets"]] == ["2025-03-03"]
+
+
+@pytest.mark.asyncio
+async def test_get_schedules_sparse_fields(client: AsyncClient):
+    """fields= / include=reminders 부분 조회 테스트"""
+    headers = await get_auth_header(client, "sparse@example.com")
+
+    schedule_data = {
+        "title": "부분 조회 일정",
+        "description": "긴 설명",
+        "start_date": "2025-04-01T09:00:00",
+        "priority": "high",
+        "reminders": [{"reminderType": "email", "minutesBefore": 10}],
+    }
+    await client.post(f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers)
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules",
+        params={"fields": "title,startDate,priority"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert set(item) == {"id", "title", "startDate", "priority"}
+    assert item["priority"] == "high"
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/range",
+        params={
+            "startDate": "2025-04-01T00:00:00",
+            "endDate": "2025-04-02T00:00:00",
+            "fields": "title",
+            "include": "reminders",
+        },
+        headers=headers,
+    )
+    item = response.json()["data"][0]
+    assert set(item) == {"id", "title", "reminders"}
+    assert item["reminders"][0]["type"] == "email"
+    assert item["reminders"][0]["minutesBefore"] == 10
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules",
+        params={"fields": "title,secret"},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_schedule_reads_keep_response_shape(client: AsyncClient):
+    """Core 행 기반 목록/범위 응답이 전체 응답 모델과 같은 형태와 인코딩인지 테스트"""
+    headers = await get_auth_header(client, "shape@example.com")
+
+    schedule_data = {
+        "title": "형태 확인 일정",
+        "description": "설명",
+        "start_date": "2025-05-01T09:00:00.250000",
+        "end_date": "2025-05-01T10:00:00",
+        "color": "#ff0000",
+        "reminders": [{"reminderType": "notification", "minutesBefore": 15}],
+    }
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules", json=schedule_data, headers=headers
+    )
+    created = response.json()["data"]
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/schedules", headers=headers)
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["items"] == [created]
+    assert response.content == json.dumps(
+        response.json(), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/range",
+        params={"startDate": "2025-05-01T00:00:00", "endDate": "2025-05-02T00:00:00"},
+        headers=headers,
+    )
+    assert response.json()["data"] == [created]
+    assert response.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_schedules(client: AsyncClient):
+    """일정 일괄 생성/수정/삭제 테스트"""
+    headers = await get_auth_header(client, "bulk@example.com")
+
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules",
+        json={"title": "기존 일정", "start_date": "2025-06-01T09:00:00", "priority": "low"},
+        headers=headers,
+    )
+    existing_id = response.json()["data"]["id"]
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules",
+        json={"title": "삭제할 일정", "start_date": "2025-06-02T09:00:00"},
+        headers=headers,
+    )
+    delete_id = response.json()["data"]["id"]
+
+    operations = [
+        {
+            "op": "create",
+            "data": {
+                "title": f"일괄 생성 {i}",
+                "startDate": f"2025-06-1{i}T09:00:00",
+                "reminders": [{"reminderType": "email", "minutesBefore": 5}],
+            },
+        }
+        for i in range(3)
+    ]
+    operations += [
+        {
+            "op": "update",
+            "id": existing_id,
+            "data": {"startDate": "2025-06-08T09:00:00", "reminders": []},
+        },
+        {"op": "update", "id": "00000000-0000-0000-0000-000000000000", "data": {"title": "없음"}},
+        {"op": "delete", "id": delete_id},
+    ]
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules/bulk",
+        json={"operations": operations},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [201, 201, 201, 200, 404, 200]
+    assert results[0]["data"]["title"] == "일괄 생성 0"
+    assert results[0]["data"]["reminders"][0]["type"] == "email"
+    assert results[3]["data"]["startDate"] == "2025-06-08T09:00:00"
+    assert results[3]["data"]["priority"] == "low"
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/schedules", headers=headers)
+    data = response.json()
+    assert data["total"] == 4
+    assert delete_id not in {item["id"] for item in data["items"]}
+
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules/bulk",
+        json={"operations": [{"op": "delete", "id": existing_id}] * 2},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_schedules_from_ics(client: AsyncClient, monkeypatch):
+    """ICS 가져오기 테스트 (작은 파일은 요청 안에서 바로 처리, 배치 경계 포함)"""
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    headers = await get_auth_header(client, "import@example.com")
+
+    ics = (
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\nSUMMARY:가져온 일정\r\nDTSTART:20250701T090000Z\r\n"
+        "BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT30M\r\nEND:VALARM\r\nEND:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nSUMMARY:매일\r\nDTSTART:20250701T100000Z\r\n"
+        "RRULE:FREQ=DAILY;UNTIL=20250703T100000Z\r\nEND:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nSUMMARY:시작 없음\r\nEND:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    ).encode()
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/schedules/import",
+        files={"file": ("calendar.ics", ics, "text/calendar")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    job = response.json()["data"]
+    assert job["status"] == "completed"
+    assert job["imported"] == 2
+    assert job["skipped"] == 1
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/import/{job['id']}", headers=headers
+    )
+    assert response.json()["data"]["imported"] == 2
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/range",
+        params={"startDate": "2025-07-01T00:00:00", "endDate": "2025-07-05T00:00:00"},
+        headers=headers,
+    )
+    data = response.json()
+    titles = {item["title"]: item for item in data["data"]}
+    assert titles["가져온 일정"]["reminders"][0]["minutesBefore"] == 30
+    assert titles["매일"]["repeat"] == "daily"
+    assert len(data["occurrences"]) == 4
+
+
+async def create_export_schedules(client: AsyncClient, headers: dict) -> None:
+    """내보내기 테스트용 일정 생성 헬퍼"""
+    for i in range(3):
+        await client.post(
+            f"{settings.API_V1_PREFIX}/schedules",
+            json={
+                "title": f"내보낼 일정, {i}",
+                "start_date": f"2025-08-0{i + 1}T09:00:00",
+                "repeat": "weekly" if i == 0 else "none",
+                "reminders": [{"reminderType": "email", "minutesBefore": 10}],
+            },
+            headers=headers,
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_schedules_ics(client: AsyncClient):
+    """ICS 내보내기 테스트"""
+    headers = await get_auth_header(client, "export-ics@example.com")
+    await create_export_schedules(client, headers)
+
+    response = await client.get(
+        f"{settings.API_V1_PREFIX}/schedules/export",
+        params={"format": "ics"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    body = response.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 3
+    assert "SUMMARY:내보낼 일정\\, 0" in body
+    assert "RRULE:FREQ=WEEKLY" in body
+    assert "TRIGGER:-PT10M" in body
+
+
+@pytest.mark.asyncio
+async def test_export_schedules_ndjson(client: AsyncClient):
+    """NDJSON 내보내기 테스트 (한 줄에 일정 하나)"""
+    headers = await get_auth_header(client, "export-ndjson@example.com")
+    await create_export_schedules(client, headers)
+
+    response = await client.get(f"{settings.API_V1_PREFIX}/schedules/export", headers=headers)
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 3
+    first = json.loads(lines[0])
+    assert first["title"] == "내보낼 일정, 0"
+    assert first["reminders"][0]["minutesBefore"] == 10